@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Trwała pamięć podręczna ID czatów kanałów
+
+ID czatu (i ID kanału potrzebne do websocketu) praktycznie się nie zmienia,
+więc po pierwszym pobraniu pełnego dokumentu kanału zapisujemy je na dysku
+razem z czasem pobrania i używamy aż do upływu TTL.
+
+Autor: deem
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+
+DEFAULT_CACHE_PATH = 'chatroom_cache.json'
+DEFAULT_CACHE_TTL = 7 * 24 * 3600
+
+
+class ChannelCache:
+    """
+    Słownik nazwa kanału -> ID czatu z czasem ważności, zapisywany do pliku JSON
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl: float = DEFAULT_CACHE_TTL):
+        """
+        Inicjalizacja pamięci podręcznej i wczytanie jej z dysku
+
+        Args:
+            path (str): Ścieżka do pliku pamięci podręcznej
+            ttl (float): Czas ważności wpisu w sekundach
+        """
+        self.path = path
+        self.ttl = ttl
+        self._entries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self) -> None:
+        """
+        Wczytuje wpisy z pliku (brak lub uszkodzony plik oznacza pustą pamięć)
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if isinstance(entries, dict):
+            with self._lock:
+                self._entries = entries
+
+    def save(self) -> None:
+        """
+        Zapisuje wpisy do pliku atomowo (przez plik tymczasowy)
+        """
+        with self._lock:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+
+    def get(self, channel_name: str) -> Optional[Dict]:
+        """
+        Zwraca ważny wpis dla kanału
+
+        Args:
+            channel_name (str): Nazwa kanału
+
+        Returns:
+            Optional[Dict]: Wpis z kluczami chatroom_id, channel_id, updated lub None
+        """
+        with self._lock:
+            entry = self._entries.get(channel_name)
+        if entry is None or time.time() - entry.get("updated", 0) > self.ttl:
+            return None
+        return entry
+
+    def put(self, channel_name: str, chatroom_id: int, channel_id: Optional[int] = None) -> None:
+        """
+        Zapamiętuje ID czatu kanału i zapisuje pamięć na dysk
+
+        Args:
+            channel_name (str): Nazwa kanału
+            chatroom_id (int): ID czatu
+            channel_id (Optional[int]): ID kanału
+        """
+        with self._lock:
+            self._entries[channel_name] = {
+                "chatroom_id": chatroom_id,
+                "channel_id": channel_id,
+                "updated": time.time()
+            }
+        self.save()
+
+    def put_many(self, entries: Dict[str, Tuple[int, Optional[int]]]) -> None:
+        """
+        Zapamiętuje ID czatów wielu kanałów i zapisuje pamięć na dysk raz
+
+        Args:
+            entries (Dict[str, Tuple[int, Optional[int]]]): Nazwa kanału -> (ID czatu, ID kanału)
+        """
+        updated = time.time()
+        with self._lock:
+            for channel_name, (chatroom_id, channel_id) in entries.items():
+                self._entries[channel_name] = {
+                    "chatroom_id": chatroom_id,
+                    "channel_id": channel_id,
+                    "updated": updated
+                }
+        self.save()
+
+    def invalidate(self, channel_name: str) -> None:
+        """
+        Usuwa wpis kanału, wymuszając ponowne pobranie pełnych danych
+
+        Args:
+            channel_name (str): Nazwa kanału
+        """
+        with self._lock:
+            removed = self._entries.pop(channel_name, None)
+        if removed is not None:
+            self.save()
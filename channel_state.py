@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Zwarty stan kanałów i gotowe szablony wysyłanych wiadomości
+
+Stan każdego kanału (ID czatu, status live, termin następnego sprawdzenia,
+liczniki) jest trzymany w jednym obiekcie z __slots__ zamiast w kilku
+słownikach - ok. 200 B na kanał (ponad dwa razy mniej niż słownik z tymi
+samymi polami) i jedno wyszukiwanie na sprawdzenie. Tabela pamięta też
+kolejność zmian stanu kanałów, więc pytanie o zmiany od danej chwili
+przegląda tylko zmienione kanały, oraz kilka ostatnich błędów każdego
+kanału (bufor tworzony dopiero przy pierwszym błędzie). Szablon wysyłania
+przygotowuje nagłówki i zakodowaną treść każdej wiadomości raz, przy
+wczytaniu konfiguracji.
+
+Autor: deem
+"""
+
+import json
+import random
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+
+DEFAULT_ERROR_HISTORY = 10
+
+
+class ChannelState:
+    """
+    Stan pojedynczego kanału
+    """
+
+    __slots__ = ("name", "chatroom_id", "channel_id", "live", "next_due", "last_http_check",
+                 "errors", "polls", "sends", "last_error", "last_error_at", "recent_errors", "changed")
+
+    def __init__(self, name: str):
+        """
+        Inicjalizacja stanu (kanał o nieznanym statusie)
+
+        Args:
+            name (str): Nazwa kanału
+        """
+        self.name = name
+        self.chatroom_id: Optional[int] = None
+        self.channel_id: Optional[int] = None
+        self.live: Optional[bool] = None
+        self.next_due: Optional[float] = None
+        self.last_http_check = 0.0
+        self.errors = 0
+        self.polls = 0
+        self.sends = 0
+        self.last_error: Optional[str] = None
+        self.last_error_at: Optional[float] = None
+        self.recent_errors: "Optional[deque[Tuple[float, str]]]" = None
+        self.changed: Optional[float] = None
+
+
+class ChannelTable:
+    """
+    Tabela stanów wszystkich monitorowanych kanałów
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time, error_history: int = DEFAULT_ERROR_HISTORY):
+        """
+        Inicjalizacja pustej tabeli
+
+        Args:
+            clock (Callable[[], float]): Zegar czasu rzeczywistego do znaczników zmian i błędów
+            error_history (int): Ile ostatnich błędów pamiętać dla każdego kanału
+        """
+        self.clock = clock
+        self.error_history = error_history
+        self._states: Dict[str, ChannelState] = {}
+        self._changes: "OrderedDict[str, float]" = OrderedDict()
+        self._last_change = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> ChannelState:
+        """
+        Zwraca stan kanału, tworząc go przy pierwszym użyciu
+
+        Args:
+            name (str): Nazwa kanału
+
+        Returns:
+            ChannelState: Stan kanału
+        """
+        state = self._states.get(name)
+        if state is None:
+            with self._lock:
+                state = self._states.setdefault(name, ChannelState(name))
+        return state
+
+    def peek(self, name: str) -> Optional[ChannelState]:
+        """
+        Zwraca stan kanału bez tworzenia nowego
+
+        Args:
+            name (str): Nazwa kanału
+
+        Returns:
+            Optional[ChannelState]: Stan kanału lub None
+        """
+        return self._states.get(name)
+
+    def remove(self, name: str) -> None:
+        """
+        Usuwa stan kanału (np. usuniętego z konfiguracji)
+
+        Args:
+            name (str): Nazwa kanału
+        """
+        with self._lock:
+            self._states.pop(name, None)
+            self._changes.pop(name, None)
+
+    def touch(self, state: ChannelState) -> None:
+        """
+        Oznacza zmianę stanu kanału (status live, ID czatu, błąd lub powrót po błędzie);
+        stan usuniętego kanału jest pomijany
+
+        Args:
+            state (ChannelState): Zmieniony stan kanału
+        """
+        with self._lock:
+            if self._states.get(state.name) is not state:
+                return
+            self._last_change = max(self.clock(), self._last_change)
+            state.changed = self._last_change
+            self._changes.pop(state.name, None)
+            self._changes[state.name] = self._last_change
+
+    def record_error(self, state: ChannelState, error: str) -> None:
+        """
+        Zapisuje błąd kanału jako ostatni błąd i w buforze ostatnich błędów
+
+        Args:
+            state (ChannelState): Stan kanału
+            error (str): Opis błędu
+        """
+        at = self.clock()
+        with self._lock:
+            if state.recent_errors is None:
+                state.recent_errors = deque(maxlen=self.error_history)
+            state.recent_errors.append((at, error))
+            state.last_error = error
+            state.last_error_at = at
+        self.touch(state)
+
+    def recent_errors(self, state: ChannelState) -> List[Tuple[float, str]]:
+        """
+        Zwraca kopię ostatnich błędów kanału
+
+        Args:
+            state (ChannelState): Stan kanału
+
+        Returns:
+            List[Tuple[float, str]]: (czas uniksowy, opis błędu) od najstarszego
+        """
+        with self._lock:
+            return list(state.recent_errors or ())
+
+    def changed_since(self, since: float) -> Tuple[float, List[ChannelState]]:
+        """
+        Zwraca kanały zmienione w chwili since lub później
+
+        Zmiany są trzymane w kolejności czasu, więc przeglądane są tylko
+        kanały zmienione od since. Kanał zmieniony dokładnie w chwili since
+        może zostać zwrócony ponownie - żadna zmiana nie zostanie pominięta.
+
+        Args:
+            since (float): Czas uniksowy (np. "now" z poprzedniej odpowiedzi)
+
+        Returns:
+            Tuple[float, List[ChannelState]]: (bieżący czas do następnego zapytania,
+            stany zmienionych kanałów od najdawniej zmienionego)
+        """
+        with self._lock:
+            now = max(self.clock(), self._last_change)
+            names = []
+            for name, changed in reversed(self._changes.items()):
+                if changed < since:
+                    break
+                names.append(name)
+            states = [self._states[name] for name in reversed(names)]
+        return now, states
+
+    def live_count(self) -> int:
+        """
+        Zwraca liczbę kanałów, które są teraz live
+        """
+        return sum(1 for state in list(self._states.values()) if state.live)
+
+    def __iter__(self) -> Iterator[ChannelState]:
+        return iter(list(self._states.values()))
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+
+class SendTemplate:
+    """
+    Przygotowane nagłówki i treści zapytań wysyłania wiadomości
+    """
+
+    __slots__ = ("headers", "messages", "_prefixes")
+
+    def __init__(self, authorization: str, messages: List[str]):
+        """
+        Przygotowuje szablon (raz na wczytanie konfiguracji)
+
+        Args:
+            authorization (str): Token autoryzacji ("Bearer ...")
+            messages (List[str]): Wiadomości do losowania
+        """
+        self.headers = {
+            "Authorization": authorization,
+            "Content-Type": "application/json"
+        }
+        self.messages = list(messages)
+        self._prefixes = [
+            b'{"content": ' + json.dumps(message).encode() + b', "type": "message", "message_ref": "'
+            for message in self.messages
+        ]
+
+    def render(self) -> Tuple[str, bytes]:
+        """
+        Losuje wiadomość i zwraca gotową treść zapytania z nowym message_ref
+
+        Returns:
+            Tuple[str, bytes]: (wiadomość, treść JSON zapytania)
+        """
+        index = random.randrange(len(self.messages))
+        message_ref = str(random.randint(1000000000000, 9999999999999))
+        return self.messages[index], self._prefixes[index] + message_ref.encode() + b'"}'
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Obserwacja pliku konfiguracyjnego do przeładowania bez restartu
+
+Na Linuksie używany jest inotify (przez ctypes, bez dodatkowych pakietów) -
+obserwujemy katalog pliku, bo edytory często zapisują przez plik tymczasowy
+i zmianę nazwy. Na innych systemach, lub gdy inotify jest niedostępny,
+co kilka sekund porównywany jest czas modyfikacji pliku.
+
+Autor: deem
+"""
+
+import os
+import select
+import struct
+import threading
+from typing import Callable, Optional
+
+
+DEFAULT_POLL_INTERVAL = 2.0
+DEBOUNCE = 0.2
+
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_NONBLOCK = 0o4000
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _open_inotify(directory: str) -> Optional[int]:
+    """
+    Otwiera deskryptor inotify obserwujący katalog
+
+    Args:
+        directory (str): Katalog do obserwacji
+
+    Returns:
+        Optional[int]: Deskryptor pliku lub None, jeśli inotify jest niedostępny
+    """
+    # ctypes jest importowane dopiero przy włączonym przeładowaniu konfiguracji
+    import ctypes
+    import ctypes.util
+
+    library = ctypes.util.find_library("c")
+    if library is None:
+        return None
+
+    try:
+        libc = ctypes.CDLL(library, use_errno=True)
+        fd = libc.inotify_init1(_IN_NONBLOCK)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+
+    mask = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+    if libc.inotify_add_watch(fd, os.fsencode(directory), mask) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
+class ConfigWatcher:
+    """
+    Wywołuje funkcję zwrotną po każdej zmianie pliku konfiguracyjnego
+    """
+
+    def __init__(self, path: str, on_change: Callable[[], None], poll_interval: float = DEFAULT_POLL_INTERVAL,
+                 on_error: Optional[Callable[[str], None]] = None):
+        """
+        Inicjalizacja obserwatora
+
+        Args:
+            path (str): Ścieżka pliku konfiguracyjnego
+            on_change (Callable[[], None]): Wywoływane po wykryciu zmiany
+            poll_interval (float): Odstęp sprawdzania czasu modyfikacji (tryb zapasowy)
+            on_error (Optional[Callable[[str], None]]): Wywoływane z opisem wyjątku on_change
+        """
+        self.path = os.path.abspath(path)
+        self.on_change = on_change
+        self.on_error = on_error
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._fd = _open_inotify(os.path.dirname(self.path))
+        self._thread = threading.Thread(target=self._run, name="kick-config-watch", daemon=True)
+
+    @property
+    def mode(self) -> str:
+        """
+        Nazwa używanego mechanizmu: "inotify" lub "mtime"
+        """
+        return "inotify" if self._fd is not None else "mtime"
+
+    def start(self) -> None:
+        """
+        Uruchamia obserwację w osobnym wątku
+        """
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Zatrzymuje obserwację
+        """
+        self._stop.set()
+
+    def _mtime(self) -> Optional[float]:
+        try:
+            return os.stat(self.path).st_mtime
+        except OSError:
+            return None
+
+    def _notify(self) -> None:
+        # wyjątek funkcji zwrotnej nie może zakończyć wątku - kolejne zmiany
+        # pliku nadal muszą być przeładowywane
+        try:
+            self.on_change()
+        except Exception as e:
+            if self.on_error is not None:
+                self.on_error(f"BŁĄD przeładowania konfiguracji: {type(e).__name__}: {e}")
+
+    def _run(self) -> None:
+        if self._fd is not None:
+            self._run_inotify()
+        else:
+            self._run_polling()
+
+    def _run_inotify(self) -> None:
+        filename = os.fsencode(os.path.basename(self.path))
+        try:
+            while not self._stop.is_set():
+                ready, _, _ = select.select([self._fd], [], [], self.poll_interval)
+                if not ready:
+                    continue
+
+                changed = False
+                data = os.read(self._fd, 64 * 1024)
+                offset = 0
+                while offset < len(data):
+                    _, _, _, name_length = _EVENT_HEADER.unpack_from(data, offset)
+                    offset += _EVENT_HEADER.size
+                    name = data[offset:offset + name_length].rstrip(b"\0")
+                    offset += name_length
+                    changed = changed or name == filename
+
+                if changed:
+                    self._stop.wait(DEBOUNCE)
+                    self._notify()
+        finally:
+            os.close(self._fd)
+
+    def _run_polling(self) -> None:
+        last_mtime = self._mtime()
+        while not self._stop.wait(self.poll_interval):
+            mtime = self._mtime()
+            if mtime is not None and mtime != last_mtime:
+                last_mtime = mtime
+                self._notify()
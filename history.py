@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Historia działania bota w bazie SQLite
+
+Zapisywane są sprawdzenia kanałów, przejścia live/offline, wysłane
+wiadomości i błędy. Pętle monitorowania tylko dopisują krotkę do kolejki
+w pamięci - osobny wątek co sekundę zapisuje całą partię w jednej
+transakcji (tryb WAL), więc dysk nigdy nie blokuje sprawdzeń. Stare wpisy
+są co godzinę usuwane, a zwolnione miejsce oddawane systemowi.
+
+Raport (czas trwania streamów dziennie i skuteczność wysyłania):
+
+    python history.py --db history.db --days 7
+
+Autor: deem
+"""
+
+import collections
+import datetime
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    # sqlite3 jest importowane dopiero przy włączonej historii lub w raporcie
+    import sqlite3
+
+
+DEFAULT_HISTORY_PATH = 'history.db'
+DEFAULT_RETENTION_DAYS = 30
+DEFAULT_POLL_RETENTION_DAYS = 7
+DEFAULT_FLUSH_INTERVAL = 1.0
+DEFAULT_COMPACT_INTERVAL = 3600
+DEFAULT_QUEUE_SIZE = 100_000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS polls (ts REAL NOT NULL, channel TEXT NOT NULL, live INTEGER, sent INTEGER NOT NULL, wait REAL);
+CREATE TABLE IF NOT EXISTS transitions (ts REAL NOT NULL, channel TEXT NOT NULL, live INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS sends (ts REAL NOT NULL, channel TEXT, chatroom_id TEXT, success INTEGER NOT NULL, status INTEGER, message TEXT);
+CREATE TABLE IF NOT EXISTS errors (ts REAL NOT NULL, channel TEXT, error TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS polls_channel_ts ON polls (channel, ts);
+CREATE INDEX IF NOT EXISTS polls_ts ON polls (ts);
+CREATE INDEX IF NOT EXISTS transitions_channel_ts ON transitions (channel, ts);
+CREATE INDEX IF NOT EXISTS transitions_ts ON transitions (ts);
+CREATE INDEX IF NOT EXISTS sends_channel_ts ON sends (channel, ts);
+CREATE INDEX IF NOT EXISTS sends_ts ON sends (ts);
+CREATE INDEX IF NOT EXISTS errors_channel_ts ON errors (channel, ts);
+CREATE INDEX IF NOT EXISTS errors_ts ON errors (ts);
+"""
+
+INSERTS = {
+    "polls": "INSERT INTO polls (ts, channel, live, sent, wait) VALUES (?, ?, ?, ?, ?)",
+    "transitions": "INSERT INTO transitions (ts, channel, live) VALUES (?, ?, ?)",
+    "sends": "INSERT INTO sends (ts, channel, chatroom_id, success, status, message) VALUES (?, ?, ?, ?, ?, ?)",
+    "errors": "INSERT INTO errors (ts, channel, error) VALUES (?, ?, ?)"
+}
+
+
+def _connect(path: str) -> 'sqlite3.Connection':
+    """
+    Otwiera połączenie z bazą w trybie WAL
+
+    Args:
+        path (str): Ścieżka pliku bazy
+
+    Returns:
+        sqlite3.Connection: Połączenie
+    """
+    import sqlite3
+
+    conn = sqlite3.connect(path, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class HistoryStore:
+    """
+    Historia sprawdzeń, przejść live/offline, wysłanych wiadomości i błędów
+    """
+
+    def __init__(self, path: str = DEFAULT_HISTORY_PATH, retention_days: float = DEFAULT_RETENTION_DAYS,
+                 poll_retention_days: float = DEFAULT_POLL_RETENTION_DAYS,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL, compact_interval: float = DEFAULT_COMPACT_INTERVAL,
+                 queue_size: int = DEFAULT_QUEUE_SIZE, on_error: Optional[Callable[[str], None]] = None):
+        """
+        Inicjalizacja bazy (tworzy tabele) i uruchomienie wątku zapisującego
+
+        Args:
+            path (str): Ścieżka pliku bazy
+            retention_days (float): Po ilu dniach usuwać przejścia, wiadomości i błędy
+            poll_retention_days (float): Po ilu dniach usuwać sprawdzenia (najliczniejsze wpisy)
+            flush_interval (float): Co ile sekund zapisywać zgromadzone wpisy
+            compact_interval (float): Co ile sekund usuwać stare wpisy i zwalniać miejsce
+            queue_size (int): Maksymalna liczba oczekujących wpisów (najstarsze są odrzucane)
+            on_error (Optional[Callable[[str], None]]): Wywoływane z opisem błędu zapisu bazy
+        """
+        self.path = path
+        self.retention_days = retention_days
+        self.poll_retention_days = poll_retention_days
+        self.flush_interval = flush_interval
+        self.compact_interval = compact_interval
+        self.written = 0
+        self.dropped = 0
+        self.on_error = on_error
+        self._queue: "collections.deque[Tuple]" = collections.deque(maxlen=queue_size)
+        self._pending: List[Tuple[str, Tuple]] = []
+        self._stop = threading.Event()
+
+        import sqlite3
+
+        conn = sqlite3.connect(path)
+        try:
+            # auto_vacuum działa tylko, jeśli zostanie ustawione przed utworzeniem tabel
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.executescript(SCHEMA)
+        finally:
+            conn.close()
+
+        self._thread = threading.Thread(target=self._writer_loop, name="kick-history", daemon=True)
+        self._thread.start()
+
+    def _enqueue(self, table: str, row: Tuple) -> None:
+        if len(self._queue) == self._queue.maxlen:
+            self.dropped += 1
+        self._queue.append((table, row))
+
+    def record_poll(self, channel: str, live: Optional[bool], sent: bool, wait: float) -> None:
+        """
+        Zapisuje wynik sprawdzenia kanału
+
+        Args:
+            channel (str): Nazwa kanału
+            live (Optional[bool]): Status kanału (None - nieznany)
+            sent (bool): Czy wysłano wiadomość
+            wait (float): Czas do kolejnego sprawdzenia
+        """
+        self._enqueue("polls", (time.time(), channel, live, sent, wait))
+
+    def record_transition(self, channel: str, live: bool) -> None:
+        """
+        Zapisuje zmianę statusu kanału (także pierwszy znany status)
+
+        Args:
+            channel (str): Nazwa kanału
+            live (bool): Czy stream jest aktywny
+        """
+        self._enqueue("transitions", (time.time(), channel, live))
+
+    def record_send(self, channel: Optional[str], chatroom_id: str, success: bool,
+                    status: Optional[int], message: Optional[str]) -> None:
+        """
+        Zapisuje próbę wysłania wiadomości
+
+        Args:
+            channel (Optional[str]): Nazwa kanału
+            chatroom_id (str): ID czatu
+            success (bool): Czy wiadomość została wysłana
+            status (Optional[int]): Kod odpowiedzi (None przy błędzie połączenia)
+            message (Optional[str]): Treść wiadomości
+        """
+        self._enqueue("sends", (time.time(), channel, str(chatroom_id), success, status, message))
+
+    def record_error(self, channel: Optional[str], error: str) -> None:
+        """
+        Zapisuje błąd sprawdzenia kanału
+
+        Args:
+            channel (Optional[str]): Nazwa kanału
+            error (str): Opis błędu
+        """
+        self._enqueue("errors", (time.time(), channel, error))
+
+    def _write_batch(self, conn: 'sqlite3.Connection') -> None:
+        # partia zostaje w _pending do udanego zapisu - po błędzie bazy
+        # (zablokowana, pełny dysk) jest zapisywana ponownie razem z nowymi wpisami
+        while self._queue:
+            self._pending.append(self._queue.popleft())
+        overflow = len(self._pending) - self._queue.maxlen
+        if overflow > 0:
+            del self._pending[:overflow]
+            self.dropped += overflow
+        if not self._pending:
+            return
+
+        batch: Dict[str, List[Tuple]] = {}
+        for table, row in self._pending:
+            batch.setdefault(table, []).append(row)
+        with conn:
+            for table, rows in batch.items():
+                conn.executemany(INSERTS[table], rows)
+        self.written += len(self._pending)
+        self._pending = []
+
+    def compact(self, conn: 'sqlite3.Connection') -> Dict[str, int]:
+        """
+        Usuwa wpisy starsze niż okres przechowywania i zwalnia miejsce w pliku
+
+        Args:
+            conn (sqlite3.Connection): Połączenie z bazą
+
+        Returns:
+            Dict[str, int]: Tabela -> liczba usuniętych wpisów
+        """
+        now = time.time()
+        cutoffs = {
+            "polls": now - self.poll_retention_days * 86400,
+            "transitions": now - self.retention_days * 86400,
+            "sends": now - self.retention_days * 86400,
+            "errors": now - self.retention_days * 86400
+        }
+
+        deleted = {}
+        with conn:
+            for table, cutoff in cutoffs.items():
+                deleted[table] = conn.execute(f"DELETE FROM {table} WHERE ts < ?", (cutoff,)).rowcount
+
+        if any(deleted.values()):
+            # executescript wykonuje PRAGMA do końca - execute zwolniłby tylko jedną stronę
+            conn.executescript("PRAGMA incremental_vacuum;")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return deleted
+
+    def _writer_loop(self) -> None:
+        import sqlite3
+
+        conn = _connect(self.path)
+        next_compact = time.monotonic()
+        try:
+            while True:
+                stopping = self._stop.wait(self.flush_interval)
+                try:
+                    self._write_batch(conn)
+                    if not stopping and time.monotonic() >= next_compact:
+                        self.compact(conn)
+                        next_compact = time.monotonic() + self.compact_interval
+                except sqlite3.Error as e:
+                    if self.on_error is not None:
+                        self.on_error(f"Błąd zapisu historii {self.path} ({len(self._pending)} wpisów czeka "
+                                      f"na ponowienie): {e}")
+                if stopping:
+                    self.dropped += len(self._pending)
+                    return
+        finally:
+            conn.close()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Zapisuje pozostałe wpisy i zatrzymuje wątek zapisujący
+
+        Args:
+            timeout (float): Maksymalny czas oczekiwania na zapis w sekundach
+        """
+        self._stop.set()
+        self._thread.join(timeout)
+
+
+def uptime_per_day(conn: 'sqlite3.Connection', days: int) -> Dict[str, Dict[str, float]]:
+    """
+    Liczy czas trwania streamów kanałów w kolejnych dniach (czas lokalny)
+
+    Args:
+        conn (sqlite3.Connection): Połączenie z bazą
+        days (int): Liczba ostatnich dni
+
+    Returns:
+        Dict[str, Dict[str, float]]: Kanał -> dzień (RRRR-MM-DD) -> godziny live
+    """
+    today = datetime.date.today()
+    start_day = today - datetime.timedelta(days=days - 1)
+    start = time.mktime(start_day.timetuple())
+    now = time.time()
+
+    result: Dict[str, Dict[str, float]] = {}
+    channels = [row[0] for row in conn.execute("SELECT DISTINCT channel FROM transitions")]
+    for channel in channels:
+        before = conn.execute(
+            "SELECT live FROM transitions WHERE channel = ? AND ts < ? ORDER BY ts DESC LIMIT 1", (channel, start)
+        ).fetchone()
+        rows = conn.execute(
+            "SELECT ts, live FROM transitions WHERE channel = ? AND ts >= ? ORDER BY ts", (channel, start)
+        ).fetchall()
+
+        hours: Dict[str, float] = {}
+        live_since = start if before and before[0] else None
+        for ts, live in rows + [(now, 0)]:
+            if live and live_since is None:
+                live_since = ts
+            elif not live and live_since is not None:
+                _add_interval(hours, live_since, ts)
+                live_since = None
+        result[channel] = hours
+    return result
+
+
+def _add_interval(hours: Dict[str, float], start: float, end: float) -> None:
+    while start < end:
+        day = datetime.date.fromtimestamp(start)
+        next_day = time.mktime((day + datetime.timedelta(days=1)).timetuple())
+        chunk_end = min(end, next_day)
+        hours[day.isoformat()] = hours.get(day.isoformat(), 0.0) + (chunk_end - start) / 3600
+        start = chunk_end
+
+
+def send_success_rate(conn: 'sqlite3.Connection', days: int) -> Dict[str, Tuple[int, int]]:
+    """
+    Liczy wysłane i wszystkie próby wysłania wiadomości dla kanałów
+
+    Args:
+        conn (sqlite3.Connection): Połączenie z bazą
+        days (int): Liczba ostatnich dni
+
+    Returns:
+        Dict[str, Tuple[int, int]]: Kanał -> (udane, wszystkie)
+    """
+    since = time.time() - days * 86400
+    rows = conn.execute(
+        "SELECT channel, SUM(success), COUNT(*) FROM sends WHERE ts >= ? GROUP BY channel", (since,)
+    )
+    return {channel: (successes, total) for channel, successes, total in rows}
+
+
+def main():
+    """
+    Wypisuje raport z historii
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Raport z historii Kick Points Collector")
+    parser.add_argument("--db", default=DEFAULT_HISTORY_PATH, help="Plik bazy historii")
+    parser.add_argument("--days", type=int, default=7, help="Liczba ostatnich dni")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"Nie znaleziono pliku historii: {args.db}")
+        return
+
+    import sqlite3
+
+    conn = sqlite3.connect(f"file:{args.db}?mode=ro", uri=True)
+    try:
+        print(f"Czas trwania streamów (godziny), ostatnie {args.days} dni:")
+        for channel, hours in sorted(uptime_per_day(conn, args.days).items()):
+            if hours:
+                print(f"  {channel}: " + ", ".join(f"{day}: {value:.2f}" for day, value in sorted(hours.items())))
+
+        print(f"\nSkuteczność wysyłania wiadomości, ostatnie {args.days} dni:")
+        for channel, (successes, total) in sorted(send_success_rate(conn, args.days).items(), key=lambda item: str(item[0])):
+            print(f"  {channel}: {successes}/{total} ({successes / total:.0%})")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
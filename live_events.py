@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Wykrywanie startu i końca streamów przez websocket Kick.com (Pusher)
+
+Zamiast co chwilę pobierać /api/v2/channels/{nazwa} dla kanałów offline,
+bot subskrybuje kanały "channel.{id}" i dostaje zdarzenia o starcie i końcu
+streamu. Wymaga pakietu websocket-client - bez niego bot korzysta wyłącznie
+z odpytywania HTTP. Pakiet jest importowany dopiero w wątku połączenia,
+więc nie wydłuża startu bota.
+
+Autor: deem
+"""
+
+import importlib.util
+import json
+import socket
+import threading
+from typing import Callable, Dict, Optional
+
+
+PUSHER_URL = "wss://ws-us2.pusher.com/app/32cbd69e4b950bf97679?protocol=7&client=js&version=8.4.0-rc2&flash=false"
+LIVE_EVENT = "App\\Events\\StreamerIsLive"
+OFFLINE_EVENT = "App\\Events\\StopStreamBroadcast"
+
+
+class LiveEventWatcher:
+    """
+    Utrzymuje połączenie z websocketem Kick i zgłasza zmiany statusu kanałów
+    """
+
+    def __init__(self, on_status: Callable[[str, bool], None], url: str = PUSHER_URL, reconnect_wait: float = 5):
+        """
+        Inicjalizacja obserwatora zdarzeń
+
+        Args:
+            on_status (Callable[[str, bool], None]): Wywoływane z (nazwa kanału, czy live)
+            url (str): Adres websocketu Pusher
+            reconnect_wait (float): Czas oczekiwania przed ponownym połączeniem
+        """
+        self.on_status = on_status
+        self.url = url
+        self.reconnect_wait = reconnect_wait
+        self.connected = False
+        self._subscriptions: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._ws = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @staticmethod
+    def is_available() -> bool:
+        """
+        Sprawdza czy pakiet websocket-client jest zainstalowany
+
+        Returns:
+            bool: True jeśli można używać websocketu
+        """
+        return importlib.util.find_spec("websocket") is not None
+
+    def start(self) -> None:
+        """
+        Uruchamia połączenie w osobnym wątku
+        """
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="kick-live-events", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Zamyka połączenie i kończy wątek obserwatora (bez ponownego łączenia)
+
+        Args:
+            timeout (float): Maksymalny czas oczekiwania na zakończenie wątku
+        """
+        self._stop.set()
+        self.connected = False
+        ws = self._ws
+        if ws is not None:
+            # zamknięcie samego deskryptora nie budzi wątku czekającego w select,
+            # więc po ramce zamknięcia gniazdo jest zamykane przez shutdown
+            ws.keep_running = False
+            try:
+                ws.sock.send_close()
+                ws.sock.sock.shutdown(socket.SHUT_RDWR)
+            except Exception:
+                pass
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def subscribe(self, channel_name: str, channel_id: int) -> None:
+        """
+        Dodaje kanał do subskrypcji (ponowne wywołanie nic nie robi)
+
+        Args:
+            channel_name (str): Nazwa kanału
+            channel_id (int): ID kanału z /api/v2/channels/{nazwa}
+        """
+        pusher_channel = f"channel.{channel_id}"
+        with self._lock:
+            if pusher_channel in self._subscriptions:
+                return
+            self._subscriptions[pusher_channel] = channel_name
+
+        if self.connected:
+            self._send_subscribe(pusher_channel)
+
+    def unsubscribe(self, channel_name: str) -> None:
+        """
+        Usuwa kanał z subskrypcji
+
+        Args:
+            channel_name (str): Nazwa kanału
+        """
+        with self._lock:
+            pusher_channels = [key for key, value in self._subscriptions.items() if value == channel_name]
+            for pusher_channel in pusher_channels:
+                del self._subscriptions[pusher_channel]
+
+        if self.connected:
+            for pusher_channel in pusher_channels:
+                self._send({"event": "pusher:unsubscribe", "data": {"channel": pusher_channel}})
+
+    def is_subscribed(self, channel_name: str) -> bool:
+        """
+        Sprawdza czy kanał jest obserwowany przez websocket
+
+        Args:
+            channel_name (str): Nazwa kanału
+
+        Returns:
+            bool: True jeśli kanał jest subskrybowany i połączenie działa
+        """
+        with self._lock:
+            return self.connected and channel_name in self._subscriptions.values()
+
+    def handle_message(self, raw: str) -> None:
+        """
+        Obsługuje pojedynczą wiadomość protokołu Pusher
+
+        Args:
+            raw (str): Surowa wiadomość JSON z websocketu
+        """
+        message = json.loads(raw)
+        event = message.get("event")
+
+        if event == "pusher:connection_established":
+            self.connected = True
+            with self._lock:
+                pusher_channels = list(self._subscriptions)
+            for pusher_channel in pusher_channels:
+                self._send_subscribe(pusher_channel)
+        elif event == "pusher:ping":
+            self._send({"event": "pusher:pong", "data": {}})
+        elif event in (LIVE_EVENT, OFFLINE_EVENT):
+            with self._lock:
+                channel_name = self._subscriptions.get(message.get("channel"))
+            if channel_name:
+                self.on_status(channel_name, event == LIVE_EVENT)
+
+    def _send_subscribe(self, pusher_channel: str) -> None:
+        self._send({"event": "pusher:subscribe", "data": {"auth": "", "channel": pusher_channel}})
+
+    def _send(self, message: Dict) -> None:
+        try:
+            if self._ws is not None:
+                self._ws.send(json.dumps(message))
+        except Exception:
+            pass
+
+    def _on_close(self, *args) -> None:
+        self.connected = False
+
+    def _run(self) -> None:
+        import websocket
+
+        while not self._stop.is_set():
+            self._ws = websocket.WebSocketApp(
+                self.url,
+                on_message=lambda ws, raw: self.handle_message(raw),
+                on_close=self._on_close,
+                on_error=lambda ws, error: self._on_close()
+            )
+            if self._stop.is_set():
+                break
+            self._ws.run_forever(ping_interval=60, ping_timeout=10)
+            self.connected = False
+            self._stop.wait(self.reconnect_wait)
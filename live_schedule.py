@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Model godzin startu streamów dla adaptacyjnego odpytywania kanałów offline
+
+Dla każdego kanału liczymy starty streamu w 168 przedziałach godzinowych
+tygodnia (czas lokalny). Kanał offline jest sprawdzany często w godzinach,
+w których zwykle startuje, i rzadko poza nimi.
+
+Autor: deem
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+DEFAULT_SCHEDULE_PATH = 'live_schedule.json'
+HOURS_PER_WEEK = 7 * 24
+MIN_OBSERVATIONS = 3
+LIKELY_THRESHOLD = 0.5
+
+
+def hour_of_week(timestamp: float) -> int:
+    """
+    Zwraca numer godziny w tygodniu (0 = poniedziałek 00:00, czas lokalny)
+
+    Args:
+        timestamp (float): Znacznik czasu UNIX
+
+    Returns:
+        int: Numer przedziału 0-167
+    """
+    local = time.localtime(timestamp)
+    return local.tm_wday * 24 + local.tm_hour
+
+
+class LiveScheduleModel:
+    """
+    Liczniki startów streamów w godzinach tygodnia, zapisywane do pliku JSON
+    """
+
+    def __init__(self, path: str = DEFAULT_SCHEDULE_PATH):
+        """
+        Inicjalizacja modelu i wczytanie zapisanych obserwacji
+
+        Args:
+            path (str): Ścieżka do pliku modelu
+        """
+        self.path = path
+        self._counts: Dict[str, List[int]] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self) -> None:
+        """
+        Wczytuje liczniki z pliku (brak lub uszkodzony plik oznacza pusty model)
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                counts = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if isinstance(counts, dict):
+            with self._lock:
+                self._counts = {
+                    channel_name: buckets for channel_name, buckets in counts.items()
+                    if isinstance(buckets, list) and len(buckets) == HOURS_PER_WEEK
+                }
+
+    def save(self) -> None:
+        """
+        Zapisuje liczniki do pliku atomowo (przez plik tymczasowy)
+        """
+        with self._lock:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._counts, f)
+            os.replace(tmp_path, self.path)
+
+    def record_live(self, channel_name: str, timestamp: Optional[float] = None) -> None:
+        """
+        Zapisuje start streamu kanału
+
+        Args:
+            channel_name (str): Nazwa kanału
+            timestamp (Optional[float]): Czas startu (domyślnie teraz)
+        """
+        bucket = hour_of_week(time.time() if timestamp is None else timestamp)
+        with self._lock:
+            counts = self._counts.setdefault(channel_name, [0] * HOURS_PER_WEEK)
+            counts[bucket] += 1
+        self.save()
+
+    def likelihood(self, channel_name: str, bucket: int) -> Optional[float]:
+        """
+        Zwraca względne prawdopodobieństwo startu w danej godzinie tygodnia
+
+        Liczniki są wygładzane z sąsiednimi godzinami i normalizowane do
+        najczęstszej godziny kanału.
+
+        Args:
+            channel_name (str): Nazwa kanału
+            bucket (int): Numer godziny w tygodniu
+
+        Returns:
+            Optional[float]: Wartość 0-1 lub None, gdy obserwacji jest za mało
+        """
+        with self._lock:
+            counts = self._counts.get(channel_name)
+            if counts is None or sum(counts) < MIN_OBSERVATIONS:
+                return None
+            smoothed = [
+                counts[(hour - 1) % HOURS_PER_WEEK] + 2 * counts[hour] + counts[(hour + 1) % HOURS_PER_WEEK]
+                for hour in range(HOURS_PER_WEEK)
+            ]
+
+        return smoothed[bucket % HOURS_PER_WEEK] / max(smoothed)
+
+    def offline_wait(self, channel_name: str, default: float, min_wait: float, max_wait: float,
+                     now: Optional[float] = None) -> float:
+        """
+        Wylicza czas do następnego sprawdzenia kanału offline
+
+        Im bardziej prawdopodobny start w bieżącej godzinie, tym krótszy czas
+        (od max_wait do min_wait). Oczekiwanie nigdy nie przekracza początku
+        najbliższej godziny, w której kanał zwykle startuje.
+
+        Args:
+            channel_name (str): Nazwa kanału
+            default (float): Czas używany, gdy model nie ma jeszcze danych
+            min_wait (float): Najkrótszy dozwolony czas
+            max_wait (float): Najdłuższy dozwolony czas
+            now (Optional[float]): Bieżący czas (domyślnie teraz)
+
+        Returns:
+            float: Czas oczekiwania w sekundach
+        """
+        now = time.time() if now is None else now
+        bucket = hour_of_week(now)
+        likelihood = self.likelihood(channel_name, bucket)
+        if likelihood is None:
+            return default
+
+        wait = max_wait - likelihood * (max_wait - min_wait)
+
+        local = time.localtime(now)
+        until_next_hour = 3600 - (local.tm_min * 60 + local.tm_sec)
+        hours_ahead = 0
+        while until_next_hour + hours_ahead * 3600 < wait:
+            if self.likelihood(channel_name, bucket + hours_ahead + 1) >= LIKELY_THRESHOLD:
+                wait = until_next_hour + hours_ahead * 3600
+                break
+            hours_ahead += 1
+
+        return max(min_wait, min(max_wait, wait))
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Buforowane, nieblokujące logowanie dla pętli monitorowania
+
+Wątki monitorujące tylko dopisują krótką krotkę do kolejki (deque.append
+jest atomowe i nie blokuje). Jeden wątek w tle co chwilę zabiera całą
+zgromadzoną partię, formatuje ją jako tekst lub JSON Lines i zapisuje
+jednym wywołaniem - wolny terminal lub potok nie zatrzymuje sprawdzeń.
+
+Autor: deem
+"""
+
+import collections
+import json
+import os
+import re
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+DEFAULT_LOG_FORMAT = 'text'
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 3
+DEFAULT_ERROR_INTERVAL = 60
+DEFAULT_FLUSH_INTERVAL = 0.2
+DEFAULT_QUEUE_SIZE = 100_000
+DEFAULT_MAX_ERROR_KEYS = 1024
+
+_VOLATILE_PARTS = re.compile(r"0x[0-9a-fA-F]+|\d+")
+
+
+def error_template(message: str) -> str:
+    """
+    Zamienia zmienne fragmenty komunikatu (adresy obiektów, liczby) na "#",
+    aby ten sam błąd z innymi wartościami dawał ten sam klucz
+
+    Args:
+        message (str): Treść wpisu
+
+    Returns:
+        str: Stały szablon komunikatu
+    """
+    return _VOLATILE_PARTS.sub("#", message)
+
+
+class QueueLogger:
+    """
+    Logger z kolejką w pamięci, zapisem partiami, rotacją pliku i limitem
+    powtarzających się błędów dla kanału
+    """
+
+    def __init__(self, log_format: str = DEFAULT_LOG_FORMAT, path: Optional[str] = None,
+                 max_bytes: int = DEFAULT_MAX_BYTES, backup_count: int = DEFAULT_BACKUP_COUNT,
+                 error_interval: float = DEFAULT_ERROR_INTERVAL, flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 queue_size: int = DEFAULT_QUEUE_SIZE, max_error_keys: int = DEFAULT_MAX_ERROR_KEYS):
+        """
+        Inicjalizacja loggera i uruchomienie wątku zapisującego
+
+        Args:
+            log_format (str): "text" (czytelny) lub "json" (JSON Lines)
+            path (Optional[str]): Plik logu (None = standardowe wyjście)
+            max_bytes (int): Rozmiar pliku, po którym następuje rotacja
+            backup_count (int): Liczba zachowywanych starszych plików
+            error_interval (float): Minimalny odstęp (s) między identycznymi błędami kanału
+            flush_interval (float): Co ile sekund zapisywać zgromadzone wpisy
+            queue_size (int): Maksymalna liczba oczekujących wpisów (najstarsze są odrzucane)
+            max_error_keys (int): Ile różnych błędów pamiętać do limitu (najstarsze są zapominane)
+        """
+        self.log_format = log_format
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.error_interval = error_interval
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._queue: "collections.deque[Tuple]" = collections.deque(maxlen=queue_size)
+        self.max_error_keys = max_error_keys
+        self._last_errors: "collections.OrderedDict[Tuple[Optional[str], str], list]" = collections.OrderedDict()
+        self._errors_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._file = open(path, 'a', encoding='utf-8') if path else None
+        self._thread = threading.Thread(target=self._writer_loop, name="kick-log", daemon=True)
+        self._thread.start()
+
+    def info(self, message: str, channel: Optional[str] = None, **fields: Any) -> None:
+        """
+        Dodaje wpis informacyjny
+
+        Args:
+            message (str): Treść wpisu
+            channel (Optional[str]): Nazwa kanału
+            **fields: Dodatkowe pola (zapisywane w formacie JSON)
+        """
+        self._enqueue("INFO", message, channel, fields)
+
+    def error(self, message: str, channel: Optional[str] = None, **fields: Any) -> None:
+        """
+        Dodaje wpis o błędzie; ten sam błąd kanału jest zapisywany najwyżej
+        raz na error_interval sekund, a pominięte powtórzenia są zliczane
+
+        Błędy są rozpoznawane po kanale i typie wyjątku (pole error_type),
+        a bez niego po szablonie komunikatu - różne adresy obiektów czy
+        liczby w treści nie tworzą nowych kluczy.
+
+        Args:
+            message (str): Treść wpisu
+            channel (Optional[str]): Nazwa kanału
+            **fields: Dodatkowe pola (zapisywane w formacie JSON)
+        """
+        now = time.monotonic()
+        key = (channel, fields.get("error_type") or error_template(message))
+        with self._errors_lock:
+            last = self._last_errors.get(key)
+            if last is not None and now - last[0] < self.error_interval:
+                last[1] += 1
+                return
+
+            if last is not None and last[1]:
+                fields["repeated"] = last[1]
+            self._last_errors[key] = [now, 0]
+            self._last_errors.move_to_end(key)
+            while len(self._last_errors) > self.max_error_keys:
+                self._last_errors.popitem(last=False)
+        self._enqueue("ERROR", message, channel, fields)
+
+    def _enqueue(self, level: str, message: str, channel: Optional[str], fields: Dict[str, Any]) -> None:
+        if len(self._queue) == self._queue.maxlen:
+            self.dropped += 1
+        self._queue.append((time.time(), level, channel, message, fields))
+
+    def _format(self, record: Tuple) -> str:
+        timestamp, level, channel, message, fields = record
+        if self.log_format == "json":
+            entry = {
+                "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(timestamp)) + f".{int(timestamp * 1000) % 1000:03d}",
+                "level": level,
+                "channel": channel,
+                "msg": message
+            }
+            entry.update(fields)
+            return json.dumps(entry, ensure_ascii=False)
+
+        line = f"[{time.strftime('%H:%M:%S', time.localtime(timestamp))}] {message}"
+        if level == "ERROR" and "wait" in fields:
+            line += f" | Czekam {fields['wait']}s"
+        if fields.get("repeated"):
+            line += f" (powtórzono {fields['repeated']}x)"
+        return line
+
+    def _rotate(self) -> None:
+        self._file.close()
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        if self.backup_count > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._file = open(self.path, 'a', encoding='utf-8')
+
+    def _write_batch(self) -> None:
+        lines = []
+        while self._queue:
+            lines.append(self._format(self._queue.popleft()))
+        if not lines:
+            return
+
+        data = "\n".join(lines) + "\n"
+        if self._file is None:
+            sys.stdout.write(data)
+            sys.stdout.flush()
+            return
+
+        self._file.write(data)
+        self._file.flush()
+        if self._file.tell() >= self.max_bytes:
+            self._rotate()
+
+    def _writer_loop(self) -> None:
+        while True:
+            stopping = self._stop.wait(self.flush_interval)
+            try:
+                self._write_batch()
+            except (OSError, ValueError):
+                pass
+            if stopping:
+                return
+
+    def close(self, timeout: float = 2.0) -> None:
+        """
+        Zapisuje pozostałe wpisy i zatrzymuje wątek zapisujący
+
+        Args:
+            timeout (float): Maksymalny czas oczekiwania na zapis w sekundach
+        """
+        self._stop.set()
+        self._thread.join(timeout)
+        if self._file is not None:
+            self._file.close()
@@ -13,9 +13,66 @@ import random
 import json
 import threading
 import os
+import signal
 import sys
-from typing import Dict, List, Tuple, Optional
-import cloudscraper
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple, Optional
+
+from channel_cache import ChannelCache, DEFAULT_CACHE_PATH, DEFAULT_CACHE_TTL
+from channel_state import ChannelTable, SendTemplate
+from config_watch import ConfigWatcher
+from history import (HistoryStore, DEFAULT_HISTORY_PATH, DEFAULT_POLL_RETENTION_DAYS,
+                     DEFAULT_RETENTION_DAYS)
+from live_events import LiveEventWatcher, PUSHER_URL
+from live_schedule import LiveScheduleModel, DEFAULT_SCHEDULE_PATH
+from memory_report import MemoryReport, DEFAULT_REPORT_FRAMES, DEFAULT_REPORT_INTERVAL, DEFAULT_REPORT_TOP
+from log_queue import QueueLogger, DEFAULT_LOG_FORMAT, DEFAULT_MAX_BYTES, DEFAULT_BACKUP_COUNT, DEFAULT_ERROR_INTERVAL
+from metrics import MetricsRegistry, DEFAULT_METRICS_HOST, DEFAULT_METRICS_PORT
+from poll_watchdog import (PollDeadlineExceeded, Watchdog, WorkerPool, WorkerPoolExhausted, DEFAULT_CONNECT_TIMEOUT,
+                           DEFAULT_POLL_DEADLINE, DEFAULT_READ_TIMEOUT, DEFAULT_WATCHDOG_FACTOR, DEFAULT_WATCHDOG_INTERVAL)
+from rate_limit import RateGovernor, RateLimiterClosed, DEFAULT_RATE_LIMITS, PRIORITY_LIVE, PRIORITY_OFFLINE
+from schedule_state import ScheduleStateStore, plan_startup, DEFAULT_SAVE_INTERVAL, DEFAULT_STATE_PATH
+from retry_policy import (RetryEngine, RetryError, RetryPolicy, CircuitOpenError, HttpStatusError, backoff_delay,
+                          DEFAULT_BASE_DELAY, DEFAULT_BUDGET_RATIO, DEFAULT_BUDGET_RESERVE,
+                          DEFAULT_MAX_ATTEMPTS, DEFAULT_MAX_DELAY, DEFAULT_MAX_ERROR_WAIT,
+                          FAILURE_STATUSES, RETRY_AFTER_STATUSES)
+from revalidation import RevalidationCache
+from session_pool import SessionPool, DEFAULT_CONNECTIONS_PER_HOST
+from status_api import StatusAPI, DEFAULT_STATUS_HOST, DEFAULT_STATUS_PORT
+from status_parse import STATUS_HEADERS, StatusStats, is_livestream_active, parse_channel, wire_size
+from tracing import create_tracer, DEFAULT_TRACE_PATH
+from transport import HttpxTransport, Transport, DEFAULT_HTTPX_CONNECTIONS, DEFAULT_TRANSPORT, TRANSPORTS
+from scheduler import PollScheduler
+
+if TYPE_CHECKING:
+    # asyncio jest importowane przy uruchomieniu tylko dla silnika "asyncio"
+    import asyncio
+    from http.server import ThreadingHTTPServer
+
+
+KICK_API_BASE = 'https://kick.com'
+ENGINES = ('threads', 'asyncio', 'scheduler')
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_LIVE_EVENTS_RESYNC = 1800
+DEFAULT_SHUTDOWN_TIMEOUT = 0.5
+RESTART_REQUIRED_FIELDS = ('engine', 'max_workers', 'api_base', 'http_pool', 'chatroom_cache',
+                           'live_events', 'metrics', 'tracing', 'logging', 'revalidation',
+                           'retry', 'rate_limit', 'history', 'watchdog', 'memory_report', 'schedule_state',
+                           'transport', 'status_api')
+
+
+def create_scraper():
+    """
+    Tworzy sesję cloudscraper
+    
+    Pakiet jest importowany dopiero przy tworzeniu pierwszej sesji - to
+    najcięższa zależność (requests, urllib3, certyfikaty), a błędy
+    konfiguracji mogą zostać zgłoszone bez jej ładowania.
+    
+    Returns:
+        cloudscraper.CloudScraper: Nowa sesja HTTP
+    """
+    import cloudscraper
+    return cloudscraper.create_scraper()
 
 
 class KickPointsCollector:
@@ -23,16 +80,58 @@ class KickPointsCollector:
     Główna klasa do automatycznego zbierania punktów na Kick.com
     """
     
-    def __init__(self, config_path: str = 'config.json'):
+    def __init__(self, config_path: str = 'config.json', clock: Callable[[], float] = time.monotonic,
+                 wall_clock: Callable[[], float] = time.time, transport: Any = None):
         """
         Inicjalizacja kolektora punktów
         
         Args:
             config_path (str): Ścieżka do pliku konfiguracyjnego
+            clock (Callable[[], float]): Zegar monotoniczny używany do planowania sprawdzeń
+            wall_clock (Callable[[], float]): Zegar czasu rzeczywistego (znaczniki czasu, model godzin)
+            transport (Any): Transport zastępujący ten z sekcji "transport"
+                (np. symulowane API w simulate.py)
         """
         self.config_path = config_path
         self.config = self.load_config()
-        self.scraper = cloudscraper.create_scraper()
+        self.memory_report = self._create_memory_report()
+        self.clock = clock
+        self.wall_clock = wall_clock
+        self.engine = self.config.get("engine", "threads")
+        self.api_base = self.config.get("api_base", KICK_API_BASE).rstrip('/')
+        self.log = self._create_logger()
+        self.transport = transport if transport is not None else self._create_transport()
+        self.channel_cache = self._create_channel_cache()
+        self.live_schedule = self._create_live_schedule()
+        self.status_stats = StatusStats()
+        self.revalidation = RevalidationCache() if self.config.get("revalidation", True) else None
+        self.metrics = MetricsRegistry(self.metrics_gauges)
+        self.metrics_server: Optional[ThreadingHTTPServer] = None
+        self.tracer = create_tracer(self.config.get("tracing"))
+        self.governor = self._create_governor()
+        self.history = self._create_history()
+        self.schedule_state = self._create_schedule_state()
+        self.channels = ChannelTable(self.wall_clock)
+        self.status_api: Optional[StatusAPI] = None
+        self.send_template = SendTemplate(self.config["authorization"], self.config["messages"])
+        self.live_watcher: Optional[LiveEventWatcher] = None
+        self._wakeups: Dict[str, threading.Event] = {}
+        self._async_wakeups: Dict[str, asyncio.Event] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.scheduler: Optional[PollScheduler] = None
+        self.config_watcher: Optional[ConfigWatcher] = None
+        self._channel_stops: Dict[str, threading.Event] = {}
+        self._threads: Dict[str, threading.Thread] = {}
+        self._async_tasks: Dict[str, asyncio.Task] = {}
+        self._async_stop: Optional[asyncio.Event] = None
+        self._async_pending = 0
+        self._executor: Optional[WorkerPool] = None
+        self._stop_event = threading.Event()
+        self._stop_requested = 0.0
+        self._reload_lock = threading.Lock()
+        self.retry = self._create_retry_engine()
+        self._deadline = threading.local()
+        self.watchdog = self._create_watchdog()
         
     def load_config(self) -> Dict:
         """
@@ -46,11 +145,7 @@ class KickPointsCollector:
             json.JSONDecodeError: Jeśli plik konfiguracyjny jest nieprawidłowy
         """
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-            
-            self.validate_config(config)
-            return config
+            return self.read_config()
             
         except FileNotFoundError:
             print(f"BŁĄD: Plik konfiguracyjny '{self.config_path}' nie został znaleziony!")
@@ -60,6 +155,24 @@ class KickPointsCollector:
             print(f"BŁĄD: Nieprawidłowy format pliku konfiguracyjnego: {e}")
             sys.exit(1)
     
+    def read_config(self) -> Dict:
+        """
+        Wczytuje i waliduje konfigurację bez kończenia programu przy błędzie
+        
+        Returns:
+            Dict: Załadowana konfiguracja
+            
+        Raises:
+            FileNotFoundError: Jeśli plik konfiguracyjny nie istnieje
+            json.JSONDecodeError: Jeśli plik konfiguracyjny jest nieprawidłowy
+            ValueError: Jeśli konfiguracja nie przechodzi walidacji
+        """
+        with open(self.config_path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        
+        self.validate_config(config)
+        return config
+
     def validate_config(self, config: Dict) -> None:
         """
         Waliduje konfigurację i sprawdza wymagane pola
@@ -100,114 +213,1297 @@ class KickPointsCollector:
         
         if not config['authorization'].startswith('Bearer '):
             raise ValueError("Token autoryzacji musi zaczynać się od 'Bearer '")
+        
+        engine = config.get('engine', 'threads')
+        if engine not in ENGINES:
+            raise ValueError(f"Pole 'engine' musi mieć jedną z wartości: {', '.join(ENGINES)}")
+        
+        max_workers = config.get('max_workers', DEFAULT_MAX_WORKERS)
+        if not isinstance(max_workers, int) or max_workers <= 0:
+            raise ValueError("Pole 'max_workers' musi być dodatnią liczbą całkowitą")
+        
+        shutdown_timeout = config.get('shutdown_timeout', DEFAULT_SHUTDOWN_TIMEOUT)
+        if not isinstance(shutdown_timeout, (int, float)) or shutdown_timeout < 0:
+            raise ValueError("Pole 'shutdown_timeout' musi być nieujemną liczbą sekund")
+        
+        if len(set(config['channels'])) != len(config['channels']):
+            raise ValueError("Lista kanałów zawiera duplikaty")
+        
+        for section in ('live_events', 'chatroom_cache', 'http_pool', 'adaptive_polling', 'metrics', 'tracing', 'logging',
+                        'retry', 'rate_limit', 'history', 'timeouts', 'watchdog', 'memory_report',
+                        'schedule_state', 'transport', 'status_api'):
+            if not isinstance(config.get(section, {}), dict):
+                raise ValueError(f"Pole '{section}' musi być typu dict")
+        
+        timeouts = config.get('timeouts', {})
+        for endpoint in ('channel_status', 'message_send'):
+            if not isinstance(timeouts.get(endpoint, {}), dict):
+                raise ValueError(f"Pole 'timeouts.{endpoint}' musi być typu dict")
+            for field in ('connect', 'read'):
+                value = timeouts.get(endpoint, {}).get(field, timeouts.get(field, 1))
+                if not isinstance(value, (int, float)) or value <= 0:
+                    raise ValueError(f"Pole 'timeouts.{field}' musi być liczbą dodatnią")
+        poll_deadline = timeouts.get('poll_deadline', DEFAULT_POLL_DEADLINE)
+        if not isinstance(poll_deadline, (int, float)) or poll_deadline <= 0:
+            raise ValueError("Pole 'timeouts.poll_deadline' musi być liczbą dodatnią")
+        
+        factor = config.get('watchdog', {}).get('factor', DEFAULT_WATCHDOG_FACTOR)
+        if not isinstance(factor, (int, float)) or factor < 1:
+            raise ValueError("Pole 'watchdog.factor' musi być liczbą nie mniejszą niż 1")
+        check_interval = config.get('watchdog', {}).get('check_interval', DEFAULT_WATCHDOG_INTERVAL)
+        if not isinstance(check_interval, (int, float)) or check_interval <= 0:
+            raise ValueError("Pole 'watchdog.check_interval' musi być liczbą dodatnią")
+        max_hung = config.get('watchdog', {}).get('max_hung')
+        if max_hung is not None and (not isinstance(max_hung, int) or max_hung < 0):
+            raise ValueError("Pole 'watchdog.max_hung' musi być liczbą całkowitą nieujemną")
+        
+        schedule_state = config.get('schedule_state', {})
+        ramp_up = schedule_state.get('ramp_up', config['wait_times']['livestream_inactive'])
+        if not isinstance(ramp_up, (int, float)) or ramp_up < 0:
+            raise ValueError("Pole 'schedule_state.ramp_up' musi być nieujemną liczbą sekund")
+        save_interval = schedule_state.get('interval', DEFAULT_SAVE_INTERVAL)
+        if not isinstance(save_interval, (int, float)) or save_interval <= 0:
+            raise ValueError("Pole 'schedule_state.interval' musi być liczbą dodatnią")
+        
+        transport = config.get('transport', {})
+        if transport.get('backend', DEFAULT_TRANSPORT) not in TRANSPORTS:
+            raise ValueError(f"Pole 'transport.backend' musi mieć jedną z wartości: {', '.join(TRANSPORTS)}")
+        max_connections = transport.get('max_connections', DEFAULT_HTTPX_CONNECTIONS)
+        if not isinstance(max_connections, int) or max_connections <= 0:
+            raise ValueError("Pole 'transport.max_connections' musi być dodatnią liczbą całkowitą")
+        
+        frames = config.get('memory_report', {}).get('frames', DEFAULT_REPORT_FRAMES)
+        if not isinstance(frames, int) or frames <= 0:
+            raise ValueError("Pole 'memory_report.frames' musi być dodatnią liczbą całkowitą")
+        
+        rate_limit = config.get('rate_limit', {})
+        for endpoint in DEFAULT_RATE_LIMITS:
+            limit = rate_limit.get(endpoint, {})
+            if not isinstance(limit, dict):
+                raise ValueError(f"Pole 'rate_limit.{endpoint}' musi być typu dict")
+            for field in ('rate', 'burst'):
+                value = limit.get(field, DEFAULT_RATE_LIMITS[endpoint][field])
+                if not isinstance(value, (int, float)) or value <= 0:
+                    raise ValueError(f"Pole 'rate_limit.{endpoint}.{field}' musi być liczbą dodatnią")
+        
+        max_attempts = config.get('retry', {}).get('max_attempts', DEFAULT_MAX_ATTEMPTS)
+        if not isinstance(max_attempts, int) or max_attempts <= 0:
+            raise ValueError("Pole 'retry.max_attempts' musi być dodatnią liczbą całkowitą")
+        
+        if config.get('logging', {}).get('format', DEFAULT_LOG_FORMAT) not in ('text', 'json'):
+            raise ValueError("Pole 'logging.format' musi mieć wartość 'text' lub 'json'")
+        
+        adaptive = config.get('adaptive_polling', {})
+        if adaptive.get('enabled'):
+            for field in ('min_wait', 'max_wait'):
+                if field not in adaptive:
+                    raise ValueError(f"Brak wymaganego pola w adaptive_polling: '{field}'")
+            if not 0 < adaptive['min_wait'] <= adaptive['max_wait']:
+                raise ValueError("adaptive_polling: wymagane 0 < min_wait <= max_wait")
 
-    def check_channel_status(self, channel_name: str) -> Tuple[bool, Optional[str]]:
+    def _create_logger(self) -> QueueLogger:
         """
-        Sprawdza status kanału i wysyła wiadomość jeśli stream jest aktywny
+        Tworzy buforowany logger na podstawie sekcji "logging"
+        
+        Returns:
+            QueueLogger: Logger zapisujący w tle
+        """
+        log_config = self.config.get("logging", {})
+        return QueueLogger(
+            log_config.get("format", DEFAULT_LOG_FORMAT),
+            log_config.get("path"),
+            log_config.get("max_bytes", DEFAULT_MAX_BYTES),
+            log_config.get("backup_count", DEFAULT_BACKUP_COUNT),
+            log_config.get("error_interval", DEFAULT_ERROR_INTERVAL)
+        )
+
+    def _create_transport(self) -> Transport:
+        """
+        Tworzy transport HTTP na podstawie sekcji "transport" - domyślnie pulę
+        sesji cloudscraper z ustawieniami z sekcji "http_pool"
+        
+        Returns:
+            Transport: Transport HTTP
+            
+        Raises:
+            ValueError: Gdy brakuje pakietów wybranego transportu
+        """
+        transport_config = self.config.get("transport", {})
+        if transport_config.get("backend", DEFAULT_TRANSPORT) == "httpx":
+            try:
+                return HttpxTransport(
+                    transport_config.get("http2", True),
+                    transport_config.get("http1", True),
+                    transport_config.get("max_connections", DEFAULT_HTTPX_CONNECTIONS),
+                    transport_config.get("headers")
+                )
+            except ImportError as e:
+                raise ValueError(f"Transport 'httpx' wymaga pakietu httpx[http2] "
+                                 f"(pip install 'httpx[http2]'): {e}")
+        
+        pool_config = self.config.get("http_pool", {})
+        return SessionPool(
+            create_scraper,
+            pool_config.get("size", self.config.get("max_workers", DEFAULT_MAX_WORKERS)),
+            pool_config.get("connections_per_host", DEFAULT_CONNECTIONS_PER_HOST)
+        )
+
+    def _create_channel_cache(self) -> Optional[ChannelCache]:
+        """
+        Tworzy pamięć podręczną ID czatów (chyba że wyłączono ją w konfiguracji)
+        
+        Returns:
+            Optional[ChannelCache]: Pamięć podręczna lub None
+        """
+        cache_config = self.config.get("chatroom_cache", {})
+        if not cache_config.get("enabled", True):
+            return None
+        
+        return ChannelCache(
+            cache_config.get("path", DEFAULT_CACHE_PATH),
+            cache_config.get("ttl", DEFAULT_CACHE_TTL)
+        )
+
+    def _create_live_schedule(self) -> Optional[LiveScheduleModel]:
+        """
+        Tworzy model godzin startu streamów, jeśli adaptacyjne odpytywanie jest włączone
+        
+        Returns:
+            Optional[LiveScheduleModel]: Model lub None
+        """
+        adaptive = self.config.get("adaptive_polling", {})
+        if not adaptive.get("enabled"):
+            return None
+        
+        return LiveScheduleModel(adaptive.get("path", DEFAULT_SCHEDULE_PATH))
+
+    def _create_schedule_state(self) -> Optional[ScheduleStateStore]:
+        """
+        Tworzy magazyn zapamiętanego harmonogramu (chyba że wyłączono go w konfiguracji)
+        
+        Returns:
+            Optional[ScheduleStateStore]: Magazyn stanu lub None
+        """
+        state_config = self.config.get("schedule_state", {})
+        if not state_config.get("enabled", True):
+            return None
+        
+        return ScheduleStateStore(state_config.get("path", DEFAULT_STATE_PATH))
+
+    def _create_history(self) -> Optional[HistoryStore]:
+        """
+        Tworzy bazę historii, jeśli włączono ją w konfiguracji
+        
+        Returns:
+            Optional[HistoryStore]: Baza historii lub None
+        """
+        history_config = self.config.get("history", {})
+        if not history_config.get("enabled"):
+            return None
+        
+        return HistoryStore(
+            history_config.get("path", DEFAULT_HISTORY_PATH),
+            history_config.get("retention_days", DEFAULT_RETENTION_DAYS),
+            history_config.get("poll_retention_days", DEFAULT_POLL_RETENTION_DAYS),
+            on_error=self.log.error
+        )
+
+    def _create_governor(self) -> Optional[RateGovernor]:
+        """
+        Tworzy globalny ogranicznik zapytań (chyba że wyłączono go w konfiguracji)
+        
+        Returns:
+            Optional[RateGovernor]: Ogranicznik z wiadrem dla każdej klasy zapytań lub None
+        """
+        rate_config = self.config.get("rate_limit", {})
+        if not rate_config.get("enabled", True):
+            return None
+        
+        limits = {
+            endpoint: dict(defaults, **rate_config.get(endpoint, {}))
+            for endpoint, defaults in DEFAULT_RATE_LIMITS.items()
+        }
+        return RateGovernor(limits, self.metrics.observe_queue_wait)
+
+    def _create_retry_engine(self) -> RetryEngine:
+        """
+        Tworzy silnik ponowień na podstawie sekcji "retry"
+        
+        Sprawdzanie statusu (GET) jest ponawiane po błędach połączenia i kodach
+        429/5xx. Wysyłanie wiadomości tylko po 429 i 503 - wtedy serwer na pewno
+        nie przyjął wiadomości, a inne ponowienie mogłoby wysłać ją dwa razy.
+        
+        Returns:
+            RetryEngine: Silnik ponowień z polityką dla każdego punktu końcowego
+        """
+        retry_config = self.config.get("retry", {})
+        timing = {
+            "max_attempts": retry_config.get("max_attempts", DEFAULT_MAX_ATTEMPTS),
+            "base_delay": retry_config.get("base_delay", DEFAULT_BASE_DELAY),
+            "max_delay": retry_config.get("max_delay", DEFAULT_MAX_DELAY)
+        }
+        return RetryEngine(
+            {
+                "channel_status": RetryPolicy(retry_statuses=FAILURE_STATUSES, retry_errors=True, **timing),
+                "message_send": RetryPolicy(retry_statuses=RETRY_AFTER_STATUSES, retry_errors=False, **timing)
+            },
+            sleep=self._retry_sleep,
+            budget_ratio=retry_config.get("budget_ratio", DEFAULT_BUDGET_RATIO),
+            budget_reserve=retry_config.get("budget_reserve", DEFAULT_BUDGET_RESERVE),
+            breaker=dict(retry_config.get("circuit_breaker", {}), clock=self.clock),
+            passthrough=(RateLimiterClosed, PollDeadlineExceeded)
+        )
+
+    def _create_memory_report(self) -> Optional[MemoryReport]:
+        """
+        Uruchamia śledzenie alokacji, jeśli włączono sekcję "memory_report"
+        
+        Śledzenie startuje jak najwcześniej, aby raport obejmował wszystkie
+        struktury kolektora.
+        
+        Returns:
+            Optional[MemoryReport]: Raport pamięci lub None
+        """
+        report_config = self.config.get("memory_report", {})
+        if not report_config.get("enabled"):
+            return None
+        
+        return MemoryReport(report_config.get("frames", DEFAULT_REPORT_FRAMES))
+
+    def _start_memory_report(self) -> None:
+        """
+        Zapisuje punkt odniesienia pamięci przed uruchomieniem kanałów
+        i okresowo wypisuje raport (co memory_report.interval sekund, 0 = tylko przy zatrzymaniu)
+        """
+        if self.memory_report is None:
+            return
+        
+        self.memory_report.mark_baseline()
+        interval = self.config["memory_report"].get("interval", DEFAULT_REPORT_INTERVAL)
+        if not interval:
+            return
+        
+        def report_loop() -> None:
+            while not self._stop_event.wait(interval):
+                self.print_memory_report()
+        
+        threading.Thread(target=report_loop, name="kick-memory-report", daemon=True).start()
+
+    def print_memory_report(self) -> Dict[str, Any]:
+        """
+        Wypisuje raport pamięci: zajętość na kanał i największe miejsca alokacji
+        
+        Returns:
+            Dict[str, Any]: Raport (patrz MemoryReport.report)
+        """
+        report = self.memory_report.report(
+            len(self.config["channels"]),
+            self.config["memory_report"].get("top", DEFAULT_REPORT_TOP)
+        )
+        print(MemoryReport.format(report))
+        return report
+
+    def _create_watchdog(self) -> Optional[Watchdog]:
+        """
+        Tworzy strażnika zawieszonych kanałów (chyba że wyłączono go w konfiguracji)
+        
+        Kanał jest uznawany za zawieszony, gdy od zakończenia ostatniego
+        sprawdzenia minęło więcej niż factor razy zaplanowany odstęp plus
+        termin sprawdzenia (timeouts.poll_deadline).
+        
+        Returns:
+            Optional[Watchdog]: Strażnik lub None
+        """
+        watchdog_config = self.config.get("watchdog", {})
+        if not watchdog_config.get("enabled", True):
+            return None
+        
+        return Watchdog(
+            self.restart_channel,
+            watchdog_config.get("factor", DEFAULT_WATCHDOG_FACTOR),
+            self.config.get("timeouts", {}).get("poll_deadline", DEFAULT_POLL_DEADLINE),
+            watchdog_config.get("check_interval", DEFAULT_WATCHDOG_INTERVAL),
+            self.clock
+        )
+
+    def _request_timeout(self, endpoint: str) -> Tuple[float, float]:
+        """
+        Zwraca limity czasu zapytania, skrócone do terminu bieżącego sprawdzenia
+        
+        Limit odczytu dotyczy pojedynczego odczytu z gniazda, a nie całej
+        odpowiedzi - całość ogranicza termin sprawdzenia.
         
         Args:
-            channel_name (str): Nazwa kanału do sprawdzenia
+            endpoint (str): Klasa punktów końcowych (channel_status / message_send)
             
         Returns:
-            Tuple[bool, Optional[str]]: (czy wiadomość została wysłana, wysłana wiadomość)
+            Tuple[float, float]: (limit połączenia, limit odczytu) w sekundach
+            
+        Raises:
+            PollDeadlineExceeded: Gdy termin sprawdzenia już upłynął
+        """
+        timeouts = self.config.get("timeouts", {})
+        override = timeouts.get(endpoint, {})
+        connect = override.get("connect", timeouts.get("connect", DEFAULT_CONNECT_TIMEOUT))
+        read = override.get("read", timeouts.get("read", DEFAULT_READ_TIMEOUT))
+        
+        deadline = getattr(self._deadline, "value", None)
+        if deadline is None:
+            return connect, read
+        remaining = deadline - self.clock()
+        if remaining <= 0:
+            raise PollDeadlineExceeded(f"Przekroczono termin sprawdzenia ({timeouts.get('poll_deadline', DEFAULT_POLL_DEADLINE)}s)")
+        return min(connect, remaining), min(read, remaining)
+
+    def _retry_sleep(self, seconds: float) -> bool:
+        """
+        Oczekiwanie przed ponowieniem - przerywane zatrzymaniem i nie dłuższe
+        niż pozostały czas do terminu sprawdzenia
+        
+        Args:
+            seconds (float): Czas oczekiwania
+            
+        Returns:
+            bool: True jeśli oczekiwanie przerwało zatrzymanie bota
+        """
+        deadline = getattr(self._deadline, "value", None)
+        if deadline is not None:
+            seconds = min(seconds, max(0.0, deadline - self.clock()))
+        return self._stop_event.wait(seconds)
+
+    def _timed_request(self, endpoint: str, request: Callable[..., Any], url: str,
+                       priority: int = PRIORITY_OFFLINE, **kwargs) -> Any:
+        """
+        Czeka na pozwolenie ogranicznika, wykonuje zapytanie i rejestruje jego
+        czas trwania oraz kod odpowiedzi
+        
+        Args:
+            endpoint (str): Nazwa punktu końcowego w metrykach i ograniczniku
+            request (Callable[..., Any]): Funkcja wykonująca zapytanie (get/post)
+            url (str): Adres URL
+            priority (int): Priorytet w kolejce ogranicznika (PRIORITY_LIVE / PRIORITY_OFFLINE)
+            **kwargs: Argumenty zapytania
+            
+        Returns:
+            Any: Odpowiedź HTTP
         """
+        if self.governor is not None:
+            with self.tracer.span("rate_limit", endpoint=endpoint):
+                self.governor.acquire(endpoint, priority)
+        
+        kwargs["timeout"] = self._request_timeout(endpoint)
+        start = time.perf_counter()
         try:
-            channel_url = f"https://kick.com/api/v2/channels/{channel_name}"
-            channel_response = self.scraper.get(channel_url)
-            channel_data = channel_response.json()
+            response = request(url, **kwargs)
+        except Exception:
+            self.metrics.observe_request(endpoint, time.perf_counter() - start, "error")
+            raise
+        
+        self.metrics.observe_request(endpoint, time.perf_counter() - start, str(response.status_code))
+        return response
+
+    def metrics_gauges(self) -> Dict[str, float]:
+        """
+        Zwraca bieżące wartości wskaźników dla /metrics
+        
+        Returns:
+            Dict[str, float]: Nazwa metryki z etykietami -> wartość
+        """
+        live_channels = self.channels.live_count()
+        pool = self.transport.stats()
+        status = self.status_stats.summary()
+        
+        gauges = {
+            'kick_channels{state="live"}': live_channels,
+            'kick_channels{state="offline"}': len(self.config["channels"]) - live_channels,
+            "kick_threads": threading.active_count(),
+            "kick_async_tasks": len(self._async_wakeups),
+            "kick_http_sessions": pool["sessions"],
+            "kick_http_connections_opened": pool["connections_opened"],
+            "kick_http_session_waits_total": pool["waits"],
+            "kick_status_polls_total": status["polls"],
+            "kick_status_wire_bytes_total": self.status_stats.wire_bytes
+        }
+        if self.revalidation is not None:
+            revalidation = self.revalidation.stats()
+            gauges["kick_revalidation_hits_total"] = revalidation["hits"]
+            gauges["kick_revalidation_bytes_saved_total"] = revalidation["bytes_saved"]
+        if self.governor is not None:
+            for endpoint, queue in self.governor.stats().items():
+                gauges[f'kick_rate_limit_waiting{{endpoint="{endpoint}"}}'] = queue["waiting"]
+                gauges[f'kick_rate_limit_rate{{endpoint="{endpoint}"}}'] = queue["rate"]
+        if self.watchdog is not None:
+            gauges["kick_watchdog_restarts_total"] = self.watchdog.restarts
+            gauges["kick_watchdog_failed_restarts_total"] = self.watchdog.failed_restarts
+        pool = self.scheduler.pool if self.scheduler is not None else self._executor
+        if pool is not None:
+            gauges["kick_hung_workers"] = pool.hung
+        for endpoint, retry in self.retry.stats().items():
+            gauges[f'kick_retries_total{{endpoint="{endpoint}"}}'] = retry["retries"]
+            gauges[f'kick_retry_budget_exhausted_total{{endpoint="{endpoint}"}}'] = retry["budget_exhausted"]
+            gauges[f'kick_circuit_open{{endpoint="{endpoint}"}}'] = int(retry["circuit_state"] != "closed")
+            gauges[f'kick_circuit_rejected_total{{endpoint="{endpoint}"}}'] = retry["circuit_rejected"]
+        return gauges
+
+    def _start_metrics_server(self) -> None:
+        """
+        Uruchamia serwer /metrics, jeśli jest włączony w konfiguracji
+        """
+        metrics_config = self.config.get("metrics", {})
+        if not metrics_config.get("enabled"):
+            return
+        
+        host = metrics_config.get("host", DEFAULT_METRICS_HOST)
+        port = metrics_config.get("port", DEFAULT_METRICS_PORT)
+        self.metrics_server = self.metrics.serve(host, port)
+        print(f"Metryki dostępne pod adresem: http://{host}:{port}/metrics")
+
+    def _start_status_api(self) -> None:
+        """
+        Uruchamia lokalne API statusu kanałów, jeśli jest włączone w konfiguracji
+        """
+        api_config = self.config.get("status_api", {})
+        if not api_config.get("enabled"):
+            return
+        
+        self.status_api = StatusAPI(self.channels, self.clock, self.wall_clock)
+        socket_path = api_config.get("socket")
+        try:
+            self.status_api.serve(api_config.get("host", DEFAULT_STATUS_HOST),
+                                  api_config.get("port", DEFAULT_STATUS_PORT), socket_path)
+        except (OSError, ImportError) as e:
+            print(f"UWAGA: Nie udało się uruchomić API statusu: {e}")
+            self.status_api = None
+            return
+        if socket_path:
+            print(f"API statusu dostępne na gnieździe: {socket_path}")
+        else:
+            print(f"API statusu dostępne pod adresem: http://{api_config.get('host', DEFAULT_STATUS_HOST)}:"
+                  f"{api_config.get('port', DEFAULT_STATUS_PORT)}/channels")
+
+    def _fetch_status(self, url: str, priority: int, headers: Dict[str, str]) -> Any:
+        """
+        Wykonuje zapytanie o status z ponawianiem i śledzeniem
+        
+        Args:
+            url (str): Adres URL
+            priority (int): Priorytet w kolejce ogranicznika
+            headers (Dict[str, str]): Nagłówki zapytania
             
-            if channel_data.get("livestream") is None:
-                return False, None
+        Returns:
+            Any: Odpowiedź HTTP
+        """
+        with self.tracer.span("status_fetch", url=url):
+            return self.retry.call("channel_status", lambda: self._timed_request(
+                "channel_status", self.transport.get, url, priority, headers=headers))
+
+    def _get_status(self, url: str, parse: Callable[[bytes], Any], priority: int = PRIORITY_OFFLINE) -> Tuple[int, Any]:
+        """
+        Pobiera i przetwarza odpowiedź statusu, używając zapytań warunkowych
+        
+        Odpowiedź 304 zwraca wynik zapamiętany przy ostatniej odpowiedzi 200,
+        bez ponownego przetwarzania treści. Jeśli wpisu już nie ma (np. kanał
+        usunięto w trakcie zapytania), adres jest pobierany ponownie bez
+        nagłówków warunkowych.
+        
+        Args:
+            url (str): Adres URL
+            parse (Callable[[bytes], Any]): Funkcja przetwarzająca treść odpowiedzi
+            priority (int): Priorytet w kolejce ogranicznika
             
-            chatroom_id = channel_data.get("chatroom", {}).get("id")
-            if not chatroom_id:
-                return False, None
+        Returns:
+            Tuple[int, Any]: (kod odpowiedzi, przetworzony wynik; None dla 404)
             
-            return self.send_message(chatroom_id)
+        Raises:
+            HttpStatusError: Gdy odpowiedź ma inny kod błędu (np. 403), aby
+                błąd nie został uznany za kanał offline
+        """
+        headers = dict(STATUS_HEADERS)
+        if self.revalidation is not None:
+            headers.update(self.revalidation.headers_for(url))
+        
+        response = self._fetch_status(url, priority, headers)
+        if response.status_code == 304 and self.revalidation is not None:
+            parsed = self.revalidation.reuse(url)
+            if parsed is not None:
+                self.status_stats.record(wire_size(response), 0, 0.0)
+                return response.status_code, parsed
+            response = self._fetch_status(url, priority, dict(STATUS_HEADERS))
+        
+        if response.status_code == 404:
+            return response.status_code, None
+        if not 200 <= response.status_code < 300:
+            raise HttpStatusError("channel_status", response.status_code)
+        
+        parse_start = time.perf_counter()
+        with self.tracer.span("parse", bytes=len(response.content)):
+            parsed = parse(response.content)
+        wire_bytes = wire_size(response)
+        self.status_stats.record(wire_bytes, len(response.content), time.perf_counter() - parse_start)
+        
+        if self.revalidation is not None and response.status_code == 200:
+            self.revalidation.store(url, response, parsed, wire_bytes)
+        
+        return response.status_code, parsed
+
+    def fetch_channel_info(self, channel_name: str) -> Tuple[bool, Optional[int], Optional[int]]:
+        """
+        Pobiera status kanału, korzystając z pamięci podręcznej ID czatu
+        
+        Przy trafieniu w pamięć podręczną pobierany jest tylko mały dokument
+        /livestream. Pełny dokument kanału jest pobierany tylko przy braku
+        lub wygaśnięciu wpisu.
+        
+        Args:
+            channel_name (str): Nazwa kanału
             
-        except Exception as e:
-            current_time = time.strftime("%H:%M:%S", time.localtime())
-            print(f"[{current_time}] BŁĄD podczas sprawdzania statusu kanału {channel_name}: {str(e)}")
+        Returns:
+            Tuple[bool, Optional[int], Optional[int]]: (czy stream aktywny, ID czatu, ID kanału)
+        """
+        entry = self.channel_cache.get(channel_name) if self.channel_cache is not None else None
+        state = self.channels.peek(channel_name)
+        priority = PRIORITY_LIVE if state is not None and state.live else PRIORITY_OFFLINE
+        
+        if entry is not None:
+            livestream_url = f"{self.api_base}/api/v2/channels/{channel_name}/livestream"
+            status_code, is_live = self._get_status(livestream_url, is_livestream_active, priority)
+            if status_code == 404:
+                self.channel_cache.invalidate(channel_name)
+                return False, None, None
+            return is_live, entry["chatroom_id"], entry.get("channel_id")
+        
+        channel_url = f"{self.api_base}/api/v2/channels/{channel_name}"
+        status_code, channel = self._get_status(channel_url, parse_channel, priority)
+        if status_code == 404:
+            self.log.error(f"BŁĄD: Kanał {channel_name} nie istnieje", channel_name)
+            return False, None, None
+        is_live, chatroom_id, channel_id = channel
+        
+        if chatroom_id and self.channel_cache is not None:
+            self.channel_cache.put(channel_name, chatroom_id, channel_id)
+        
+        return is_live, chatroom_id, channel_id
+
+    def check_channel_status(self, channel_name: str) -> Tuple[bool, Optional[str]]:
+        """
+        Sprawdza status kanału i wysyła wiadomość jeśli stream jest aktywny
+        
+        Błędy nie są tu przechwytywane - poll_channel wylicza na ich podstawie
+        czas do ponownego sprawdzenia, zamiast traktować kanał jako offline.
+        
+        Args:
+            channel_name (str): Nazwa kanału do sprawdzenia
+            
+        Returns:
+            Tuple[bool, Optional[str]]: (czy wiadomość została wysłana, wysłana wiadomość)
+        """
+        if self._known_offline(channel_name):
+            return False, None
+        
+        is_live, chatroom_id, channel_id = self.fetch_channel_info(channel_name)
+        
+        state = self.channels.peek(channel_name)
+        if state is None:
+            # kanał usunięto z konfiguracji w trakcie sprawdzenia
             return False, None
+        state.last_http_check = self.wall_clock()
+        if chatroom_id != state.chatroom_id:
+            state.chatroom_id = chatroom_id
+            self.channels.touch(state)
+        state.channel_id = channel_id
+        self._set_live_state(channel_name, is_live)
+        if self.live_watcher is not None and channel_id:
+            self.live_watcher.subscribe(channel_name, channel_id)
+        
+        if not is_live:
+            return False, None
+        
+        if not chatroom_id:
+            return False, None
+        
+        return self.send_message(chatroom_id, channel_name)
 
-    def send_message(self, chatroom_id: str) -> Tuple[bool, Optional[str]]:
+    def send_message(self, chatroom_id: str, channel_name: Optional[str] = None) -> Tuple[bool, Optional[str]]:
         """
         Wysyła wiadomość na czat
         
+        Nagłówki i zakodowane treści wiadomości pochodzą z szablonu
+        przygotowanego przy wczytaniu konfiguracji - przy każdym wysłaniu
+        dopisywany jest tylko nowy message_ref.
+        
         Args:
             chatroom_id (str): ID czatu
+            channel_name (Optional[str]): Nazwa kanału (do historii)
             
         Returns:
             Tuple[bool, Optional[str]]: (czy wiadomość została wysłana, wysłana wiadomość)
         """
         try:
-            message_url = f"https://kick.com/api/v2/messages/send/{chatroom_id}"
-            
-            random_message = random.choice(self.config["messages"])
-            
-            message_ref = str(random.randint(1000000000000, 9999999999999))
-            
-            payload = {
-                "content": random_message,
-                "type": "message",
-                "message_ref": message_ref
-            }
+            message_url = f"{self.api_base}/api/v2/messages/send/{chatroom_id}"
+            template = self.send_template
+            random_message, body = template.render()
             
-            headers = {
-                "Authorization": self.config["authorization"],
-                "Content-Type": "application/json"
-            }
+            with self.tracer.span("send_message", chatroom_id=chatroom_id):
+                response = self.retry.call("message_send", lambda: self._timed_request(
+                    "message_send", self.transport.post, message_url, PRIORITY_LIVE,
+                    data=body, headers=template.headers))
             
-            response = self.scraper.post(message_url, json=payload, headers=headers)
+            if self.history is not None:
+                self.history.record_send(channel_name, chatroom_id, response.status_code == 200,
+                                         response.status_code, random_message)
             
             if response.status_code == 200:
+                state = self.channels.peek(channel_name) if channel_name is not None else None
+                if state is not None:
+                    state.sends += 1
                 return True, random_message
             else:
-                current_time = time.strftime("%H:%M:%S", time.localtime())
-                print(f"[{current_time}] BŁĄD: Kod odpowiedzi {response.status_code} dla wiadomości: {random_message}")
+                self.log.error(f"BŁĄD: Kod odpowiedzi {response.status_code} dla wiadomości: {random_message}",
+                               channel_name, chatroom_id=chatroom_id, status=response.status_code)
                 return False, None
                 
+        except RetryError as e:
+            if self.history is not None:
+                self.history.record_send(channel_name, chatroom_id, False, e.status, None)
+            raise
         except Exception as e:
-            current_time = time.strftime("%H:%M:%S", time.localtime())
-            print(f"[{current_time}] BŁĄD podczas wysyłania wiadomości: {str(e)}")
+            if self.history is not None:
+                self.history.record_send(channel_name, chatroom_id, False, None, None)
+            self.log.error(f"BŁĄD podczas wysyłania wiadomości: {str(e)}", channel_name,
+                           chatroom_id=chatroom_id, error_type=type(e).__name__)
             return False, None
 
-    def monitor_channel(self, channel_name: str) -> None:
+    def _known_offline(self, channel_name: str) -> bool:
+        """
+        Sprawdza czy websocket potwierdza, że kanał jest offline
+        
+        Zwraca False (czyli wymusza zapytanie HTTP), gdy websocket nie działa,
+        kanał nie jest jeszcze subskrybowany lub minął czas ponownej synchronizacji.
+        
+        Args:
+            channel_name (str): Nazwa kanału
+            
+        Returns:
+            bool: True jeśli można pominąć zapytanie HTTP
+        """
+        if self.live_watcher is None or not self.live_watcher.is_subscribed(channel_name):
+            return False
+        
+        resync = self.config.get("live_events", {}).get("resync", DEFAULT_LIVE_EVENTS_RESYNC)
+        state = self.channels.peek(channel_name)
+        if state is None or self.wall_clock() - state.last_http_check >= resync:
+            return False
+        
+        return state.live is False
+
+    def _set_live_state(self, channel_name: str, is_live: bool) -> None:
+        """
+        Zapisuje status kanału i rejestruje w modelu przejścia offline -> live
+        
+        Args:
+            channel_name (str): Nazwa kanału
+            is_live (bool): Czy stream jest aktywny
+        """
+        state = self.channels.peek(channel_name)
+        if state is None:
+            return
+        was_live = state.live
+        state.live = is_live
+        if is_live != was_live:
+            self.channels.touch(state)
+        
+        if self.live_schedule is not None and is_live and was_live is False:
+            self.live_schedule.record_live(channel_name, self.wall_clock())
+        if self.history is not None and is_live != was_live:
+            self.history.record_transition(channel_name, is_live)
+
+    def offline_wait(self, channel_name: str) -> float:
+        """
+        Zwraca czas oczekiwania dla kanału bez wysłanej wiadomości
+        
+        Przy włączonym "adaptive_polling" czas dla kanału offline zależy od
+        tego, jak prawdopodobny jest start streamu w najbliższym czasie. Gdy
+        sekcję wyłączono lub usunięto przy przeładowaniu konfiguracji, używany
+        jest stały czas livestream_inactive.
+        
+        Args:
+            channel_name (str): Nazwa kanału
+            
+        Returns:
+            float: Czas oczekiwania w sekundach
+        """
+        default = self.config["wait_times"]["livestream_inactive"]
+        state = self.channels.peek(channel_name)
+        if self.live_schedule is None or state is None or state.live is not False:
+            return default
+        
+        adaptive = self.config.get("adaptive_polling", {})
+        if not adaptive.get("enabled"):
+            return default
+        return self.live_schedule.offline_wait(channel_name, default, adaptive["min_wait"], adaptive["max_wait"],
+                                               self.wall_clock())
+
+    def on_live_event(self, channel_name: str, is_live: bool) -> None:
+        """
+        Obsługuje zdarzenie startu lub końca streamu z websocketu
+        
+        Args:
+            channel_name (str): Nazwa kanału
+            is_live (bool): Czy stream właśnie wystartował
+        """
+        self._set_live_state(channel_name, is_live)
+        self.log.info(f"{channel_name} - {'stream wystartował' if is_live else 'stream zakończony'} (websocket)",
+                      channel_name, live=is_live)
+        
+        if is_live:
+            self._wake_channel(channel_name)
+
+    def _wake_channel(self, channel_name: str) -> None:
+        """
+        Przerywa oczekiwanie kanału, aby sprawdzić go natychmiast
+        
+        Args:
+            channel_name (str): Nazwa kanału
+        """
+        wakeup = self._wakeups.get(channel_name)
+        if wakeup is not None:
+            wakeup.set()
+        
+        async_wakeup = self._async_wakeups.get(channel_name)
+        if async_wakeup is not None and self._loop is not None:
+            self._loop.call_soon_threadsafe(async_wakeup.set)
+        
+        if self.scheduler is not None:
+            self.scheduler.wake(channel_name)
+
+    def _start_live_events(self) -> None:
+        """
+        Uruchamia obserwację zdarzeń websocket, jeśli jest włączona w konfiguracji
+        """
+        live_events = self.config.get("live_events", {})
+        if not live_events.get("enabled"):
+            return
+        
+        if not LiveEventWatcher.is_available():
+            print("UWAGA: Brak pakietu 'websocket-client' - status kanałów będzie sprawdzany tylko przez HTTP")
+            return
+        
+        self.live_watcher = LiveEventWatcher(self.on_live_event, live_events.get("url", PUSHER_URL))
+        self.live_watcher.start()
+
+    def poll_channel(self, channel_name: str) -> float:
+        """
+        Wykonuje pojedyncze sprawdzenie kanału i wylicza czas do następnego
+        
+        Kanał usunięty z konfiguracji (także w trakcie sprawdzenia) nie jest
+        ponownie dodawany do tabeli stanów, strażnika ani historii.
+        
+        Args:
+            channel_name (str): Nazwa kanału do sprawdzenia
+            
+        Returns:
+            float: Czas oczekiwania (w sekundach) przed kolejnym sprawdzeniem
+        """
+        if channel_name not in self.config["channels"]:
+            return self.config["wait_times"]["livestream_inactive"]
+        
+        state = self.channels.get(channel_name)
+        due = state.next_due
+        if due is not None and self.clock() >= due:
+            self.metrics.schedule_lag.observe(self.clock() - due)
+        state.polls += 1
+        
+        self._deadline.value = self.clock() + self.config.get("timeouts", {}).get("poll_deadline", DEFAULT_POLL_DEADLINE)
+        try:
+            with self.tracer.span("poll", channel=channel_name):
+                message_sent, random_message = self.check_channel_status(channel_name)
+
+            if message_sent:
+                wait_time = random.randint(
+                    self.config["wait_times"]["livestream_active"]["min"], 
+                    self.config["wait_times"]["livestream_active"]["max"]
+                )
+                self.log.info(f"Wysłano do {channel_name}: {random_message} | Czekam {wait_time}s",
+                              channel_name, sent=random_message, wait=wait_time)
+            else:
+                wait_time = round(self.offline_wait(channel_name))
+                self.log.info(f"⏸ {channel_name} - stream nieaktywny | Czekam {wait_time}s",
+                              channel_name, wait=wait_time)
+            if state.errors:
+                state.errors = 0
+                self.channels.touch(state)
+            
+        except Exception as e:
+            if isinstance(e, RateLimiterClosed) or self._stop_event.is_set():
+                # sprawdzenie przerwane przez zatrzymanie bota - to nie jest błąd kanału
+                return self.config["wait_times"]["livestream_inactive"]
+            message_sent = False
+            wait_time = round(self.error_wait(channel_name, e))
+            self.log.error(f"BŁĄD w monitorowaniu kanału {channel_name}: {str(e)}",
+                           channel_name, wait=wait_time, error_type=type(e).__name__)
+            if self.history is not None:
+                self.history.record_error(channel_name, str(e))
+            self.channels.record_error(state, str(e))
+        finally:
+            self._deadline.value = None
+        
+        if self.channels.peek(channel_name) is not state:
+            return wait_time
+        
+        if self.history is not None:
+            self.history.record_poll(channel_name, state.live, message_sent, wait_time)
+        
+        state.next_due = self.clock() + wait_time
+        if self.watchdog is not None:
+            self.watchdog.beat(channel_name, wait_time)
+        return wait_time
+
+    def error_wait(self, channel_name: str, error: Exception) -> float:
+        """
+        Zwraca czas oczekiwania kanału po błędzie
+        
+        Przy otwartym wyłączniku kanał czeka do zapytania próbnego (z rozrzutem,
+        aby kanały nie wróciły jednocześnie) i nie jest to liczone jako jego błąd.
+        Kolejne błędy kanału wydłużają czas wykładniczo od error_wait do
+        retry.max_error_wait, ale nie krócej niż wskazał Retry-After.
+        
+        Args:
+            channel_name (str): Nazwa kanału
+            error (Exception): Błąd sprawdzenia
+            
+        Returns:
+            float: Czas oczekiwania w sekundach
+        """
+        if isinstance(error, CircuitOpenError):
+            return error.retry_after * random.uniform(1.0, 1.2) + random.uniform(0, 1)
+        
+        state = self.channels.peek(channel_name)
+        if state is not None:
+            state.errors += 1
+        errors = state.errors if state is not None else 1
+        wait_time = backoff_delay(errors, self.config["wait_times"]["error_wait"],
+                                  self.config.get("retry", {}).get("max_error_wait", DEFAULT_MAX_ERROR_WAIT))
+        
+        if isinstance(error, RetryError) and error.retry_after is not None:
+            wait_time = max(wait_time, error.retry_after)
+        return wait_time
+
+    def monitor_channel(self, channel_name: str, delay: float = 0.0) -> None:
         """
         Monitoruje pojedynczy kanał w nieskończonej pętli
         
         Args:
             channel_name (str): Nazwa kanału do monitorowania
+            delay (float): Opóźnienie pierwszego sprawdzenia w sekundach
+        """
+        self.log.info(f"Rozpoczynam monitorowanie kanału: {channel_name}", channel_name)
+        wakeup = self._wakeups.setdefault(channel_name, threading.Event())
+        stop = self._channel_stops.setdefault(channel_name, threading.Event())
+        
+        if delay > 0 and wakeup.wait(delay):
+            wakeup.clear()
+        
+        while not stop.is_set() and not self._stop_event.is_set():
+            if wakeup.wait(self.poll_channel(channel_name)):
+                wakeup.clear()
+
+    async def monitor_channel_async(self, channel_name: str, delay: float = 0.0) -> None:
         """
-        print(f"Rozpoczynam monitorowanie kanału: {channel_name}")
+        Monitoruje pojedynczy kanał jako zadanie asyncio
+        
+        Zapytania HTTP są blokujące, więc trafiają do współdzielonej puli wątków,
+        a oczekiwanie między sprawdzeniami odbywa się w pętli zdarzeń.
         
-        while True:
+        Args:
+            channel_name (str): Nazwa kanału do monitorowania
+            delay (float): Opóźnienie pierwszego sprawdzenia w sekundach
+        """
+        import asyncio
+        
+        self.log.info(f"Rozpoczynam monitorowanie kanału: {channel_name}", channel_name)
+        wakeup = self._async_wakeups.setdefault(channel_name, asyncio.Event())
+        
+        if delay > 0:
             try:
-                message_sent, random_message = self.check_channel_status(channel_name)
+                await asyncio.wait_for(wakeup.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+            wakeup.clear()
+        
+        while not self._stop_event.is_set():
+            wait_time = await asyncio.wrap_future(self._executor.submit(channel_name, self.poll_channel, channel_name))
+            if self._stop_event.is_set():
+                break
+            try:
+                await asyncio.wait_for(wakeup.wait(), wait_time)
+            except asyncio.TimeoutError:
+                pass
+            wakeup.clear()
 
-                if message_sent:
-                    wait_time = random.randint(
-                        self.config["wait_times"]["livestream_active"]["min"], 
-                        self.config["wait_times"]["livestream_active"]["max"]
-                    )
-                    current_time = time.strftime("%H:%M:%S", time.localtime())
-                    print(f"[{current_time}] Wysłano do {channel_name}: {random_message} | Czekam {wait_time}s")
-                else:
-                    wait_time = self.config["wait_times"]["livestream_inactive"]
-                    current_time = time.strftime("%H:%M:%S", time.localtime())
-                    print(f"[{current_time}] ⏸ {channel_name} - stream nieaktywny | Czekam {wait_time}s")
-                
-                time.sleep(wait_time)
-                
-            except Exception as e:
-                wait_time = self.config["wait_times"]["error_wait"]
-                current_time = time.strftime("%H:%M:%S", time.localtime())
-                print(f"[{current_time}] BŁĄD w monitorowaniu kanału {channel_name}: {str(e)} | Czekam {wait_time}s")
-                time.sleep(wait_time)
+    async def _monitor_all_async(self, delays: Dict[str, float]) -> None:
+        """
+        Uruchamia zadania monitorujące wszystkie kanały w jednej pętli zdarzeń
+        
+        Args:
+            delays (Dict[str, float]): Kanał -> opóźnienie pierwszego sprawdzenia
+        """
+        import asyncio
+        
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+        self._async_stop = asyncio.Event()
+        self._executor = WorkerPool(
+            self.config.get("max_workers", DEFAULT_MAX_WORKERS),
+            self.config.get("watchdog", {}).get("max_hung")
+        )
+        try:
+            loop.add_signal_handler(signal.SIGINT, self.request_stop)
+        except (NotImplementedError, RuntimeError):
+            pass
+        
+        for channel_name, delay in delays.items():
+            self._spawn_async_channel(channel_name, delay)
+        self._start_watchdog(delays)
+        self._start_config_watcher()
+        
+        await self._async_stop.wait()
+        
+        for wakeup in self._async_wakeups.values():
+            wakeup.set()
+        tasks = list(self._async_tasks.values())
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=self.config.get("shutdown_timeout", DEFAULT_SHUTDOWN_TIMEOUT))
+            for task in pending:
+                task.cancel()
+            self._async_pending = len(pending)
+        self._executor.shutdown(cancel_futures=True)
+        self._loop = None
+
+    def _spawn_async_channel(self, channel_name: str, delay: float = 0.0) -> None:
+        """
+        Tworzy zadanie monitorujące kanał (wywoływane w wątku pętli zdarzeń)
+        
+        Args:
+            channel_name (str): Nazwa kanału
+            delay (float): Opóźnienie pierwszego sprawdzenia w sekundach
+        """
+        import asyncio
+        
+        self._async_tasks[channel_name] = asyncio.get_running_loop().create_task(
+            self.monitor_channel_async(channel_name, delay), name=f"kick-{channel_name}"
+        )
+
+    def start_channel(self, channel_name: str, delay: Optional[float] = None) -> None:
+        """
+        Rozpoczyna monitorowanie kanału w działającym silniku
+        
+        Args:
+            channel_name (str): Nazwa kanału
+            delay (Optional[float]): Opóźnienie pierwszego sprawdzenia (domyślnie
+                losowe w oknie rozruchu)
+        """
+        if delay is None:
+            delay = random.uniform(0, self._ramp_up())
+        
+        if self.engine == "asyncio":
+            self._loop.call_soon_threadsafe(self._spawn_async_channel, channel_name, delay)
+        elif self.engine == "scheduler":
+            self.scheduler.add(channel_name, delay)
+        else:
+            self._channel_stops[channel_name] = threading.Event()
+            thread = threading.Thread(target=self.monitor_channel, args=(channel_name, delay),
+                                      name=f"kick-{channel_name}", daemon=True)
+            self._threads[channel_name] = thread
+            thread.start()
+        if self.watchdog is not None:
+            self.watchdog.beat(channel_name, max(delay, self.config["wait_times"]["livestream_inactive"]))
+
+    def stop_channel(self, channel_name: str) -> None:
+        """
+        Kończy monitorowanie kanału i usuwa jego stan
+        
+        Args:
+            channel_name (str): Nazwa kanału
+        """
+        if self.engine == "asyncio":
+            task = self._async_tasks.pop(channel_name, None)
+            if task is not None:
+                self._loop.call_soon_threadsafe(task.cancel)
+            self._async_wakeups.pop(channel_name, None)
+        elif self.engine == "scheduler":
+            self.scheduler.remove(channel_name)
+        else:
+            stop = self._channel_stops.pop(channel_name, None)
+            if stop is not None:
+                stop.set()
+            wakeup = self._wakeups.pop(channel_name, None)
+            if wakeup is not None:
+                wakeup.set()
+            self._threads.pop(channel_name, None)
+        
+        if self.live_watcher is not None:
+            self.live_watcher.unsubscribe(channel_name)
+        if self.revalidation is not None:
+            self.revalidation.forget(f"{self.api_base}/api/v2/channels/{channel_name}")
+        self.channels.remove(channel_name)
+        if self.watchdog is not None:
+            self.watchdog.remove(channel_name)
+
+    def restart_channel(self, channel_name: str, silent: float) -> bool:
+        """
+        Uruchamia ponownie pętlę zawieszonego kanału (wywoływane przez strażnika)
+        
+        Zawieszonego wątku nie da się przerwać - zostaje porzucony, a jego
+        wynik jest ignorowany. Kanał od razu dostaje nową pętlę. Przy
+        silnikach z pulą wątków zajęty wątek jest zastępowany nowym; gdy
+        zawieszone sprawdzenia zajmują już watchdog.max_hung wątków, kanał
+        nie jest uruchamiany ponownie i czeka na zakończenie sprawdzenia.
+        
+        Args:
+            channel_name (str): Nazwa kanału
+            silent (float): Sekundy od ostatniego zakończonego sprawdzenia
+            
+        Returns:
+            bool: True jeśli kanał uruchomiono ponownie
+        """
+        if self._stop_event.is_set() or channel_name not in self.config["channels"]:
+            # kanał usunięty lub bot się zatrzymuje - to nie jest nieudane uruchomienie
+            self.watchdog.remove(channel_name)
+            return False
+        
+        if self.history is not None:
+            self.history.record_error(channel_name, f"watchdog: brak sprawdzenia od {silent:.0f}s")
+        
+        try:
+            if self.engine == "asyncio":
+                self._executor.abandon(channel_name)
+                self._loop.call_soon_threadsafe(self._restart_async_channel, channel_name)
+            elif self.engine == "scheduler":
+                self.scheduler.restart(channel_name)
+            else:
+                stop = self._channel_stops.get(channel_name)
+                if stop is not None:
+                    stop.set()
+                self.start_channel(channel_name, 0.0)
+        except WorkerPoolExhausted as e:
+            self.log.error(f"BŁĄD: Kanał {channel_name} nie zakończył sprawdzenia od {silent:.0f}s - "
+                           f"nie można uruchomić go ponownie, {str(e)}",
+                           channel_name, silent=round(silent), hung_workers=e.hung)
+            return False
+        
+        self.log.error(f"BŁĄD: Kanał {channel_name} nie zakończył sprawdzenia od {silent:.0f}s - uruchamiam ponownie",
+                       channel_name, silent=round(silent))
+        return True
+
+    def _restart_async_channel(self, channel_name: str) -> None:
+        """
+        Anuluje zadanie kanału i tworzy nowe (wywoływane w wątku pętli zdarzeń)
+        
+        Args:
+            channel_name (str): Nazwa kanału
+        """
+        task = self._async_tasks.get(channel_name)
+        if task is not None:
+            task.cancel()
+        self._spawn_async_channel(channel_name)
+
+    def request_stop(self) -> None:
+        """
+        Zgłasza zatrzymanie monitorowania (bezpieczne z dowolnego wątku)
+        
+        Przerywa oczekiwanie wszystkich kanałów - start_monitoring kończy
+        działanie po zakończeniu trwających zapytań lub po shutdown_timeout.
+        """
+        if not self._stop_event.is_set():
+            self._stop_requested = time.monotonic()
+        self._stop_event.set()
+        if self.watchdog is not None:
+            self.watchdog.stop()
+        if self.governor is not None:
+            self.governor.close()
+        for stop in list(self._channel_stops.values()):
+            stop.set()
+        for wakeup in list(self._wakeups.values()):
+            wakeup.set()
+        if self._loop is not None and self._async_stop is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._async_stop.set)
+            except RuntimeError:
+                pass
+
+    def _drain(self) -> bool:
+        """
+        Czeka na zakończenie trwających sprawdzeń, najwyżej shutdown_timeout sekund
+        
+        Returns:
+            bool: True jeśli wszystkie sprawdzenia zakończyły się w czasie
+        """
+        timeout = self.config.get("shutdown_timeout", DEFAULT_SHUTDOWN_TIMEOUT)
+        if self.scheduler is not None:
+            return self.scheduler.stop(timeout)
+        if self.engine == "asyncio":
+            return self._async_pending == 0
+        
+        deadline = time.monotonic() + timeout
+        for thread in list(self._threads.values()):
+            thread.join(max(0.0, deadline - time.monotonic()))
+        return not any(thread.is_alive() for thread in self._threads.values())
+
+    def reload_config(self) -> None:
+        """
+        Wczytuje zmienioną konfigurację i stosuje różnice bez restartu
+        
+        Nowe kanały zaczynają być monitorowane, usunięte przestają. Czasy
+        oczekiwania, wiadomości i token działają od razu, bo są odczytywane
+        przy każdym sprawdzeniu. Pola z RESTART_REQUIRED_FIELDS wymagają
+        ponownego uruchomienia. Błędna konfiguracja jest ignorowana.
+        """
+        with self._reload_lock:
+            try:
+                new_config = self.read_config()
+            except (OSError, ValueError) as e:
+                self.log.error(f"BŁĄD przeładowania konfiguracji (pozostaje poprzednia): {str(e)}")
+                return
+            
+            old_channels = set(self.config["channels"])
+            new_channels = set(new_config["channels"])
+            for field in RESTART_REQUIRED_FIELDS:
+                if new_config.get(field) != self.config.get(field):
+                    self.log.info(f"Zmiana pola '{field}' zadziała dopiero po ponownym uruchomieniu")
+                    if field in self.config:
+                        new_config[field] = self.config[field]
+                    else:
+                        new_config.pop(field)
+            
+            self.config = new_config
+            self.send_template = SendTemplate(new_config["authorization"], new_config["messages"])
+            for channel_name in sorted(old_channels - new_channels):
+                self.stop_channel(channel_name)
+            for channel_name in sorted(new_channels - old_channels):
+                self.start_channel(channel_name)
+            
+            self.log.info(f"Przeładowano konfigurację: +{len(new_channels - old_channels)} "
+                          f"/ -{len(old_channels - new_channels)} kanałów")
+
+    def _start_config_watcher(self) -> None:
+        """
+        Uruchamia obserwację pliku konfiguracyjnego (chyba że "hot_reload": false)
+        """
+        if not self.config.get("hot_reload", True):
+            return
+        
+        self.config_watcher = ConfigWatcher(self.config_path, self.reload_config, on_error=self.log.error)
+        self.config_watcher.start()
+
+    def _start_watchdog(self, delays: Dict[str, float]) -> None:
+        """
+        Uruchamia strażnika zawieszonych kanałów (pierwszy odstęp kanału to
+        jego opóźnienie startowe, nie mniej niż livestream_inactive)
+        
+        Args:
+            delays (Dict[str, float]): Kanał -> opóźnienie pierwszego sprawdzenia
+        """
+        if self.watchdog is None:
+            return
+        
+        for channel_name, delay in delays.items():
+            self.watchdog.beat(channel_name, max(delay, self.config["wait_times"]["livestream_inactive"]))
+        self.watchdog.start()
+
+    def _ramp_up(self) -> float:
+        """
+        Zwraca długość okna rozruchu (domyślnie livestream_inactive)
+        """
+        return self.config.get("schedule_state", {}).get("ramp_up", self.config["wait_times"]["livestream_inactive"])
+
+    def plan_startup(self, channels: List[str]) -> Dict[str, float]:
+        """
+        Przywraca zapisany harmonogram i wylicza opóźnienia pierwszych sprawdzeń
+        
+        Kanały wracają do zapisanych terminów i statusu live, a pozostałe są
+        rozkładane równomiernie w oknie rozruchu - restart nie wysyła setek
+        zapytań w tej samej sekundzie.
+        
+        Args:
+            channels (List[str]): Lista kanałów do monitorowania
+            
+        Returns:
+            Dict[str, float]: Kanał -> opóźnienie pierwszego sprawdzenia w sekundach
+        """
+        saved = self.schedule_state.load() if self.schedule_state is not None else {}
+        for channel_name in channels:
+            live = saved.get(channel_name, {}).get("live")
+            if isinstance(live, bool):
+                self.channels.get(channel_name).live = live
+        
+        wait_times = self.config["wait_times"]
+        max_delay = max(wait_times["livestream_active"]["max"], wait_times["livestream_inactive"],
+                        self.config.get("adaptive_polling", {}).get("max_wait", 0))
+        delays = plan_startup(channels, saved, self.wall_clock(), self._ramp_up(), max_delay)
+        now = self.clock()
+        for channel_name, delay in delays.items():
+            self.channels.get(channel_name).next_due = now + delay
+        
+        resumed = sum(1 for channel_name in channels if channel_name in saved)
+        if resumed:
+            print(f"Przywrócono harmonogram {resumed} kanałów z {self.schedule_state.path}")
+        return delays
+
+    def save_schedule_state(self) -> None:
+        """
+        Zapisuje termin następnego sprawdzenia i status live każdego kanału
+        """
+        if self.schedule_state is None:
+            return
+        
+        now = self.clock()
+        wall_now = self.wall_clock()
+        channels = set(self.config["channels"])
+        entries = {
+            state.name: {"next_due": round(wall_now + state.next_due - now, 3), "live": state.live}
+            for state in self.channels
+            if state.name in channels and state.next_due is not None
+        }
+        try:
+            self.schedule_state.save(entries)
+        except OSError as e:
+            self.log.error(f"BŁĄD zapisu harmonogramu: {str(e)}")
+
+    def _start_state_saver(self) -> None:
+        """
+        Uruchamia okresowy zapis harmonogramu (co schedule_state.interval sekund)
+        """
+        if self.schedule_state is None:
+            return
+        
+        interval = self.config.get("schedule_state", {}).get("interval", DEFAULT_SAVE_INTERVAL)
+        
+        def save_loop() -> None:
+            while not self._stop_event.wait(interval):
+                self.save_schedule_state()
+        
+        threading.Thread(target=save_loop, name="kick-schedule-state", daemon=True).start()
+
+    def _start_scheduler(self, delays: Dict[str, float]) -> None:
+        """
+        Uruchamia centralny harmonogram z zaplanowanymi pierwszymi sprawdzeniami
+        
+        Args:
+            delays (Dict[str, float]): Kanał -> opóźnienie pierwszego sprawdzenia
+        """
+        self.scheduler = PollScheduler(self.poll_channel, self.config.get("max_workers", DEFAULT_MAX_WORKERS),
+                                       max_hung=self.config.get("watchdog", {}).get("max_hung"))
+        for channel_name, delay in delays.items():
+            self.scheduler.add(channel_name, delay)
+        self.scheduler.start()
 
     def start_monitoring(self) -> None:
         """
-        Rozpoczyna monitorowanie wszystkich kanałów w osobnych wątkach
+        Rozpoczyna monitorowanie wszystkich kanałów
+        
+        Domyślnie każdy kanał dostaje osobny wątek. Przy "engine": "asyncio"
+        wszystkie kanały działają jako zadania w jednej pętli zdarzeń, a przy
+        "engine": "scheduler" sprawdzenia planuje jeden wspólny harmonogram.
         """
         channels = self.config["channels"]
         
@@ -219,19 +1515,99 @@ class KickPointsCollector:
         print("Naciśnij Ctrl+C aby zatrzymać program")
         print("=" * 60)
         
-        threads = []
-        for channel_name in channels:
-            thread = threading.Thread(target=self.monitor_channel, args=(channel_name,), daemon=True)
-            threads.append(thread)
-            thread.start()
+        self._start_live_events()
+        self._start_metrics_server()
+        self._start_status_api()
+        self._start_memory_report()
+        delays = self.plan_startup(channels)
+        self._start_state_saver()
         
         try:
-            while True:
-                time.sleep(1)
+            if self.engine == "asyncio":
+                # asyncio jest importowane tylko dla tego silnika (ok. 50 ms przy starcie)
+                import asyncio
+                asyncio.run(self._monitor_all_async(delays))
+            else:
+                if self.engine == "scheduler":
+                    self._start_scheduler(delays)
+                else:
+                    for channel_name, delay in delays.items():
+                        self.start_channel(channel_name, delay)
+                self._start_watchdog(delays)
+                self._start_config_watcher()
+                
+                # wait z limitem czasu - bez niego Ctrl+C nie przerwie oczekiwania na Windows
+                while not self._stop_event.wait(0.5):
+                    pass
         except KeyboardInterrupt:
-            print("\n" + "=" * 60)
-            print("Zatrzymywanie programu...")
-            print("Dziękujemy za użycie Kick Points Collector!")
+            pass
+        
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """
+        Zatrzymuje wszystkie kanały, czeka na trwające zapytania (najwyżej
+        shutdown_timeout sekund) i wypisuje podsumowanie
+        """
+        self.request_stop()
+        
+        if self.config_watcher is not None:
+            self.config_watcher.stop()
+        if self.status_api is not None:
+            self.status_api.stop()
+        if self.metrics_server is not None:
+            self.metrics_server.shutdown()
+            self.metrics_server.server_close()
+            self.metrics_server = None
+        if self.live_watcher is not None:
+            self.live_watcher.stop()
+        drained = self._drain()
+        self.save_schedule_state()
+        # historia przed logiem - błąd ostatniego zapisu historii trafia jeszcze do logu
+        if self.history is not None:
+            self.history.close()
+        self.log.close()
+        
+        print("\n" + "=" * 60)
+        print("Zatrzymywanie programu...")
+        stats = self.transport.stats()
+        print(f"Zapytania HTTP: {stats['requests']} | Połączenia: {stats['connections_opened']} | "
+              f"Ponowne użycie: {stats['reuse_ratio']:.0%}")
+        self.transport.close()
+        status = self.status_stats.summary()
+        print(f"Sprawdzenia statusu: {status['polls']} | Średnio {status['wire_bytes_per_poll']:.0f} B na łączu "
+              f"({status['body_bytes_per_poll']:.0f} B po rozpakowaniu) | "
+              f"Przetwarzanie: {status['parse_us_per_poll']:.1f} µs")
+        if self.revalidation is not None:
+            revalidation = self.revalidation.stats()
+            print(f"Odpowiedzi 304: {revalidation['hit_ratio']:.0%} | "
+                  f"Zaoszczędzono {revalidation['bytes_saved']} B")
+        if self.governor is not None:
+            queues = self.governor.stats()
+            print("Oczekiwanie na limit zapytań: " + " | ".join(
+                f"{endpoint} {queue['waited_seconds']:.1f}s" for endpoint, queue in queues.items()))
+        if self.history is not None:
+            print(f"Historia: zapisano {self.history.written} wpisów w {self.history.path}")
+            if self.history.dropped:
+                print(f"UWAGA: Historia odrzuciła {self.history.dropped} wpisów (przepełniona kolejka "
+                      f"lub błąd zapisu bazy)")
+        retries = self.retry.stats()
+        print(f"Ponowienia zapytań: {sum(retry['retries'] for retry in retries.values())} | "
+              f"Otwarcia wyłącznika: {sum(retry['circuit_opened'] for retry in retries.values())}")
+        if self.memory_report is not None:
+            self.print_memory_report()
+        if self.watchdog is not None and self.watchdog.restarts:
+            print(f"UWAGA: Ponownie uruchomiono zawieszone kanały {self.watchdog.restarts} razy")
+        if self.watchdog is not None and self.watchdog.failed_restarts:
+            print(f"UWAGA: {self.watchdog.failed_restarts} razy nie można było uruchomić ponownie zawieszonego "
+                  f"kanału (wszystkie zapasowe wątki zajęte)")
+        if self.tracer.enabled:
+            self.tracer.flush()
+            print(f"Zapisano ślad wykonania: {self.config['tracing'].get('path', DEFAULT_TRACE_PATH)}")
+        if not drained:
+            print("UWAGA: Część zapytań nie zakończyła się w czasie shutdown_timeout")
+        print(f"Zatrzymano w {time.monotonic() - self._stop_requested:.2f}s")
+        print("Dziękujemy za użycie Kick Points Collector!")
 
 
 def main():
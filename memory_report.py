@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Raport pamięci (tracemalloc) do planowania liczby kanałów
+
+Przy włączonej sekcji "memory_report" bot śledzi alokacje od startu.
+Przed uruchomieniem kanałów zapisywany jest punkt odniesienia, a raport
+podaje pamięć zajętą od tego czasu w przeliczeniu na jeden kanał oraz
+miejsca w kodzie, które zajmują jej najwięcej. Śledzenie spowalnia
+alokacje, więc tryb jest przeznaczony do pomiarów, nie do stałej pracy.
+
+Autor: deem
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    # tracemalloc jest importowane dopiero przy włączonym raporcie pamięci
+    import tracemalloc
+
+
+DEFAULT_REPORT_INTERVAL = 600
+DEFAULT_REPORT_TOP = 10
+DEFAULT_REPORT_FRAMES = 1
+
+
+class MemoryReport:
+    """
+    Pomiar pamięci zajmowanej przez kanały na podstawie tracemalloc
+    """
+
+    def __init__(self, frames: int = DEFAULT_REPORT_FRAMES):
+        """
+        Uruchamia śledzenie alokacji
+
+        Args:
+            frames (int): Liczba ramek stosu zapisywanych dla każdej alokacji
+        """
+        import tracemalloc
+
+        self.frames = frames
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+        self._baseline: Optional['tracemalloc.Snapshot'] = None
+
+    def mark_baseline(self) -> None:
+        """
+        Zapisuje punkt odniesienia (przed uruchomieniem kanałów)
+        """
+        self._baseline = self._snapshot()
+
+    def _snapshot(self) -> 'tracemalloc.Snapshot':
+        import tracemalloc
+
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            tracemalloc.Filter(False, "<unknown>")
+        ))
+
+    def report(self, channel_count: int, top: int = DEFAULT_REPORT_TOP) -> Dict[str, Any]:
+        """
+        Zwraca bieżący raport pamięci
+
+        Args:
+            channel_count (int): Liczba monitorowanych kanałów
+            top (int): Liczba miejsc alokacji w raporcie
+
+        Returns:
+            Dict[str, Any]: Pamięć śledzona łącznie i od punktu odniesienia,
+            średnio na kanał, szczyt oraz największe miejsca alokacji
+        """
+        import tracemalloc
+
+        snapshot = self._snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        key = "lineno" if self.frames <= 1 else "traceback"
+        if self._baseline is not None:
+            stats = snapshot.compare_to(self._baseline, key)
+            retained = sum(stat.size_diff for stat in stats)
+            sites = sorted(stats, key=lambda stat: stat.size_diff, reverse=True)[:top]
+            top_sites: List[Dict[str, Any]] = [
+                {"site": _format_site(stat.traceback), "bytes": stat.size_diff, "count": stat.count_diff}
+                for stat in sites
+            ]
+        else:
+            stats = snapshot.statistics(key)
+            retained = sum(stat.size for stat in stats)
+            top_sites = [
+                {"site": _format_site(stat.traceback), "bytes": stat.size, "count": stat.count}
+                for stat in stats[:top]
+            ]
+
+        return {
+            "channels": channel_count,
+            "traced_bytes": current,
+            "peak_bytes": peak,
+            "retained_bytes": retained,
+            "bytes_per_channel": round(retained / channel_count) if channel_count else 0,
+            "top": top_sites
+        }
+
+    @staticmethod
+    def format(report: Dict[str, Any]) -> str:
+        """
+        Formatuje raport do wypisania w konsoli
+
+        Args:
+            report (Dict[str, Any]): Raport z report()
+
+        Returns:
+            str: Tekst raportu
+        """
+        lines = [
+            f"Pamięć: {report['retained_bytes'] / 1024:.0f} KiB od startu kanałów | "
+            f"{report['bytes_per_channel']} B na kanał ({report['channels']} kanałów) | "
+            f"Śledzone: {report['traced_bytes'] / 1024:.0f} KiB (szczyt {report['peak_bytes'] / 1024:.0f} KiB)"
+        ]
+        for site in report["top"]:
+            lines.append(f"  {site['bytes'] / 1024:>9.1f} KiB {site['count']:>8} bloków  {site['site']}")
+        return "\n".join(lines)
+
+    def stop(self) -> None:
+        """
+        Kończy śledzenie alokacji
+        """
+        import tracemalloc
+
+        tracemalloc.stop()
+
+
+def _format_site(traceback: 'tracemalloc.Traceback') -> str:
+    return " <- ".join(f"{frame.filename}:{frame.lineno}" for frame in reversed(traceback))
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Metryki w formacie Prometheus i wbudowany serwer /metrics
+
+Zapis metryk w gorącej ścieżce nie używa blokad: każdy wątek zwiększa
+własną kopię liczników (threading.local), a dopiero odczyt /metrics sumuje
+kopie wszystkich wątków.
+
+Autor: deem
+"""
+
+import bisect
+import threading
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    # http.server jest importowane dopiero przy uruchomieniu serwera /metrics
+    from http.server import ThreadingHTTPServer
+
+
+DEFAULT_METRICS_HOST = '127.0.0.1'
+DEFAULT_METRICS_PORT = 9105
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+LAG_BUCKETS = (0.001, 0.01, 0.1, 0.5, 1.0, 5.0, 30.0, 60.0)
+
+
+class ShardedHistogram:
+    """
+    Histogram z osobnymi licznikami dla każdego wątku
+    """
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        """
+        Inicjalizacja histogramu
+
+        Args:
+            buckets (Tuple[float, ...]): Rosnące górne granice przedziałów
+        """
+        self.buckets = buckets
+        self._local = threading.local()
+        self._shards: List[List[float]] = []
+        self._lock = threading.Lock()
+
+    def _shard(self) -> List[float]:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = [0] * (len(self.buckets) + 1) + [0.0]
+            self._local.shard = shard
+            with self._lock:
+                self._shards.append(shard)
+        return shard
+
+    def observe(self, value: float) -> None:
+        """
+        Dodaje obserwację (bez blokad)
+
+        Args:
+            value (float): Wartość obserwacji
+        """
+        shard = self._shard()
+        shard[bisect.bisect_left(self.buckets, value)] += 1
+        shard[-1] += value
+
+    def snapshot(self) -> Tuple[List[int], int, float]:
+        """
+        Sumuje liczniki wszystkich wątków
+
+        Returns:
+            Tuple[List[int], int, float]: (skumulowane liczniki przedziałów, liczba obserwacji, suma)
+        """
+        with self._lock:
+            shards = list(self._shards)
+
+        counts = [0] * (len(self.buckets) + 1)
+        total = 0.0
+        for shard in shards:
+            for index in range(len(counts)):
+                counts[index] += shard[index]
+            total += shard[-1]
+
+        cumulative = []
+        running = 0
+        for count in counts:
+            running += count
+            cumulative.append(running)
+        return cumulative, running, total
+
+
+class ShardedCounter:
+    """
+    Licznik z osobnymi wartościami dla każdego wątku
+    """
+
+    def __init__(self):
+        """
+        Inicjalizacja licznika
+        """
+        self._local = threading.local()
+        self._shards: List[List[int]] = []
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        """
+        Zwiększa licznik (bez blokad)
+
+        Args:
+            amount (int): Wartość do dodania
+        """
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = [0]
+            self._local.shard = shard
+            with self._lock:
+                self._shards.append(shard)
+        shard[0] += amount
+
+    def value(self) -> int:
+        """
+        Zwraca sumę liczników wszystkich wątków
+
+        Returns:
+            int: Wartość licznika
+        """
+        with self._lock:
+            return sum(shard[0] for shard in self._shards)
+
+
+class MetricsRegistry:
+    """
+    Zbiór metryk bota i ich renderowanie w formacie tekstowym Prometheus
+    """
+
+    def __init__(self, gauges: Optional[Callable[[], Dict[str, float]]] = None):
+        """
+        Inicjalizacja rejestru
+
+        Args:
+            gauges (Optional[Callable[[], Dict[str, float]]]): Funkcja zwracająca
+                bieżące wartości wskaźników (nazwa metryki z etykietami -> wartość)
+        """
+        self.gauges = gauges
+        self._latency: Dict[str, ShardedHistogram] = {}
+        self._codes: Dict[Tuple[str, str], ShardedCounter] = {}
+        self._queue_wait: Dict[str, ShardedHistogram] = {}
+        self._lock = threading.Lock()
+        self.schedule_lag = ShardedHistogram(LAG_BUCKETS)
+
+    def observe_request(self, endpoint: str, seconds: float, code: str) -> None:
+        """
+        Rejestruje czas trwania i kod odpowiedzi zapytania
+
+        Args:
+            endpoint (str): Nazwa punktu końcowego (np. channel_status, message_send)
+            seconds (float): Czas trwania zapytania
+            code (str): Kod odpowiedzi HTTP lub "error"
+        """
+        histogram = self._latency.get(endpoint)
+        if histogram is None:
+            with self._lock:
+                histogram = self._latency.setdefault(endpoint, ShardedHistogram(LATENCY_BUCKETS))
+        histogram.observe(seconds)
+
+        counter = self._codes.get((endpoint, code))
+        if counter is None:
+            with self._lock:
+                counter = self._codes.setdefault((endpoint, code), ShardedCounter())
+        counter.inc()
+
+    def observe_queue_wait(self, endpoint: str, seconds: float) -> None:
+        """
+        Rejestruje czas oczekiwania zapytania w kolejce ogranicznika
+
+        Args:
+            endpoint (str): Klasa punktów końcowych (np. channel_status)
+            seconds (float): Czas oczekiwania
+        """
+        histogram = self._queue_wait.get(endpoint)
+        if histogram is None:
+            with self._lock:
+                histogram = self._queue_wait.setdefault(endpoint, ShardedHistogram(LAG_BUCKETS))
+        histogram.observe(seconds)
+
+    def render(self) -> str:
+        """
+        Renderuje wszystkie metryki w formacie tekstowym Prometheus
+
+        Returns:
+            str: Treść odpowiedzi /metrics
+        """
+        lines = [
+            "# HELP kick_request_duration_seconds Czas trwania zapytań do Kick.com",
+            "# TYPE kick_request_duration_seconds histogram"
+        ]
+        with self._lock:
+            latency = dict(self._latency)
+            codes = dict(self._codes)
+            queue_wait = dict(self._queue_wait)
+
+        for endpoint, histogram in sorted(latency.items()):
+            lines.extend(_render_histogram("kick_request_duration_seconds", histogram, f'endpoint="{endpoint}"'))
+
+        lines.append("# HELP kick_responses_total Odpowiedzi Kick.com według kodu")
+        lines.append("# TYPE kick_responses_total counter")
+        for (endpoint, code), counter in sorted(codes.items()):
+            lines.append(f'kick_responses_total{{endpoint="{endpoint}",code="{code}"}} {counter.value()}')
+
+        lines.append("# HELP kick_schedule_lag_seconds Opóźnienie sprawdzeń względem planu")
+        lines.append("# TYPE kick_schedule_lag_seconds histogram")
+        lines.extend(_render_histogram("kick_schedule_lag_seconds", self.schedule_lag, ""))
+
+        lines.append("# HELP kick_rate_limit_wait_seconds Czas oczekiwania zapytań w kolejce ogranicznika")
+        lines.append("# TYPE kick_rate_limit_wait_seconds histogram")
+        for endpoint, histogram in sorted(queue_wait.items()):
+            lines.extend(_render_histogram("kick_rate_limit_wait_seconds", histogram, f'endpoint="{endpoint}"'))
+
+        if self.gauges is not None:
+            for name, value in sorted(self.gauges().items()):
+                lines.append(f"{name} {value}")
+
+        return "\n".join(lines) + "\n"
+
+    def serve(self, host: str = DEFAULT_METRICS_HOST, port: int = DEFAULT_METRICS_PORT) -> 'ThreadingHTTPServer':
+        """
+        Uruchamia serwer HTTP z /metrics w osobnym wątku
+
+        Args:
+            host (str): Adres nasłuchiwania
+            port (int): Port nasłuchiwania
+
+        Returns:
+            ThreadingHTTPServer: Uruchomiony serwer
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="kick-metrics", daemon=True).start()
+        return server
+
+
+def _render_histogram(name: str, histogram: ShardedHistogram, labels: str) -> List[str]:
+    cumulative, count, total = histogram.snapshot()
+    prefix = f"{labels}," if labels else ""
+    lines = []
+    for bound, value in zip(histogram.buckets, cumulative):
+        lines.append(f'{name}_bucket{{{prefix}le="{bound}"}} {value}')
+    lines.append(f'{name}_bucket{{{prefix}le="+Inf"}} {count}')
+    suffix = f"{{{labels}}}" if labels else ""
+    lines.append(f"{name}_sum{suffix} {total}")
+    lines.append(f"{name}_count{suffix} {count}")
+    return lines
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Wspólne elementy atrap API Kick.com używanych przez benchmark i symulację
+
+Moduł nie importuje niczego zależnego od systemu, więc symulację można
+uruchomić także tam, gdzie benchmark nie działa (np. Windows bez modułu
+resource).
+
+Autor: deem
+"""
+
+import re
+from typing import List
+
+
+CHANNEL_PATH = re.compile(r'^/api/v2/channels/([^/]+)(/livestream)?$')
+SEND_PATH = re.compile(r'^/api/v2/messages/send/(\d+)$')
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """
+    Zwraca percentyl z listy próbek
+
+    Args:
+        samples (List[float]): Próbki
+        q (float): Kwantyl 0-1
+
+    Returns:
+        float: Wartość percentyla (0 dla pustej listy)
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[int(q * (len(ordered) - 1))]
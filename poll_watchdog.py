@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Limity czasu sprawdzeń i wykrywanie zawieszonych kanałów
+
+Każde zapytanie ma limit czasu połączenia i odczytu, a całe sprawdzenie
+kanału (razem z ponowieniami) ma termin, po którym kolejne zapytania nie są
+już wysyłane. Strażnik (watchdog) pilnuje, aby pętla każdego kanału
+regularnie kończyła sprawdzenia - kanał, który nie zgłosił się w czasie
+równym wielokrotności oczekiwanego odstępu, jest zgłaszany i uruchamiany
+ponownie, zamiast po cichu zniknąć z monitorowania.
+
+Autor: deem
+"""
+
+import itertools
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    # concurrent.futures jest importowane dopiero przy tworzeniu puli
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 15.0
+DEFAULT_POLL_DEADLINE = 60.0
+DEFAULT_WATCHDOG_FACTOR = 3.0
+DEFAULT_WATCHDOG_INTERVAL = 30.0
+
+
+class PollDeadlineExceeded(Exception):
+    """
+    Upłynął termin sprawdzenia kanału - kolejne zapytania nie są wysyłane
+    """
+
+
+class WorkerPoolExhausted(Exception):
+    """
+    Zbyt wiele wątków roboczych jest zajętych przez zawieszone sprawdzenia,
+    aby zastąpić kolejne
+    """
+
+    def __init__(self, hung: int):
+        self.hung = hung
+        super().__init__(f"zawieszone sprawdzenia zajmują {hung} wątków roboczych")
+
+
+class WorkerPool:
+    """
+    Pula wątków roboczych, która zastępuje wątki zajęte porzuconymi sprawdzeniami
+
+    Zawieszonego wywołania nie da się przerwać, więc jego wątek pozostaje
+    zajęty. Po porzuceniu sprawdzenia bieżąca pula jest zamykana (jej wątki
+    kończą pracę po wykonaniu przyjętych zadań), a nowe zadania trafiają do
+    nowej puli o pełnym rozmiarze - zawieszone wątki nie zmniejszają liczby
+    równoległych sprawdzeń. Liczba zastąpionych wątków jest ograniczona.
+    """
+
+    def __init__(self, max_workers: int, max_hung: Optional[int] = None, thread_name_prefix: str = "kick-poll"):
+        """
+        Inicjalizacja puli
+
+        Args:
+            max_workers (int): Maksymalna liczba równoległych sprawdzeń
+            max_hung (Optional[int]): Ile zawieszonych wątków można zastąpić (domyślnie max_workers)
+            thread_name_prefix (str): Przedrostek nazw wątków
+        """
+        self.max_workers = max_workers
+        self.max_hung = max_workers if max_hung is None else max_hung
+        self.thread_name_prefix = thread_name_prefix
+        self.replaced = 0
+        self._running: Dict[int, str] = {}
+        self._hung: Set[int] = set()
+        self._tickets = itertools.count()
+        self._lock = threading.Lock()
+        self._executor = self._create_executor()
+
+    def _create_executor(self) -> 'ThreadPoolExecutor':
+        from concurrent.futures import ThreadPoolExecutor
+
+        return ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.thread_name_prefix)
+
+    def submit(self, channel_name: str, fn: Callable[..., Any], *args: Any) -> 'Future':
+        """
+        Zleca sprawdzenie kanału
+
+        Args:
+            channel_name (str): Nazwa kanału (do porzucenia przez abandon)
+            fn (Callable[..., Any]): Wywoływana funkcja
+            *args: Argumenty funkcji
+
+        Returns:
+            Future: Wynik wywołania
+
+        Raises:
+            RuntimeError: Gdy pula została zamknięta
+        """
+        with self._lock:
+            ticket = next(self._tickets)
+            self._running[ticket] = channel_name
+            try:
+                return self._executor.submit(self._run, ticket, fn, *args)
+            except RuntimeError:
+                del self._running[ticket]
+                raise
+
+    def _run(self, ticket: int, fn: Callable[..., Any], *args: Any) -> Any:
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self._running.pop(ticket, None)
+                self._hung.discard(ticket)
+
+    def abandon(self, channel_name: str) -> int:
+        """
+        Porzuca trwające sprawdzenia kanału i zastępuje zajęte przez nie wątki
+
+        Args:
+            channel_name (str): Nazwa kanału
+
+        Returns:
+            int: Liczba porzuconych sprawdzeń
+
+        Raises:
+            WorkerPoolExhausted: Gdy zastąpienie przekroczyłoby max_hung
+                (sprawdzenia nie są wtedy porzucane)
+        """
+        with self._lock:
+            tickets = [ticket for ticket, name in self._running.items()
+                       if name == channel_name and ticket not in self._hung]
+            if not tickets:
+                return 0
+            if len(self._hung) + len(tickets) > self.max_hung:
+                raise WorkerPoolExhausted(len(self._hung))
+
+            self._hung.update(tickets)
+            previous = self._executor
+            self._executor = self._create_executor()
+            self.replaced += len(tickets)
+        previous.shutdown(wait=False)
+        return len(tickets)
+
+    @property
+    def hung(self) -> int:
+        """
+        Liczba wątków zajętych przez porzucone, wciąż trwające sprawdzenia
+        """
+        with self._lock:
+            return len(self._hung)
+
+    def shutdown(self, cancel_futures: bool = False) -> None:
+        """
+        Zamyka pulę bez czekania na trwające sprawdzenia
+
+        Args:
+            cancel_futures (bool): Czy anulować sprawdzenia oczekujące na wątek
+        """
+        with self._lock:
+            executor = self._executor
+        executor.shutdown(wait=False, cancel_futures=cancel_futures)
+
+
+class Watchdog:
+    """
+    Wykrywa kanały, których pętla przestała kończyć sprawdzenia
+    """
+
+    def __init__(self, on_stuck: Callable[[str, float], bool], factor: float = DEFAULT_WATCHDOG_FACTOR,
+                 grace: float = DEFAULT_POLL_DEADLINE, check_interval: float = DEFAULT_WATCHDOG_INTERVAL,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Inicjalizacja strażnika
+
+        Args:
+            on_stuck (Callable[[str, float], bool]): Wywoływane z (nazwa kanału, sekundy
+                od ostatniego zgłoszenia) dla zawieszonego kanału; zwraca True,
+                jeśli kanał uruchomiono ponownie. Kanał usunięty w tym wywołaniu
+                (remove) nie jest liczony ani jako uruchomiony, ani jako nieudany
+            factor (float): Wielokrotność oczekiwanego odstępu, po której kanał uznaje się za zawieszony
+            grace (float): Dodatkowy czas na samo sprawdzenie (termin sprawdzenia)
+            check_interval (float): Co ile sekund sprawdzać kanały
+            clock (Callable[[], float]): Zegar monotoniczny
+        """
+        self.on_stuck = on_stuck
+        self.factor = factor
+        self.grace = grace
+        self.check_interval = check_interval
+        self.clock = clock
+        self.restarts = 0
+        self.failed_restarts = 0
+        self._seen: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def beat(self, channel_name: str, expected_interval: float) -> None:
+        """
+        Zgłasza zakończenie sprawdzenia kanału
+
+        Args:
+            channel_name (str): Nazwa kanału
+            expected_interval (float): Czas do następnego sprawdzenia w sekundach
+        """
+        with self._lock:
+            self._seen[channel_name] = (self.clock(), expected_interval)
+
+    def remove(self, channel_name: str) -> None:
+        """
+        Przestaje pilnować kanału (np. usuniętego z konfiguracji)
+
+        Args:
+            channel_name (str): Nazwa kanału
+        """
+        with self._lock:
+            self._seen.pop(channel_name, None)
+
+    def overdue(self) -> List[Tuple[str, float]]:
+        """
+        Zwraca kanały, które nie zgłosiły się w wyznaczonym czasie
+
+        Returns:
+            List[Tuple[str, float]]: (nazwa kanału, sekundy od ostatniego zgłoszenia)
+        """
+        now = self.clock()
+        with self._lock:
+            return [
+                (channel_name, now - seen)
+                for channel_name, (seen, expected) in self._seen.items()
+                if now - seen > self.factor * expected + self.grace
+            ]
+
+    def check(self) -> int:
+        """
+        Zgłasza zawieszone kanały i daje im nowy termin (od chwili ponownego
+        uruchomienia lub nieudanej próby)
+
+        Returns:
+            int: Liczba zgłoszonych kanałów
+        """
+        stuck = self.overdue()
+        for channel_name, silent in stuck:
+            with self._lock:
+                if channel_name not in self._seen:
+                    continue
+                self._seen[channel_name] = (self.clock(), self._seen[channel_name][1])
+            restarted = self.on_stuck(channel_name, silent)
+            with self._lock:
+                if channel_name not in self._seen:
+                    continue
+                if restarted:
+                    self.restarts += 1
+                else:
+                    self.failed_restarts += 1
+        return len(stuck)
+
+    def start(self) -> None:
+        """
+        Uruchamia okresowe sprawdzanie w osobnym wątku
+        """
+        self._thread = threading.Thread(target=self._run, name="kick-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Zatrzymuje wątek strażnika
+        """
+        self._stop.set()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.check_interval):
+            try:
+                self.check()
+            except Exception:
+                pass
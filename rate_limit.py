@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Globalny limit zapytań do Kick.com (token bucket)
+
+Wszystkie zapytania procesu przechodzą przez wspólny ogranicznik z osobnym
+wiadrem żetonów dla każdej klasy punktów końcowych (sprawdzanie statusu,
+wysyłanie wiadomości). Łączna liczba zapytań nie rośnie więc z liczbą
+kanałów, tylko jest trzymana poniżej ustawionego limitu. Gdy żetonów brakuje,
+zapytania czekają w kolejce priorytetowej - sprawdzenia kanałów live mają
+pierwszeństwo przed sprawdzeniami kanałów offline.
+
+Autor: deem
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+DEFAULT_RATE_LIMITS = {
+    "channel_status": {"rate": 20.0, "burst": 40},
+    "message_send": {"rate": 2.0, "burst": 5}
+}
+
+PRIORITY_LIVE = 0
+PRIORITY_OFFLINE = 1
+
+
+class RateLimiterClosed(Exception):
+    """
+    Ogranicznik został zamknięty (zatrzymywanie bota) w czasie oczekiwania
+    """
+
+
+class TokenBucket:
+    """
+    Wiadro żetonów z kolejką oczekujących uporządkowaną według priorytetu
+    """
+
+    def __init__(self, rate: float, burst: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Inicjalizacja wiadra
+
+        Args:
+            rate (float): Liczba żetonów dodawanych na sekundę
+            burst (float): Pojemność wiadra (największa seria zapytań bez czekania)
+            clock (Callable[[], float]): Zegar monotoniczny
+        """
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._waiters: List[Tuple[int, int]] = []
+        self._counter = itertools.count()
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, priority: int = PRIORITY_OFFLINE) -> float:
+        """
+        Pobiera żeton, czekając w kolejce, jeśli wiadro jest puste
+
+        Args:
+            priority (int): Priorytet (mniejszy = obsługiwany wcześniej)
+
+        Returns:
+            float: Czas oczekiwania w kolejce w sekundach
+
+        Raises:
+            RateLimiterClosed: Gdy ogranicznik zamknięto w trakcie oczekiwania
+        """
+        start = self.clock()
+        with self._cond:
+            ticket = (priority, next(self._counter))
+            heapq.heappush(self._waiters, ticket)
+            try:
+                while True:
+                    if self._closed:
+                        raise RateLimiterClosed("Ogranicznik zapytań został zamknięty")
+
+                    now = self.clock()
+                    self._refill(now)
+                    if self._waiters[0] == ticket:
+                        if self._tokens >= 1:
+                            self._tokens -= 1
+                            return now - start
+                        self._cond.wait((1 - self._tokens) / self.rate)
+                    else:
+                        self._cond.wait()
+            finally:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+
+    @property
+    def waiting(self) -> int:
+        """
+        Liczba zapytań oczekujących w kolejce
+        """
+        return len(self._waiters)
+
+    def close(self) -> None:
+        """
+        Przerywa oczekiwanie wszystkich zapytań w kolejce
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+class RateGovernor:
+    """
+    Ogranicznik zapytań całego procesu - jedno wiadro na klasę punktów końcowych
+    """
+
+    def __init__(self, limits: Dict[str, Dict[str, float]], observe_wait: Optional[Callable[[str, float], None]] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Inicjalizacja ogranicznika
+
+        Args:
+            limits (Dict[str, Dict[str, float]]): Klasa punktów końcowych -> {"rate", "burst"}
+            observe_wait (Optional[Callable[[str, float], None]]): Wywoływane z czasem oczekiwania
+                każdego zapytania (np. do histogramu metryk)
+            clock (Callable[[], float]): Zegar monotoniczny
+        """
+        self.buckets = {
+            endpoint: TokenBucket(limit["rate"], limit.get("burst", limit["rate"]), clock)
+            for endpoint, limit in limits.items()
+        }
+        self.observe_wait = observe_wait
+        self._waited: Dict[str, float] = {endpoint: 0.0 for endpoint in limits}
+        self._lock = threading.Lock()
+
+    def acquire(self, endpoint: str, priority: int = PRIORITY_OFFLINE) -> float:
+        """
+        Czeka na pozwolenie wysłania zapytania
+
+        Args:
+            endpoint (str): Klasa punktów końcowych (np. channel_status)
+            priority (int): PRIORITY_LIVE lub PRIORITY_OFFLINE
+
+        Returns:
+            float: Czas oczekiwania w sekundach (0 dla klas bez limitu)
+        """
+        bucket = self.buckets.get(endpoint)
+        if bucket is None:
+            return 0.0
+
+        waited = bucket.acquire(priority)
+        with self._lock:
+            self._waited[endpoint] += waited
+        if self.observe_wait is not None:
+            self.observe_wait(endpoint, waited)
+        return waited
+
+    def close(self) -> None:
+        """
+        Przerywa oczekiwanie we wszystkich kolejkach
+        """
+        for bucket in self.buckets.values():
+            bucket.close()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Zwraca bieżący stan kolejek
+
+        Returns:
+            Dict[str, Dict[str, float]]: Klasa -> limit, liczba oczekujących,
+            łączny czas oczekiwania
+        """
+        with self._lock:
+            waited = dict(self._waited)
+        return {
+            endpoint: {"rate": bucket.rate, "waiting": bucket.waiting, "waited_seconds": waited[endpoint]}
+            for endpoint, bucket in self.buckets.items()
+        }
@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ponawianie zapytań HTTP z wykładniczym odstępem, budżetem i wyłącznikiem
+
+Każdy punkt końcowy (sprawdzanie statusu, wysyłanie wiadomości) ma własną
+politykę ponowień, budżet ponowień i wyłącznik (circuit breaker):
+- odstęp między próbami rośnie wykładniczo z losowym rozrzutem, a przy
+  odpowiedziach 429 i 503 używany jest nagłówek Retry-After,
+- budżet pozwala ponowić tylko ułamek zapytań, więc przy awarii ponowienia
+  nie mnożą ruchu,
+- wyłącznik otwiera się, gdy w ostatnich zapytaniach przeważają błędy -
+  kolejne zapytania są od razu odrzucane, a po upływie reset_timeout jedno
+  zapytanie próbne sprawdza, czy Kick.com znów działa.
+
+Autor: deem
+"""
+
+import collections
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BASE_DELAY = 0.5
+DEFAULT_MAX_DELAY = 10.0
+DEFAULT_BUDGET_RATIO = 0.2
+DEFAULT_BUDGET_RESERVE = 10
+DEFAULT_FAILURE_RATIO = 0.5
+DEFAULT_WINDOW = 20
+DEFAULT_MIN_CALLS = 10
+DEFAULT_RESET_TIMEOUT = 30.0
+DEFAULT_MAX_RESET_TIMEOUT = 300.0
+DEFAULT_MAX_ERROR_WAIT = 600
+
+FAILURE_STATUSES = frozenset((429, 500, 502, 503, 504))
+RETRY_AFTER_STATUSES = frozenset((429, 503))
+
+
+class RetryError(Exception):
+    """
+    Zapytanie nie powiodło się mimo ponowień (lub ponowienie nie było możliwe)
+    """
+
+    def __init__(self, endpoint: str, status: Optional[int], retry_after: Optional[float], attempts: int):
+        self.endpoint = endpoint
+        self.status = status
+        self.retry_after = retry_after
+        self.attempts = attempts
+        reason = f"kod {status}" if status is not None else "błąd połączenia"
+        super().__init__(f"{endpoint}: nie powiodło się po {attempts} próbach ({reason})")
+
+
+class HttpStatusError(RetryError):
+    """
+    Odpowiedź z kodem błędu, który nie podlega ponowieniu (np. 403 od Cloudflare)
+    """
+
+    def __init__(self, endpoint: str, status: int):
+        Exception.__init__(self, f"{endpoint}: kod odpowiedzi {status}")
+        self.endpoint = endpoint
+        self.status = status
+        self.retry_after = None
+        self.attempts = 1
+
+
+class CircuitOpenError(RetryError):
+    """
+    Zapytanie odrzucone bez wysyłania, bo wyłącznik punktu końcowego jest otwarty
+    """
+
+    def __init__(self, endpoint: str, retry_after: float):
+        Exception.__init__(self, f"{endpoint}: Kick.com nie odpowiada poprawnie - "
+                                 f"kolejna próba za {retry_after:.0f}s")
+        self.endpoint = endpoint
+        self.status = None
+        self.retry_after = retry_after
+        self.attempts = 0
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """
+    Wylicza wykładniczy odstęp z rozrzutem ("equal jitter")
+
+    Połowa odstępu jest stała, a połowa losowa - zapytania wielu kanałów nie
+    wracają w tej samej chwili, a odstęp nie spada prawie do zera.
+
+    Args:
+        attempt (int): Numer kolejnej porażki (od 1)
+        base (float): Odstęp po pierwszej porażce
+        cap (float): Maksymalny odstęp
+
+    Returns:
+        float: Odstęp w sekundach
+    """
+    delay = min(cap, base * 2 ** min(attempt - 1, 32))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Odczytuje nagłówek Retry-After (liczba sekund lub data HTTP)
+
+    Args:
+        value (Optional[str]): Wartość nagłówka
+
+    Returns:
+        Optional[float]: Liczba sekund do odczekania lub None
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    # email.utils jest importowane dopiero dla rzadkiego formatu daty HTTP
+    from email.utils import parsedate_to_datetime
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+class RetryPolicy:
+    """
+    Ustawienia ponowień dla punktu końcowego
+    """
+
+    def __init__(self, max_attempts: int = DEFAULT_MAX_ATTEMPTS, base_delay: float = DEFAULT_BASE_DELAY,
+                 max_delay: float = DEFAULT_MAX_DELAY, retry_statuses=FAILURE_STATUSES, retry_errors: bool = True):
+        """
+        Inicjalizacja polityki
+
+        Args:
+            max_attempts (int): Maksymalna liczba prób (razem z pierwszą)
+            base_delay (float): Odstęp po pierwszej nieudanej próbie
+            max_delay (float): Najdłuższy odstęp, na jaki zapytanie czeka w miejscu
+                (dłuższy Retry-After kończy ponawianie i przesuwa kolejne sprawdzenie kanału)
+            retry_statuses: Kody odpowiedzi, po których zapytanie jest ponawiane
+            retry_errors (bool): Czy ponawiać po błędach połączenia (tylko zapytania idempotentne)
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_errors = retry_errors
+
+
+class RetryBudget:
+    """
+    Budżet ponowień - każde nowe zapytanie dodaje ułamek żetonu, każde
+    ponowienie zużywa cały
+    """
+
+    def __init__(self, ratio: float = DEFAULT_BUDGET_RATIO, reserve: float = DEFAULT_BUDGET_RESERVE):
+        """
+        Inicjalizacja budżetu
+
+        Args:
+            ratio (float): Ułamek zapytań, które mogą zostać ponowione
+            reserve (float): Początkowa i maksymalna liczba żetonów
+        """
+        self.ratio = ratio
+        self.reserve = reserve
+        self._tokens = reserve
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        """
+        Rejestruje nowe zapytanie (nie ponowienie)
+        """
+        with self._lock:
+            self._tokens = min(self.reserve, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """
+        Próbuje zużyć żeton na ponowienie
+
+        Returns:
+            bool: True jeśli ponowienie mieści się w budżecie
+        """
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class CircuitBreaker:
+    """
+    Wyłącznik otwierany, gdy w ostatnich zapytaniach przeważają błędy
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_ratio: float = DEFAULT_FAILURE_RATIO, window: int = DEFAULT_WINDOW,
+                 min_calls: int = DEFAULT_MIN_CALLS, reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+                 max_reset_timeout: float = DEFAULT_MAX_RESET_TIMEOUT, clock: Callable[[], float] = time.monotonic):
+        """
+        Inicjalizacja wyłącznika
+
+        Args:
+            failure_ratio (float): Odsetek błędów w oknie, przy którym wyłącznik się otwiera
+            window (int): Liczba ostatnich zapytań branych pod uwagę
+            min_calls (int): Minimalna liczba zapytań w oknie przed otwarciem
+            reset_timeout (float): Czas otwarcia przed zapytaniem próbnym
+            max_reset_timeout (float): Limit czasu otwarcia (podwajanego po nieudanych próbach)
+            clock (Callable[[], float]): Zegar monotoniczny
+        """
+        self.failure_ratio = failure_ratio
+        self.min_calls = min_calls
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.clock = clock
+        self.state = self.CLOSED
+        self.opened = 0
+        self.rejected = 0
+        self._outcomes: "collections.deque[bool]" = collections.deque(maxlen=window)
+        self._open_for = reset_timeout
+        self._open_until = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def before_call(self, endpoint: str) -> bool:
+        """
+        Sprawdza czy zapytanie może zostać wysłane
+
+        Args:
+            endpoint (str): Nazwa punktu końcowego (do komunikatu błędu)
+
+        Returns:
+            bool: True, jeśli to zapytanie jest zapytaniem próbnym (wtedy
+            wywołujący musi zapisać jego wynik albo zwolnić próbę)
+
+        Raises:
+            CircuitOpenError: Gdy wyłącznik jest otwarty lub trwa zapytanie próbne
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return False
+
+            now = self.clock()
+            if self.state == self.OPEN and now >= self._open_until:
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+
+            self.rejected += 1
+            retry_after = self._open_until - now if self.state == self.OPEN else self._open_for
+        raise CircuitOpenError(endpoint, max(retry_after, 0.0))
+
+    def record(self, success: bool, retry_after: Optional[float] = None) -> None:
+        """
+        Zapisuje wynik zapytania
+
+        Args:
+            success (bool): Czy zapytanie się powiodło
+            retry_after (Optional[float]): Wartość Retry-After z odpowiedzi (wydłuża otwarcie)
+        """
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._probing = False
+                if success:
+                    self.state = self.CLOSED
+                    self._open_for = self.reset_timeout
+                    self._outcomes.clear()
+                else:
+                    self._open(min(self._open_for * 2, self.max_reset_timeout), retry_after)
+                return
+
+            self._outcomes.append(success)
+            if self.state != self.CLOSED or success or len(self._outcomes) < self.min_calls:
+                return
+            failures = self._outcomes.count(False)
+            if failures >= self.failure_ratio * len(self._outcomes):
+                self._open(self.reset_timeout, retry_after)
+
+    def release_probe(self) -> None:
+        """
+        Zwalnia zapytanie próbne przerwane bez wyniku (np. przy zatrzymaniu
+        bota), aby następne zapytanie mogło sprawdzić połączenie
+        """
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._probing = False
+
+    def _open(self, open_for: float, retry_after: Optional[float]) -> None:
+        self.state = self.OPEN
+        self.opened += 1
+        self._open_for = open_for
+        self._open_until = self.clock() + max(open_for, retry_after or 0.0)
+        self._outcomes.clear()
+
+    @property
+    def is_closed(self) -> bool:
+        """
+        Czy zapytania przechodzą normalnie
+        """
+        return self.state == self.CLOSED
+
+
+class RetryEngine:
+    """
+    Wykonuje zapytania według polityk ponowień, budżetów i wyłączników
+    przypisanych do punktów końcowych
+    """
+
+    def __init__(self, policies: Dict[str, RetryPolicy], sleep: Callable[[float], bool],
+                 budget_ratio: float = DEFAULT_BUDGET_RATIO, budget_reserve: float = DEFAULT_BUDGET_RESERVE,
+                 breaker: Optional[Dict[str, Any]] = None, passthrough: Tuple[type, ...] = ()):
+        """
+        Inicjalizacja silnika ponowień
+
+        Args:
+            policies (Dict[str, RetryPolicy]): Polityka dla każdego punktu końcowego
+            sleep (Callable[[float], bool]): Oczekiwanie między próbami; zwraca True,
+                jeśli zostało przerwane (np. przy zatrzymaniu bota)
+            budget_ratio (float): Ułamek zapytań, które mogą zostać ponowione
+            budget_reserve (float): Liczba ponowień dostępnych od razu
+            breaker (Optional[Dict[str, Any]]): Argumenty CircuitBreaker
+            passthrough (Tuple[type, ...]): Wyjątki przekazywane dalej bez ponowień
+                i bez wpływu na wyłącznik (np. przerwanie przy zatrzymaniu bota)
+        """
+        self.policies = policies
+        self.sleep = sleep
+        self.passthrough = passthrough
+        self.budgets = {endpoint: RetryBudget(budget_ratio, budget_reserve) for endpoint in policies}
+        self.breakers = {endpoint: CircuitBreaker(**(breaker or {})) for endpoint in policies}
+        self.retries = {endpoint: 0 for endpoint in policies}
+        self.budget_exhausted = {endpoint: 0 for endpoint in policies}
+        self._lock = threading.Lock()
+
+    def call(self, endpoint: str, send: Callable[[], Any]) -> Any:
+        """
+        Wysyła zapytanie, ponawiając je zgodnie z polityką punktu końcowego
+
+        Args:
+            endpoint (str): Nazwa punktu końcowego
+            send (Callable[[], Any]): Funkcja wysyłająca zapytanie i zwracająca odpowiedź
+
+        Returns:
+            Any: Odpowiedź HTTP (także nieudana, jeśli jej kod nie podlega ponowieniu)
+
+        Raises:
+            CircuitOpenError: Gdy wyłącznik punktu końcowego jest otwarty
+            RetryError: Gdy ponowienia się wyczerpały lub nie były możliwe
+        """
+        policy = self.policies[endpoint]
+        breaker = self.breakers[endpoint]
+        budget = self.budgets[endpoint]
+
+        probing = breaker.before_call(endpoint)
+        budget.deposit()
+
+        attempt = 0
+        while True:
+            attempt += 1
+            status, retry_after, response, error = self._attempt(send)
+            if isinstance(error, self.passthrough):
+                if probing:
+                    breaker.release_probe()
+                raise error
+            breaker.record(error is None and status not in FAILURE_STATUSES, retry_after)
+            probing = False
+
+            if error is not None and not policy.retry_errors:
+                raise error
+            if error is None and status not in policy.retry_statuses:
+                return response
+
+            delay = retry_after if retry_after is not None else backoff_delay(attempt, policy.base_delay, policy.max_delay)
+            if attempt >= policy.max_attempts or delay > policy.max_delay or not breaker.is_closed:
+                raise RetryError(endpoint, status, retry_after, attempt) from error
+            if not budget.withdraw():
+                with self._lock:
+                    self.budget_exhausted[endpoint] += 1
+                raise RetryError(endpoint, status, retry_after, attempt) from error
+            if self.sleep(delay):
+                raise RetryError(endpoint, status, retry_after, attempt) from error
+            with self._lock:
+                self.retries[endpoint] += 1
+
+    @staticmethod
+    def _attempt(send: Callable[[], Any]) -> Tuple[Optional[int], Optional[float], Any, Optional[Exception]]:
+        try:
+            response = send()
+        except Exception as e:
+            return None, None, None, e
+
+        retry_after = None
+        if response.status_code in RETRY_AFTER_STATUSES:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        return response.status_code, retry_after, response, None
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Zwraca statystyki ponowień i wyłączników
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Punkt końcowy -> ponowienia, wyczerpania budżetu,
+            stan wyłącznika, liczba otwarć i odrzuconych zapytań
+        """
+        return {
+            endpoint: {
+                "retries": self.retries[endpoint],
+                "budget_exhausted": self.budget_exhausted[endpoint],
+                "circuit_state": breaker.state,
+                "circuit_opened": breaker.opened,
+                "circuit_rejected": breaker.rejected
+            }
+            for endpoint, breaker in self.breakers.items()
+        }
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Warunkowe zapytania GET (ETag / Last-Modified)
+
+Dla każdego adresu zapamiętujemy walidatory z ostatniej odpowiedzi 200 oraz
+już przetworzony wynik. Kolejne zapytanie wysyła If-None-Match /
+If-Modified-Since, a odpowiedź 304 zwraca zapamiętany wynik bez ponownego
+przetwarzania treści.
+
+Autor: deem
+"""
+
+import threading
+from typing import Any, Dict, Optional
+
+
+class RevalidationCache:
+    """
+    Walidatory i przetworzone wyniki ostatnich odpowiedzi dla adresów URL
+    """
+
+    def __init__(self):
+        """
+        Inicjalizacja pustej pamięci walidatorów
+        """
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.hits = 0
+        self.bytes_saved = 0
+
+    def headers_for(self, url: str) -> Dict[str, str]:
+        """
+        Zwraca nagłówki warunkowe dla adresu
+
+        Args:
+            url (str): Adres URL
+
+        Returns:
+            Dict[str, str]: Nagłówki If-None-Match / If-Modified-Since (lub pusty słownik)
+        """
+        with self._lock:
+            self.requests += 1
+            entry = self._entries.get(url)
+
+        if entry is None:
+            return {}
+
+        headers = {}
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url: str, response, parsed: Any, wire_bytes: int) -> None:
+        """
+        Zapamiętuje walidatory i wynik odpowiedzi 200
+
+        Args:
+            url (str): Adres URL
+            response: Odpowiedź requests
+            parsed (Any): Przetworzony wynik odpowiedzi
+            wire_bytes (int): Rozmiar treści na łączu
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+
+        with self._lock:
+            if etag or last_modified:
+                self._entries[url] = {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "parsed": parsed,
+                    "wire_bytes": wire_bytes
+                }
+            else:
+                self._entries.pop(url, None)
+
+    def reuse(self, url: str) -> Optional[Any]:
+        """
+        Zwraca zapamiętany wynik po odpowiedzi 304
+
+        Args:
+            url (str): Adres URL
+
+        Returns:
+            Optional[Any]: Przetworzony wynik lub None, jeśli nic nie zapamiętano
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return None
+            self.hits += 1
+            self.bytes_saved += entry["wire_bytes"]
+            return entry["parsed"]
+
+    def forget(self, prefix: str) -> None:
+        """
+        Usuwa wpisy adresów zaczynających się od prefiksu (np. usuniętego kanału)
+
+        Args:
+            prefix (str): Początek adresu URL
+        """
+        with self._lock:
+            for url in [url for url in self._entries if url == prefix or url.startswith(prefix + "/")]:
+                del self._entries[url]
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Zwraca metryki rewalidacji
+
+        Returns:
+            Dict[str, float]: Liczba zapytań, trafień (304), odsetek trafień i zaoszczędzone bajty
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "hits": self.hits,
+                "hit_ratio": self.hits / self.requests if self.requests else 0.0,
+                "bytes_saved": self.bytes_saved
+            }
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Zapamiętany harmonogram kanałów i łagodny start
+
+Przy zatrzymaniu (i okresowo w trakcie pracy) bot zapisuje dla każdego
+kanału termin następnego sprawdzenia i ostatni znany status live. Po
+ponownym uruchomieniu kanały wracają do swoich terminów, zamiast sprawdzać
+się wszystkie w tej samej sekundzie. Kanały bez zapisanego stanu (oraz te,
+których termin już minął) są rozkładane równomiernie w oknie rozruchu.
+
+Autor: deem
+"""
+
+import json
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+DEFAULT_STATE_PATH = 'schedule_state.json'
+DEFAULT_SAVE_INTERVAL = 60
+
+
+class ScheduleStateStore:
+    """
+    Plik JSON nazwa kanału -> {"next_due": czas uniksowy, "live": status}
+    """
+
+    def __init__(self, path: str = DEFAULT_STATE_PATH):
+        """
+        Inicjalizacja magazynu stanu
+
+        Args:
+            path (str): Ścieżka pliku stanu
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def load(self) -> Dict[str, Dict]:
+        """
+        Wczytuje zapisany stan (brak lub uszkodzony plik oznacza brak stanu)
+
+        Returns:
+            Dict[str, Dict]: Nazwa kanału -> {"next_due", "live"}
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(entries, dict):
+            return {}
+        return {name: entry for name, entry in entries.items() if isinstance(entry, dict)}
+
+    def save(self, entries: Dict[str, Dict]) -> None:
+        """
+        Zapisuje stan atomowo (przez plik tymczasowy)
+
+        Args:
+            entries (Dict[str, Dict]): Nazwa kanału -> {"next_due", "live"}
+        """
+        with self._lock:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+
+
+def plan_startup(channels: Iterable[str], saved: Dict[str, Dict], now: float, ramp_up: float,
+                 max_delay: float) -> Dict[str, float]:
+    """
+    Wylicza opóźnienie pierwszego sprawdzenia każdego kanału
+
+    Kanały z zapisanym przyszłym terminem czekają do niego (najwyżej
+    max_delay). Pozostałe są rozkładane równomiernie w oknie ramp_up -
+    najpierw te, których termin minął najdawniej, potem kanały bez stanu.
+
+    Args:
+        channels (Iterable[str]): Nazwy kanałów
+        saved (Dict[str, Dict]): Zapisany stan (ScheduleStateStore.load)
+        now (float): Bieżący czas uniksowy
+        ramp_up (float): Długość okna rozruchu w sekundach
+        max_delay (float): Najdłuższe dozwolone opóźnienie zapisanego terminu
+
+    Returns:
+        Dict[str, float]: Nazwa kanału -> opóźnienie w sekundach
+    """
+    delays: Dict[str, float] = {}
+    ramp: List[Tuple[float, str]] = []
+    for channel_name in channels:
+        due: Optional[float] = saved.get(channel_name, {}).get("next_due")
+        if not isinstance(due, (int, float)):
+            ramp.append((float("inf"), channel_name))
+        elif due > now:
+            delays[channel_name] = min(due - now, max_delay)
+        else:
+            ramp.append((due, channel_name))
+
+    ramp.sort()
+    step = ramp_up / len(ramp) if ramp else 0
+    for index, (_, channel_name) in enumerate(ramp):
+        delays[channel_name] = index * step
+    return delays
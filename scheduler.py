@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Centralny harmonogram sprawdzeń kanałów
+
+Jedna kolejka priorytetowa przechowuje termin następnego sprawdzenia każdego
+kanału, a jeden wątek dyspozytora przekazuje należne sprawdzenia do
+ograniczonej puli wątków roboczych.
+
+Autor: deem
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from poll_watchdog import WorkerPool
+
+
+class PollScheduler:
+    """
+    Harmonogram sprawdzeń kanałów oparty o kopiec terminów
+    """
+
+    def __init__(self, poll: Callable[[str], float], max_workers: int, clock: Callable[[], float] = time.monotonic,
+                 max_hung: Optional[int] = None):
+        """
+        Inicjalizacja harmonogramu
+
+        Args:
+            poll (Callable[[str], float]): Sprawdza kanał i zwraca czas do następnego sprawdzenia
+            max_workers (int): Maksymalna liczba równoległych sprawdzeń
+            clock (Callable[[], float]): Źródło czasu monotonicznego
+            max_hung (Optional[int]): Ile wątków zajętych przez zawieszone sprawdzenia
+                można zastąpić (domyślnie max_workers)
+        """
+        self.poll = poll
+        self.clock = clock
+        self._heap: List[Tuple[float, int, str]] = []
+        self._due: Dict[str, float] = {}
+        self._channels: Set[str] = set()
+        self._counter = 0
+        self._in_flight = 0
+        self._running: Dict[int, str] = {}
+        self._tickets = itertools.count()
+        self._stopped = False
+        self._cond = threading.Condition()
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self.pool = WorkerPool(max_workers, max_hung)
+        self._thread = threading.Thread(target=self._dispatch_loop, name="kick-scheduler", daemon=True)
+
+    def start(self) -> None:
+        """
+        Uruchamia wątek dyspozytora
+        """
+        self._thread.start()
+
+    def add(self, channel_name: str, delay: float = 0.0) -> None:
+        """
+        Planuje sprawdzenie kanału za podany czas (nadpisuje poprzedni termin)
+
+        Args:
+            channel_name (str): Nazwa kanału
+            delay (float): Opóźnienie w sekundach
+        """
+        with self._cond:
+            self._channels.add(channel_name)
+            self._push(channel_name, self.clock() + delay)
+            self._cond.notify()
+
+    def remove(self, channel_name: str) -> None:
+        """
+        Usuwa kanał z harmonogramu
+
+        Args:
+            channel_name (str): Nazwa kanału
+        """
+        with self._cond:
+            self._channels.discard(channel_name)
+            self._due.pop(channel_name, None)
+
+    def wake(self, channel_name: str) -> None:
+        """
+        Przesuwa sprawdzenie zaplanowanego kanału na teraz
+
+        Args:
+            channel_name (str): Nazwa kanału
+        """
+        with self._cond:
+            if channel_name in self._due:
+                self._push(channel_name, self.clock())
+                self._cond.notify()
+
+    def restart(self, channel_name: str) -> int:
+        """
+        Porzuca zawieszone sprawdzenia kanału i planuje nowe na teraz
+
+        Zawieszony wątek roboczy nie może zostać przerwany - jego wynik jest
+        ignorowany, pula zastępuje zajęty wątek nowym, a miejsce w limicie
+        max_workers wraca od razu do puli.
+
+        Args:
+            channel_name (str): Nazwa kanału
+
+        Returns:
+            int: Liczba porzuconych sprawdzeń
+
+        Raises:
+            WorkerPoolExhausted: Gdy zawieszone sprawdzenia zajmują już max_hung
+                wątków (kanał czeka wtedy na zakończenie swojego sprawdzenia)
+        """
+        with self._cond:
+            self.pool.abandon(channel_name)
+            abandoned = [ticket for ticket, name in self._running.items() if name == channel_name]
+            for ticket in abandoned:
+                del self._running[ticket]
+                self._in_flight -= 1
+                self._slots.release()
+            if channel_name in self._channels:
+                self._push(channel_name, self.clock())
+            self._cond.notify_all()
+        return len(abandoned)
+
+    def stop(self, timeout: float) -> bool:
+        """
+        Zatrzymuje dyspozytora i czeka na zakończenie trwających sprawdzeń
+
+        Args:
+            timeout (float): Maksymalny czas oczekiwania w sekundach
+
+        Returns:
+            bool: True jeśli wszystkie trwające sprawdzenia zakończyły się w czasie
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        self.pool.shutdown()
+
+        with self._cond:
+            while self._in_flight:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def _push(self, channel_name: str, due: float) -> None:
+        self._counter += 1
+        self._due[channel_name] = due
+        heapq.heappush(self._heap, (due, self._counter, channel_name))
+
+    def _next_due(self) -> Optional[Tuple[int, str]]:
+        """
+        Czeka na najbliższy należny kanał i zdejmuje go z kolejki
+
+        Returns:
+            Optional[Tuple[int, str]]: (numer sprawdzenia, nazwa kanału) lub None po zatrzymaniu
+        """
+        with self._cond:
+            while True:
+                if self._stopped:
+                    return None
+
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+
+                due, _, channel_name = self._heap[0]
+                if self._due.get(channel_name) != due:
+                    heapq.heappop(self._heap)
+                    continue
+
+                delay = due - self.clock()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+
+                heapq.heappop(self._heap)
+                del self._due[channel_name]
+                self._in_flight += 1
+                ticket = next(self._tickets)
+                self._running[ticket] = channel_name
+                return ticket, channel_name
+
+    def _dispatch_loop(self) -> None:
+        while not self._stopped:
+            if not self._slots.acquire(timeout=0.1):
+                continue
+            due = self._next_due()
+            if due is None:
+                return
+            try:
+                self.pool.submit(due[1], self._run_poll, *due)
+            except RuntimeError:
+                self._finish_poll(due[0])
+                return
+
+    def _finish_poll(self, ticket: int) -> bool:
+        with self._cond:
+            if self._running.pop(ticket, None) is None:
+                return False
+            self._in_flight -= 1
+            self._slots.release()
+            self._cond.notify_all()
+        return True
+
+    def _run_poll(self, ticket: int, channel_name: str) -> None:
+        if self._stopped:
+            self._finish_poll(ticket)
+            return
+
+        try:
+            wait_time = self.poll(channel_name)
+        finally:
+            current = self._finish_poll(ticket)
+
+        with self._cond:
+            if (current and not self._stopped and channel_name in self._channels
+                    and channel_name not in self._due):
+                self._push(channel_name, self.clock() + wait_time)
+                self._cond.notify()
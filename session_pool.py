@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pula sesji HTTP bezpieczna dla wielu wątków
+
+Każda sesja jest w danej chwili używana tylko przez jeden wątek. Sesje
+utrzymują połączenia keep-alive, a liczba połączeń do jednego hosta jest
+ograniczona w adapterach każdej sesji.
+
+Autor: deem
+"""
+
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List
+
+from transport import Transport
+
+
+DEFAULT_POOL_SIZE = 8
+DEFAULT_CONNECTIONS_PER_HOST = 2
+POOL_HOSTS = 10
+
+
+class SessionPool(Transport):
+    """
+    Ograniczona pula sesji requests/cloudscraper z metrykami ponownego użycia połączeń
+    """
+
+    def __init__(self, factory: Callable[[], Any], size: int = DEFAULT_POOL_SIZE,
+                 connections_per_host: int = DEFAULT_CONNECTIONS_PER_HOST):
+        """
+        Inicjalizacja puli (sesje są tworzone dopiero przy pierwszym użyciu)
+
+        Args:
+            factory (Callable[[], Any]): Funkcja tworząca nową sesję
+            size (int): Maksymalna liczba sesji
+            connections_per_host (int): Maksymalna liczba połączeń do jednego hosta w sesji
+        """
+        self.factory = factory
+        self.size = size
+        self.connections_per_host = connections_per_host
+        self._idle: "queue.LifoQueue[Any]" = queue.LifoQueue()
+        self._sessions: List[Any] = []
+        self._created = 0
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.waits = 0
+
+    def _create_session(self) -> Any:
+        """
+        Tworzy sesję z keep-alive i limitem połączeń na host
+
+        Returns:
+            Any: Nowa sesja
+        """
+        session = self.factory()
+        session.headers["Connection"] = "keep-alive"
+        for adapter in session.adapters.values():
+            adapter.init_poolmanager(POOL_HOSTS, self.connections_per_host, block=True)
+        return session
+
+    def _acquire(self) -> Any:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            create = self._created < self.size
+            if create:
+                self._created += 1
+            else:
+                self.waits += 1
+
+        if not create:
+            return self._idle.get()
+
+        session = self._create_session()
+        with self._lock:
+            self._sessions.append(session)
+        return session
+
+    @contextmanager
+    def session(self) -> Iterator[Any]:
+        """
+        Wypożycza sesję na wyłączność bieżącego wątku
+
+        Yields:
+            Any: Sesja HTTP
+        """
+        session = self._acquire()
+        try:
+            yield session
+        finally:
+            self._idle.put(session)
+
+    def request(self, method: str, url: str, **kwargs) -> Any:
+        """
+        Wykonuje zapytanie na wypożyczonej sesji
+
+        Args:
+            method (str): Metoda HTTP
+            url (str): Adres URL
+            **kwargs: Argumenty przekazywane do session.request
+
+        Returns:
+            Any: Odpowiedź HTTP
+        """
+        with self.session() as session:
+            with self._lock:
+                self.requests += 1
+            return session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> Any:
+        """
+        Wykonuje zapytanie GET (patrz request)
+        """
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> Any:
+        """
+        Wykonuje zapytanie POST (patrz request)
+        """
+        return self.request("POST", url, **kwargs)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Zwraca metryki puli
+
+        Returns:
+            Dict[str, float]: Liczba sesji, zapytań, otwartych połączeń, oczekiwań
+            na wolną sesję oraz odsetek zapytań obsłużonych istniejącym połączeniem
+        """
+        with self._lock:
+            sessions = list(self._sessions)
+            requests_count = self.requests
+            waits = self.waits
+
+        connections = 0
+        for session in sessions:
+            for adapter in session.adapters.values():
+                for key in adapter.poolmanager.pools.keys():
+                    pool = adapter.poolmanager.pools.get(key)
+                    if pool is not None:
+                        connections += pool.num_connections
+
+        return {
+            "sessions": len(sessions),
+            "requests": requests_count,
+            "connections_opened": connections,
+            "waits": waits,
+            "reuse_ratio": 1 - connections / requests_count if requests_count else 0.0
+        }
+
+    def close(self) -> None:
+        """
+        Zamyka połączenia wszystkich sesji
+        """
+        with self._lock:
+            sessions = list(self._sessions)
+        for session in sessions:
+            session.close()
@@ -6,16 +6,115 @@ Interactive Setup
 Interaktywny skrypt konfiguracyjny dla Kick Points Collector
 Przeprowadzi Cię przez proces tworzenia pliku konfiguracyjnego
 
+Z argumentami --channels / --channels-file działa bez pytań: dopisuje kanały
+do konfiguracji, sprawdza je równolegle w API i zapisuje ich ID czatów.
+
 Autor: deem
 """
 
+import argparse
+import copy
+import importlib.util
 import json
 import os
 import subprocess
 import sys
+import time
+
+REQUIRED_PACKAGES = ['cloudscraper']
+DEFAULT_RESOLVE_WORKERS = 8
+DEFAULT_WAIT_TIMES = {
+    'livestream_active': {'min': 250, 'max': 300},
+    'livestream_inactive': 300,
+    'error_wait': 180
+}
+DEFAULT_EMOTES = [
+    "[emote:1730752:emojiAngel]",
+    "[emote:1730753:emojiAngry]",
+    "[emote:1579033:emojiAstonished]",
+    "[emote:1730754:emojiAwake]",
+    "[emote:1579036:emojiBlowKiss]",
+    "[emote:1730755:emojiBubbly]",
+    "[emote:1730756:emojiCheerful]",
+    "[emote:1730758:emojiClown]",
+    "[emote:1730768:emojiDevil]",
+    "[emote:1730772:emojiFire]",
+    "[emote:1579054:emojiEyeRoll]",
+    "[emote:1730767:emojiDead]",
+    "[emote:1730765:emojiCute]",
+    "[emote:1579045:emojiExcited]",
+    "[emote:1579044:emojiEnraged]",
+    "[emote:1730762:emojiCurious]",
+    "[emote:1579040:emojiCrying]",
+    "[emote:1730770:emojiDown]",
+    "[emote:1730769:emojiDJ]",
+    "[emote:1730761:emojiCry]",
+    "[emote:1730760:emojiCrave]",
+    "[emote:1579042:emojiDisguise]",
+    "[emote:1579041:emojiDisappoint]",
+    "[emote:1730759:emojiCool]",
+    "[emote:3419634:emojiFlag]",
+    "[emote:1730774:emojiGamer]",
+    "[emote:1730775:emojiGlass]",
+    "[emote:1730776:emojiGoofy]",
+    "[emote:1730782:emojiGramps]",
+    "[emote:1579046:emojiGrimacing]",
+    "[emote:1730785:emojiGrin]",
+    "[emote:1730786:emojiGrumpy]",
+    "[emote:1730791:emojiLady]",
+    "[emote:1730790:emojiKiss]",
+    "[emote:1730789:emojiKing]",
+    "[emote:4200908:emojiHydrate]",
+    "[emote:1730788:emojiHmm]",
+    "[emote:3419632:emojiHelmet]",
+    "[emote:1579047:emojiHeartEyes]",
+    "[emote:1730787:emojiHappy]",
+    "[emote:1579050:emojiLaughing]",
+    "[emote:1730792:emojiLoading]",
+    "[emote:1730794:emojiLol]",
+    "[emote:1730796:emojiMan]",
+    "[emote:1579051:emojiMoneyEyes]",
+    "[emote:1730798:emojiNo]",
+    "[emote:1730799:emojiOof]",
+    "[emote:1730800:emojiOooh]",
+    "[emote:1579057:emojiSmiling]",
+    "[emote:1730831:emojiWink]",
+    "[emote:1579062:emojiVomiting]",
+    "[emote:1579055:emojiSmerking]",
+    "[emote:1730827:emojiSmart]",
+    "[emote:3419630:emojiTire]",
+    "[emote:1730825:emojiSleep]",
+    "[emote:1730807:emojiShocked]",
+    "[emote:1579059:emojiSwearing]",
+    "[emote:1579058:emojiStarEyes]",
+    "[emote:1730803:emojiRich]",
+    "[emote:1579052:emojiPleading]",
+    "[emote:1730830:emojiStare]",
+    "[emote:1730829:emojiSorry]",
+    "[emote:1730802:emojiOuch]",
+    "[emote:1579038:emojiXEyes]",
+    "[emote:1730834:emojiYay]",
+    "[emote:1730835:emojiYes]",
+    "[emote:1730839:emojiYuh]",
+    "[emote:1730840:emojiYum]"
+]
+
+
+def ensure_dependencies():
+    """
+    Instaluje brakujące pakiety wymagane przez bota
+    
+    pip jest uruchamiany tylko wtedy, gdy któregoś pakietu brakuje -
+    sprawdzenie nie importuje pakietów i nie wymaga dostępu do sieci.
+    
+    Returns:
+        list: Lista doinstalowanych pakietów
+    """
+    missing = [package for package in REQUIRED_PACKAGES if importlib.util.find_spec(package) is None]
+    if missing:
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *missing])
+    return missing
 
-subprocess.check_call([sys.executable, "-m", "pip", "install", "cloudscraper"])
-os.system('cls' if os.name == 'nt' else 'clear')
 
 def print_header():
     """Wyświetla nagłówek konfiguratora"""
@@ -27,6 +126,25 @@ def print_header():
     print()
 
 
+def normalize_channel(channel):
+    """
+    Zamienia nazwę lub adres kanału (https://kick.com/nazwa) na samą nazwę
+    
+    Args:
+        channel (str): Nazwa lub adres kanału
+        
+    Returns:
+        str: Nazwa kanału (pusta, jeśli nic nie zostało)
+    """
+    channel = channel.strip()
+    if channel.startswith('https://kick.com/'):
+        channel = channel.replace('https://kick.com/', '')
+    elif channel.startswith('http://kick.com/'):
+        channel = channel.replace('http://kick.com/', '')
+    
+    return channel.rstrip('/')
+
+
 def get_channels():
     """
     Pobiera listę kanałów do monitorowania od użytkownika
@@ -52,12 +170,7 @@ def get_channels():
                 print("Musisz podać przynajmniej jeden kanał!")
                 continue
         
-        if channel.startswith('https://kick.com/'):
-            channel = channel.replace('https://kick.com/', '')
-        elif channel.startswith('http://kick.com/'):
-            channel = channel.replace('http://kick.com/', '')
-        
-        channel = channel.rstrip('/')
+        channel = normalize_channel(channel)
         
         if channel:
             channels.append(channel)
@@ -228,79 +341,8 @@ def get_messages():
         choice = input("Wybierz opcję (1-3): ").strip()
         
         if choice == '1':
-            default_emotes = [
-                "[emote:1730752:emojiAngel]",
-                "[emote:1730753:emojiAngry]",
-                "[emote:1579033:emojiAstonished]",
-                "[emote:1730754:emojiAwake]",
-                "[emote:1579036:emojiBlowKiss]",
-                "[emote:1730755:emojiBubbly]",
-                "[emote:1730756:emojiCheerful]",
-                "[emote:1730758:emojiClown]",
-                "[emote:1730768:emojiDevil]",
-                "[emote:1730772:emojiFire]",
-                "[emote:1579054:emojiEyeRoll]",
-                "[emote:1730767:emojiDead]",
-                "[emote:1730765:emojiCute]",
-                "[emote:1579045:emojiExcited]",
-                "[emote:1579044:emojiEnraged]",
-                "[emote:1730762:emojiCurious]",
-                "[emote:1579040:emojiCrying]",
-                "[emote:1730770:emojiDown]",
-                "[emote:1730769:emojiDJ]",
-                "[emote:1730761:emojiCry]",
-                "[emote:1730760:emojiCrave]",
-                "[emote:1579042:emojiDisguise]",
-                "[emote:1579041:emojiDisappoint]",
-                "[emote:1730759:emojiCool]",
-                "[emote:3419634:emojiFlag]",
-                "[emote:1730774:emojiGamer]",
-                "[emote:1730775:emojiGlass]",
-                "[emote:1730776:emojiGoofy]",
-                "[emote:1730782:emojiGramps]",
-                "[emote:1579046:emojiGrimacing]",
-                "[emote:1730785:emojiGrin]",
-                "[emote:1730786:emojiGrumpy]",
-                "[emote:1730791:emojiLady]",
-                "[emote:1730790:emojiKiss]",
-                "[emote:1730789:emojiKing]",
-                "[emote:4200908:emojiHydrate]",
-                "[emote:1730788:emojiHmm]",
-                "[emote:3419632:emojiHelmet]",
-                "[emote:1579047:emojiHeartEyes]",
-                "[emote:1730787:emojiHappy]",
-                "[emote:1579050:emojiLaughing]",
-                "[emote:1730792:emojiLoading]",
-                "[emote:1730794:emojiLol]",
-                "[emote:1730796:emojiMan]",
-                "[emote:1579051:emojiMoneyEyes]",
-                "[emote:1730798:emojiNo]",
-                "[emote:1730799:emojiOof]",
-                "[emote:1730800:emojiOooh]",
-                "[emote:1579057:emojiSmiling]",
-                "[emote:1730831:emojiWink]",
-                "[emote:1579062:emojiVomiting]",
-                "[emote:1579055:emojiSmerking]",
-                "[emote:1730827:emojiSmart]",
-                "[emote:3419630:emojiTire]",
-                "[emote:1730825:emojiSleep]",
-                "[emote:1730807:emojiShocked]",
-                "[emote:1579059:emojiSwearing]",
-                "[emote:1579058:emojiStarEyes]",
-                "[emote:1730803:emojiRich]",
-                "[emote:1579052:emojiPleading]",
-                "[emote:1730830:emojiStare]",
-                "[emote:1730829:emojiSorry]",
-                "[emote:1730802:emojiOuch]",
-                "[emote:1579038:emojiXEyes]",
-                "[emote:1730834:emojiYay]",
-                "[emote:1730835:emojiYes]",
-                "[emote:1730839:emojiYuh]",
-                "[emote:1730840:emojiYum]"
-            ]
-            
-            messages.extend(default_emotes)
-            print(f"✅ Dodano {len(default_emotes)} domyślnych emotek")
+            messages.extend(DEFAULT_EMOTES)
+            print(f"✅ Dodano {len(DEFAULT_EMOTES)} domyślnych emotek")
             
         elif choice == '2':
             # Dodanie własnej wiadomości
@@ -324,15 +366,17 @@ def get_messages():
     return messages
 
 
-def save_config(config, filename='config.json'):
+def save_config(config, filename='config.json', clear_screen=True):
     """
     Zapisuje konfigurację do pliku JSON
     
     Args:
         config (dict): Konfiguracja do zapisania
         filename (str): Nazwa pliku
+        clear_screen (bool): Czy wyczyścić ekran przed zapisem (tryb interaktywny)
     """
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if clear_screen:
+        os.system('cls' if os.name == 'nt' else 'clear')
     try:
         with open(filename, 'w', encoding='utf-8') as f:
             json.dump(config, f, indent=2, ensure_ascii=False)
@@ -373,10 +417,288 @@ def show_config_summary(config):
     print("\n" + "=" * 60)
 
 
-def main():
+def read_channels_file(path):
+    """
+    Wczytuje listę kanałów z pliku tekstowego
+    
+    Kanały mogą być podane w osobnych liniach lub rozdzielone przecinkami
+    i spacjami; tekst po znaku # jest pomijany.
+    
+    Args:
+        path (str): Ścieżka do pliku ('-' oznacza standardowe wejście)
+        
+    Returns:
+        list: Lista nazw kanałów
+    """
+    if path == '-':
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    
+    channels = []
+    for line in lines:
+        line = line.split('#', 1)[0]
+        for channel in line.replace(',', ' ').split():
+            channel = normalize_channel(channel)
+            if channel:
+                channels.append(channel)
+    return channels
+
+
+def merge_channels(existing, new):
+    """
+    Łączy listy kanałów bez duplikatów (wielkość liter nie ma znaczenia)
+    
+    Args:
+        existing (list): Kanały już zapisane w konfiguracji
+        new (list): Kanały do dodania
+        
+    Returns:
+        list: Połączona lista w kolejności pierwszego wystąpienia
+    """
+    merged = []
+    seen = set()
+    for channel in list(existing) + list(new):
+        key = channel.lower()
+        if key not in seen:
+            seen.add(key)
+            merged.append(channel)
+    return merged
+
+
+def resolve_channels(channels, config, workers=DEFAULT_RESOLVE_WORKERS):
+    """
+    Sprawdza kanały w API Kick.com równolegle i pobiera ich ID czatów
+    
+    Jednocześnie wysyłanych jest najwyżej workers zapytań (tyle, ile sesji
+    w puli). Zapytania przechodzą przez te same polityki ponowień co w
+    bocie, więc odpowiedzi 429/503 z Retry-After nie kończą się od razu
+    błędem, a seria błędów otwiera wyłącznik zamiast zasypywać API.
+    
+    Args:
+        channels (list): Nazwy kanałów do sprawdzenia
+        config (dict): Konfiguracja (api_base, timeouts, retry)
+        workers (int): Maksymalna liczba jednoczesnych zapytań
+        
+    Returns:
+        tuple: (nazwa -> (ID czatu, ID kanału), lista nieistniejących kanałów,
+        nazwa -> opis błędu dla kanałów, których nie udało się sprawdzić)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    from main import KICK_API_BASE, create_scraper
+    from poll_watchdog import DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT
+    from retry_policy import (RetryEngine, RetryError, RetryPolicy, DEFAULT_BASE_DELAY, DEFAULT_BUDGET_RATIO,
+                              DEFAULT_BUDGET_RESERVE, DEFAULT_MAX_ATTEMPTS, DEFAULT_MAX_DELAY)
+    from session_pool import SessionPool
+    from status_parse import STATUS_HEADERS, parse_channel
+    
+    api_base = config.get("api_base", KICK_API_BASE).rstrip('/')
+    timeouts = config.get("timeouts", {})
+    override = timeouts.get("channel_status", {})
+    timeout = (
+        override.get("connect", timeouts.get("connect", DEFAULT_CONNECT_TIMEOUT)),
+        override.get("read", timeouts.get("read", DEFAULT_READ_TIMEOUT))
+    )
+    pool = SessionPool(create_scraper, workers)
+    retry_config = config.get("retry", {})
+    policy = RetryPolicy(
+        max_attempts=retry_config.get("max_attempts", DEFAULT_MAX_ATTEMPTS),
+        base_delay=retry_config.get("base_delay", DEFAULT_BASE_DELAY),
+        max_delay=retry_config.get("max_delay", DEFAULT_MAX_DELAY)
+    )
+    
+    def sleep(delay):
+        time.sleep(delay)
+        return False
+    
+    retry_engine = RetryEngine(
+        {"channel_status": policy},
+        sleep=sleep,
+        budget_ratio=retry_config.get("budget_ratio", DEFAULT_BUDGET_RATIO),
+        budget_reserve=retry_config.get("budget_reserve", DEFAULT_BUDGET_RESERVE),
+        breaker=retry_config.get("circuit_breaker", {})
+    )
+    
+    def resolve(channel):
+        url = f"{api_base}/api/v2/channels/{channel}"
+        try:
+            response = retry_engine.call(
+                "channel_status",
+                lambda: pool.get(url, headers=STATUS_HEADERS, timeout=timeout)
+            )
+        except RetryError as e:
+            return channel, None, f"HTTP {e.status}" if e.status else str(e)
+        except Exception as e:
+            return channel, None, str(e) or type(e).__name__
+        
+        if response.status_code == 404:
+            return channel, None, None
+        if response.status_code != 200:
+            return channel, None, f"HTTP {response.status_code}"
+        try:
+            _, chatroom_id, channel_id = parse_channel(response.content)
+        except (ValueError, AttributeError) as e:
+            return channel, None, f"niepoprawna odpowiedź ({e})"
+        if not chatroom_id:
+            return channel, None, "brak ID czatu w odpowiedzi"
+        return channel, (chatroom_id, channel_id), None
+    
+    resolved = {}
+    missing = []
+    failed = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for channel, ids, error in executor.map(resolve, channels):
+            if ids is not None:
+                resolved[channel] = ids
+            elif error is None:
+                missing.append(channel)
+            else:
+                failed[channel] = error
+    return resolved, missing, failed
+
+
+def run_batch(args):
+    """
+    Nieinteraktywna konfiguracja: dopisuje kanały do pliku konfiguracyjnego,
+    sprawdza je w API i zapisuje ich ID czatów w pamięci podręcznej
+    
+    Args:
+        args (argparse.Namespace): Argumenty wiersza poleceń
+        
+    Returns:
+        int: Kod wyjścia (0 - wszystko w porządku, 1 - błąd konfiguracji,
+        2 - część kanałów nie istnieje lub nie udało się ich sprawdzić)
+    """
+    from channel_cache import ChannelCache, DEFAULT_CACHE_PATH, DEFAULT_CACHE_TTL
+    
+    new_channels = [normalize_channel(channel) for channel in args.channels]
+    for path in args.channels_file:
+        try:
+            new_channels.extend(read_channels_file(path))
+        except OSError as e:
+            print(f"Nie można wczytać listy kanałów {path}: {e}")
+            return 1
+    new_channels = merge_channels([], [channel for channel in new_channels if channel])
+    
+    if os.path.exists(args.config):
+        try:
+            with open(args.config, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Nie można wczytać konfiguracji {args.config}: {e}")
+            return 1
+        if args.token:
+            config['authorization'] = args.token
+        existing = [] if args.replace else config.get('channels', [])
+    else:
+        if not args.token:
+            print(f"Plik {args.config} nie istnieje - podaj --token, aby utworzyć nową konfigurację")
+            return 1
+        config = {
+            'channels': [],
+            'authorization': args.token,
+            'wait_times': copy.deepcopy(DEFAULT_WAIT_TIMES),
+            'messages': list(DEFAULT_EMOTES)
+        }
+        existing = []
+    
+    if not str(config.get('authorization', '')).startswith('Bearer '):
+        print("Token musi zaczynać się od 'Bearer '!")
+        return 1
+    
+    channels = merge_channels(existing, new_channels)
+    if not channels:
+        print("Nie podano żadnego kanału!")
+        return 1
+    
+    exit_code = 0
+    cache_config = config.get('chatroom_cache', {})
+    if not args.no_validate:
+        ensure_dependencies()
+        cache = ChannelCache(
+            cache_config.get('path', DEFAULT_CACHE_PATH),
+            cache_config.get('ttl', DEFAULT_CACHE_TTL)
+        )
+        pending = [channel for channel in channels if cache.get(channel) is None]
+        print(f"Sprawdzanie kanałów: {len(pending)} z {len(channels)} "
+              f"(pozostałe są w pamięci podręcznej), do {args.workers} zapytań naraz...")
+        
+        started = time.monotonic()
+        resolved, missing, failed = resolve_channels(pending, config, args.workers)
+        print(f"Sprawdzono {len(pending)} kanałów w {time.monotonic() - started:.1f} s")
+        
+        if resolved and cache_config.get('enabled', True):
+            cache.put_many(resolved)
+            print(f"✅ Zapisano ID czatów {len(resolved)} kanałów w {cache.path}")
+        for channel in missing:
+            print(f"❌ Kanał nie istnieje: {channel}")
+        for channel, error in failed.items():
+            print(f"⚠️ Nie udało się sprawdzić kanału {channel}: {error}")
+        
+        if missing and not args.keep_missing:
+            removed = set(missing)
+            channels = [channel for channel in channels if channel not in removed]
+            print(f"Pominięto {len(missing)} nieistniejących kanałów (--keep-missing, aby je zachować)")
+        if missing or failed:
+            exit_code = 2
+    
+    added = len(set(channels) - set(existing))
+    config['channels'] = channels
+    save_config(config, args.config, clear_screen=False)
+    print(f"Kanały w konfiguracji: {len(channels)} (nowe: {added})")
+    return exit_code
+
+
+def parse_args(argv=None):
+    """
+    Parsuje argumenty wiersza poleceń
+    
+    Args:
+        argv (list): Argumenty (domyślnie sys.argv)
+        
+    Returns:
+        argparse.Namespace: Argumenty
+    """
+    parser = argparse.ArgumentParser(
+        description="Konfigurator Kick Points Collector. Bez argumentów uruchamia tryb interaktywny; "
+                    "z --channels lub --channels-file działa bez pytań."
+    )
+    parser.add_argument('--channels', nargs='+', default=[], metavar='KANAŁ',
+                        help="Nazwy lub adresy kanałów do dodania")
+    parser.add_argument('--channels-file', action='append', default=[], metavar='PLIK',
+                        help="Plik z listą kanałów (jeden na linię lub rozdzielone przecinkami, '-' = stdin)")
+    parser.add_argument('--config', default='config.json',
+                        help="Plik konfiguracyjny (istniejący jest uzupełniany)")
+    parser.add_argument('--token', help="Token autoryzacji (wymagany przy tworzeniu nowej konfiguracji)")
+    parser.add_argument('--replace', action='store_true',
+                        help="Zastąp listę kanałów zamiast dopisywać do istniejącej")
+    parser.add_argument('--workers', type=int, default=DEFAULT_RESOLVE_WORKERS,
+                        help="Maksymalna liczba jednoczesnych zapytań do API")
+    parser.add_argument('--no-validate', action='store_true',
+                        help="Nie sprawdzaj kanałów w API (bez pobierania ID czatów)")
+    parser.add_argument('--keep-missing', action='store_true',
+                        help="Zachowaj w konfiguracji kanały, które nie istnieją")
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers musi być większe od 0")
+    return args
+
+
+def main(argv=None):
     """
     Główna funkcja konfiguratora
+    
+    Args:
+        argv (list): Argumenty wiersza poleceń (domyślnie sys.argv)
     """
+    args = parse_args(argv)
+    if args.channels or args.channels_file:
+        sys.exit(run_batch(args))
+    
+    ensure_dependencies()
+    os.system('cls' if os.name == 'nt' else 'clear')
     print_header()
     
     config = {
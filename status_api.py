@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Lokalne API statusu kanałów (HTTP/JSON, tylko do odczytu)
+
+Udostępnia innym narzędziom (panele, alerty) to, co bot już wie o kanałach:
+status live, ID czatu, czas ostatniego sprawdzenia i ostatnie błędy. Odpowiedzi
+są budowane wyłącznie ze stanu w pamięci, bez zapytań do Kick.com. Serwer
+nasłuchuje na adresie TCP albo na gnieździe uniksowym.
+
+Zapytania:
+    GET /channels              - wszystkie kanały
+    GET /channels?since=CZAS   - tylko kanały zmienione od CZAS (pole "now"
+                                 odpowiedzi jest wartością do następnego zapytania)
+    GET /channels/{nazwa}      - pojedynczy kanał
+
+Autor: deem
+"""
+
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from channel_state import ChannelState, ChannelTable
+
+
+DEFAULT_STATUS_HOST = '127.0.0.1'
+DEFAULT_STATUS_PORT = 9106
+
+
+def channel_snapshot(state: ChannelState, wall_now: float, now: float,
+                     recent_errors: List[Tuple[float, str]]) -> Dict[str, Any]:
+    """
+    Zamienia stan kanału na słownik JSON
+
+    Args:
+        state (ChannelState): Stan kanału
+        wall_now (float): Bieżący czas uniksowy
+        now (float): Bieżący czas zegara monotonicznego (do przeliczenia next_due)
+        recent_errors (List[Tuple[float, str]]): Ostatnie błędy kanału (ChannelTable.recent_errors)
+
+    Returns:
+        Dict[str, Any]: Pola kanału; czasy jako czas uniksowy
+    """
+    return {
+        "name": state.name,
+        "live": state.live,
+        "chatroom_id": state.chatroom_id,
+        "channel_id": state.channel_id,
+        "last_check": state.last_http_check or None,
+        "next_check": round(wall_now + state.next_due - now, 3) if state.next_due is not None else None,
+        "errors": state.errors,
+        "last_error": state.last_error,
+        "last_error_at": state.last_error_at,
+        "recent_errors": [{"at": at, "error": error} for at, error in recent_errors],
+        "polls": state.polls,
+        "sends": state.sends,
+        "changed": state.changed
+    }
+
+
+class StatusAPI:
+    """
+    Serwer HTTP odpowiadający stanem kanałów z ChannelTable
+    """
+
+    def __init__(self, channels: ChannelTable, clock: Callable[[], float], wall_clock: Callable[[], float]):
+        """
+        Inicjalizacja API
+
+        Args:
+            channels (ChannelTable): Tabela stanów kanałów
+            clock (Callable[[], float]): Zegar monotoniczny kolektora
+            wall_clock (Callable[[], float]): Zegar czasu rzeczywistego kolektora
+        """
+        self.channels = channels
+        self.clock = clock
+        self.wall_clock = wall_clock
+        self._server = None
+        self._socket_path: Optional[str] = None
+
+    def _snapshot(self, state: ChannelState, wall_now: float, now: float) -> Dict[str, Any]:
+        return channel_snapshot(state, wall_now, now, self.channels.recent_errors(state))
+
+    def handle(self, path: str) -> Tuple[int, Dict[str, Any]]:
+        """
+        Odpowiada na zapytanie GET
+
+        Args:
+            path (str): Ścieżka z parametrami zapytania
+
+        Returns:
+            Tuple[int, Dict[str, Any]]: (kod odpowiedzi, treść JSON)
+        """
+        url = urlsplit(path)
+        parts = [part for part in url.path.split("/") if part]
+        wall_now = self.wall_clock()
+        now = self.clock()
+
+        if parts == ["channels"]:
+            since = parse_qs(url.query).get("since")
+            if since is None:
+                states = list(self.channels)
+                response_now = wall_now
+            else:
+                try:
+                    response_now, states = self.channels.changed_since(float(since[0]))
+                except ValueError:
+                    return 400, {"error": "Parametr 'since' musi być czasem uniksowym"}
+            return 200, {
+                "now": response_now,
+                "channels": [self._snapshot(state, wall_now, now) for state in states]
+            }
+
+        if len(parts) == 2 and parts[0] == "channels":
+            state = self.channels.peek(parts[1])
+            if state is None:
+                return 404, {"error": f"Nieznany kanał: {parts[1]}"}
+            return 200, self._snapshot(state, wall_now, now)
+
+        return 404, {"error": "Dostępne ścieżki: /channels, /channels?since=CZAS, /channels/{nazwa}"}
+
+    def serve(self, host: str = DEFAULT_STATUS_HOST, port: int = DEFAULT_STATUS_PORT,
+              socket_path: Optional[str] = None) -> None:
+        """
+        Uruchamia serwer w osobnym wątku
+
+        Args:
+            host (str): Adres nasłuchiwania TCP
+            port (int): Port nasłuchiwania TCP
+            socket_path (Optional[str]): Ścieżka gniazda uniksowego (zamiast TCP)
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        api = self
+
+        class StatusHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                status, body = api.handle(self.path)
+                data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.send_header("Cache-Control", "no-store")
+                self.end_headers()
+                self.wfile.write(data)
+
+            def address_string(self):
+                return self.client_address[0] if self.client_address else "unix"
+
+            def log_message(self, format, *args):
+                pass
+
+        if socket_path:
+            from socketserver import ThreadingUnixStreamServer
+
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+            server = ThreadingUnixStreamServer(socket_path, StatusHandler)
+            self._socket_path = socket_path
+        else:
+            server = ThreadingHTTPServer((host, port), StatusHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="kick-status-api", daemon=True).start()
+        self._server = server
+
+    def stop(self) -> None:
+        """
+        Zatrzymuje serwer i usuwa plik gniazda uniksowego
+        """
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        if self._socket_path and os.path.exists(self._socket_path):
+            os.unlink(self._socket_path)
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Oszczędne przetwarzanie odpowiedzi statusu kanału
+
+Odpowiedź /api/v2/channels/{nazwa}/livestream zaczyna się od klucza "data",
+który jest null dla kanału offline. Wystarczy sprawdzić początek surowej
+odpowiedzi, bez budowania obiektów Pythona. Pełny dokument kanału jest
+pobierany rzadko (tylko przy braku wpisu w pamięci podręcznej), więc jest
+dekodowany zwykłym json.loads - parser C jest tu szybszy od parserów
+strumieniowych.
+
+Autor: deem
+"""
+
+import json
+import re
+import threading
+from typing import Dict, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+STATUS_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+}
+
+_LIVESTREAM_PREFIX = re.compile(rb'\s*\{\s*"data"\s*:\s*(null|\{)')
+
+
+def is_livestream_active(body: bytes) -> bool:
+    """
+    Sprawdza odpowiedź /livestream bez dekodowania całego JSON-a
+
+    Args:
+        body (bytes): Surowa (rozpakowana) treść odpowiedzi
+
+    Returns:
+        bool: True jeśli stream jest aktywny
+    """
+    match = _LIVESTREAM_PREFIX.match(body)
+    if match is not None:
+        return match.group(1) != b"null"
+
+    return json.loads(body).get("data") is not None
+
+
+def parse_channel(body: bytes) -> Tuple[bool, Optional[int], Optional[int]]:
+    """
+    Wyciąga z pełnego dokumentu kanału tylko potrzebne pola
+
+    Args:
+        body (bytes): Surowa (rozpakowana) treść odpowiedzi
+
+    Returns:
+        Tuple[bool, Optional[int], Optional[int]]: (czy stream aktywny, ID czatu, ID kanału)
+    """
+    channel_data = json.loads(body)
+    return (
+        channel_data.get("livestream") is not None,
+        (channel_data.get("chatroom") or {}).get("id"),
+        channel_data.get("id")
+    )
+
+
+def wire_size(response) -> int:
+    """
+    Zwraca liczbę bajtów odpowiedzi przesłanych siecią (przed rozpakowaniem)
+
+    Args:
+        response: Odpowiedź requests lub httpx
+
+    Returns:
+        int: Liczba bajtów treści na łączu
+    """
+    downloaded = getattr(response, "num_bytes_downloaded", None)
+    if downloaded is not None:
+        return downloaded
+    try:
+        return int(response.raw.tell())
+    except (AttributeError, TypeError, ValueError):
+        return len(response.content)
+
+
+class StatusStats:
+    """
+    Liczniki bajtów i czasu przetwarzania odpowiedzi statusu
+    """
+
+    def __init__(self):
+        """
+        Inicjalizacja liczników
+        """
+        self.polls = 0
+        self.wire_bytes = 0
+        self.body_bytes = 0
+        self.parse_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, wire_bytes: int, body_bytes: int, parse_seconds: float) -> None:
+        """
+        Dodaje pomiar jednego sprawdzenia statusu
+
+        Args:
+            wire_bytes (int): Bajty przesłane siecią
+            body_bytes (int): Bajty po rozpakowaniu
+            parse_seconds (float): Czas przetwarzania odpowiedzi
+        """
+        with self._lock:
+            self.polls += 1
+            self.wire_bytes += wire_bytes
+            self.body_bytes += body_bytes
+            self.parse_seconds += parse_seconds
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Zwraca średnie wartości na jedno sprawdzenie
+
+        Returns:
+            Dict[str, float]: Liczba sprawdzeń, średnie bajty na łączu i po
+            rozpakowaniu oraz średni czas przetwarzania w mikrosekundach
+        """
+        with self._lock:
+            polls = self.polls or 1
+            return {
+                "polls": self.polls,
+                "wire_bytes_per_poll": self.wire_bytes / polls,
+                "body_bytes_per_poll": self.body_bytes / polls,
+                "parse_us_per_poll": self.parse_seconds / polls * 1e6
+            }
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+"""
+Testy czasu oczekiwania kanałów offline po przeładowaniu konfiguracji
+
+Autor: deem
+"""
+
+import json
+
+
+def test_offline_wait_falls_back_when_adaptive_section_is_removed(make_collector, tmp_path):
+    adaptive = {"enabled": True, "min_wait": 10, "max_wait": 600, "path": str(tmp_path / "live_schedule.json")}
+    collector = make_collector(adaptive_polling=adaptive)
+    collector.channels.get("kanal").live = False
+    assert collector.live_schedule is not None
+
+    config = dict(collector.config)
+    del config["adaptive_polling"]
+    with open(collector.config_path, 'w', encoding='utf-8') as f:
+        json.dump(config, f)
+    collector.reload_config()
+
+    assert "adaptive_polling" not in collector.config
+    assert collector.offline_wait("kanal") == 5
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Testy obserwacji pliku konfiguracyjnego
+
+Autor: deem
+"""
+
+import os
+import threading
+
+from config_watch import ConfigWatcher
+
+
+def _touch(path, mtime):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f'{{"wersja": {mtime}}}')
+    os.utime(path, (mtime, mtime))
+
+
+def test_failing_callback_does_not_stop_watching(tmp_path):
+    path = str(tmp_path / "config.json")
+    _touch(path, 1000)
+    errors = []
+    failed = threading.Event()
+    reloaded = threading.Event()
+    calls = []
+
+    def on_error(message):
+        errors.append(message)
+        failed.set()
+
+    def on_change():
+        calls.append(None)
+        if len(calls) == 1:
+            raise KeyError("channels")
+        reloaded.set()
+
+    watcher = ConfigWatcher(path, on_change, poll_interval=0.02, on_error=on_error)
+    watcher.start()
+    try:
+        _touch(path, 2000)
+        assert failed.wait(5)
+        _touch(path, 3000)
+
+        assert reloaded.wait(5)
+    finally:
+        watcher.stop()
+
+    assert errors == ["BŁĄD przeładowania konfiguracji: KeyError: 'channels'"]
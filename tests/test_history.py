@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""
+Testy zapisu historii przy błędach bazy
+
+Autor: deem
+"""
+
+import sqlite3
+import time
+
+from history import SCHEMA, HistoryStore
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_failed_batch_is_reported_and_written_later(tmp_path):
+    path = str(tmp_path / "history.db")
+    errors = []
+    store = HistoryStore(path, flush_interval=0.02, on_error=errors.append)
+    with sqlite3.connect(path) as conn:
+        conn.execute("DROP TABLE errors")
+
+    store.record_error("kanal", "awaria")
+    assert _wait_for(lambda: errors)
+    assert "errors" in errors[0]
+
+    with sqlite3.connect(path) as conn:
+        conn.executescript(SCHEMA)
+    store.close()
+
+    assert store.written == 1
+    assert store.dropped == 0
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("SELECT channel, error FROM errors").fetchall() == [("kanal", "awaria")]
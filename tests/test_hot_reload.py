@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+Testy usuwania kanału przeładowaniem konfiguracji w trakcie sprawdzenia
+
+Autor: deem
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+CHANNEL_BODY = json.dumps({"id": 7, "chatroom": {"id": 42}, "livestream": None}).encode()
+
+
+class SlowKickStandIn:
+    """
+    Serwer HTTP, który wstrzymuje odpowiedź o kanał aż do release
+    """
+
+    def __init__(self):
+        self.requested = threading.Event()
+        self.release = threading.Event()
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stand_in.requested.set()
+                stand_in.release.wait(10)
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(CHANNEL_BODY)))
+                self.end_headers()
+                self.wfile.write(CHANNEL_BODY)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def close(self):
+        self.release.set()
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def stand_in():
+    server = SlowKickStandIn()
+    yield server
+    server.close()
+
+
+def test_channel_removed_during_poll_is_not_brought_back(make_collector, stand_in):
+    collector = make_collector(channels=["kanal", "inny"], api_base=stand_in.url,
+                               chatroom_cache={"enabled": False}, live_events={"enabled": False})
+    collector.channels.get("kanal")
+    collector.watchdog.beat("kanal", 5)
+
+    poll = threading.Thread(target=collector.poll_channel, args=("kanal",))
+    poll.start()
+    assert stand_in.requested.wait(5)
+
+    config = dict(collector.config, channels=["inny"])
+    with open(collector.config_path, 'w', encoding='utf-8') as f:
+        json.dump(config, f)
+    collector.reload_config()
+    stand_in.release.set()
+    poll.join(5)
+
+    assert collector.channels.peek("kanal") is None
+    assert "kanal" not in collector.watchdog._seen
+    assert collector.channels.changed_since(0)[1] == []
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+Testy obserwatora zdarzeń websocket na lokalnej atrapie serwera Pusher
+
+Autor: deem
+"""
+
+import base64
+import hashlib
+import json
+import socket
+import struct
+import threading
+
+import pytest
+
+from live_events import LIVE_EVENT, LiveEventWatcher
+
+pytest.importorskip("websocket")
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+class PusherStandIn:
+    """
+    Minimalny serwer websocket: wysyła connection_established, zapisuje
+    subskrypcje i na subskrypcję kanału odpowiada zdarzeniem startu streamu
+    """
+
+    def __init__(self):
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.bind(("127.0.0.1", 0))
+        self._server.listen(1)
+        self.subscriptions = []
+        self.subscribed = threading.Event()
+        self.closed = threading.Event()
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    @property
+    def url(self):
+        return f"ws://127.0.0.1:{self._server.getsockname()[1]}/app/test"
+
+    def _serve(self):
+        connection, _ = self._server.accept()
+        with connection, connection.makefile("rb") as reader:
+            key = None
+            for line in iter(reader.readline, b"\r\n"):
+                name, _, value = line.decode().partition(":")
+                if name.lower() == "sec-websocket-key":
+                    key = value.strip()
+            accept = base64.b64encode(hashlib.sha1((key + WS_GUID).encode()).digest()).decode()
+            connection.sendall(("HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n"
+                                f"Connection: Upgrade\r\nSec-WebSocket-Accept: {accept}\r\n\r\n").encode())
+            self._send(connection, {"event": "pusher:connection_established", "data": "{}"})
+
+            while True:
+                opcode, payload = self._read_frame(reader)
+                if opcode is None or opcode == 0x8:
+                    if opcode == 0x8:
+                        connection.sendall(bytes([0x88, len(payload)]) + payload)
+                    self.closed.set()
+                    return
+                message = json.loads(payload)
+                if message.get("event") == "pusher:subscribe":
+                    channel = message["data"]["channel"]
+                    self.subscriptions.append(channel)
+                    self.subscribed.set()
+                    self._send(connection, {"event": LIVE_EVENT, "channel": channel, "data": "{}"})
+
+    @staticmethod
+    def _send(connection, message):
+        data = json.dumps(message).encode()
+        connection.sendall(bytes([0x81, len(data)]) + data if len(data) < 126
+                           else bytes([0x81, 126]) + struct.pack("!H", len(data)) + data)
+
+    @staticmethod
+    def _read_frame(reader):
+        header = reader.read(2)
+        if len(header) < 2:
+            return None, b""
+        opcode, length = header[0] & 0x0F, header[1] & 0x7F
+        if length == 126:
+            length = struct.unpack("!H", reader.read(2))[0]
+        elif length == 127:
+            length = struct.unpack("!Q", reader.read(8))[0]
+        mask = reader.read(4) if header[1] & 0x80 else b"\0\0\0\0"
+        payload = bytes(byte ^ mask[index % 4] for index, byte in enumerate(reader.read(length)))
+        return opcode, payload
+
+
+def test_live_event_wakes_subscribed_channel(make_collector):
+    server = PusherStandIn()
+    collector = make_collector()
+    collector.channels.get("kanal")
+    wakeup = threading.Event()
+    collector._wakeups["kanal"] = wakeup
+
+    collector.live_watcher = LiveEventWatcher(collector.on_live_event, server.url)
+    collector.live_watcher.start()
+    collector.live_watcher.subscribe("kanal", 42)
+
+    assert server.subscribed.wait(5)
+    assert server.subscriptions == ["channel.42"]
+    assert wakeup.wait(5)
+    assert collector.channels.get("kanal").live is True
+    assert collector.live_watcher.is_subscribed("kanal")
+
+    collector.live_watcher.stop()
+    assert server.closed.wait(5)
+    assert not collector.live_watcher._thread.is_alive()
+    assert not collector.live_watcher.connected
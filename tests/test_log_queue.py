@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+Testy limitu powtarzających się błędów w QueueLogger
+
+Autor: deem
+"""
+
+import threading
+
+import pytest
+
+from log_queue import QueueLogger
+
+
+@pytest.fixture
+def logger(tmp_path):
+    log = QueueLogger(path=str(tmp_path / "bot.log"), max_error_keys=4, flush_interval=60)
+    yield log
+    log.close()
+
+
+def errors(log):
+    return [record for record in log._queue if record[1] == "ERROR"]
+
+
+def test_object_addresses_do_not_defeat_dedupe(logger):
+    logger.error("BŁĄD: <Session object at 0x7f3a1c2b0d90> zamknięty", "kanal")
+    logger.error("BŁĄD: <Session object at 0x7f3a1c2b1e40> zamknięty", "kanal")
+
+    assert len(errors(logger)) == 1
+
+
+def test_errors_are_keyed_on_exception_type(logger):
+    logger.error("BŁĄD: limit czasu", "kanal", error_type="Timeout")
+    logger.error("BŁĄD: inny opis limitu czasu", "kanal", error_type="Timeout")
+    logger.error("BŁĄD: limit czasu", "inny", error_type="Timeout")
+
+    assert [record[2] for record in errors(logger)] == ["kanal", "inny"]
+
+
+def test_error_keys_are_capped(logger):
+    for index in range(20):
+        logger.error("BŁĄD", f"kanal{index}")
+
+    assert len(logger._last_errors) == 4
+    assert ("kanal19", "BŁĄD") in logger._last_errors
+
+
+def test_concurrent_errors_count_every_repeat(logger):
+    def report():
+        for _ in range(500):
+            logger.error("BŁĄD", "kanal")
+
+    threads = [threading.Thread(target=report) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(errors(logger)) == 1
+    assert logger._last_errors[("kanal", "BŁĄD")][1] == 8 * 500 - 1
+
+
+def test_wait_is_a_field_not_part_of_the_error_key(logger):
+    logger.error("BŁĄD w monitorowaniu kanału kanal: timeout", "kanal", wait=7)
+    logger.error("BŁĄD w monitorowaniu kanału kanal: timeout", "kanal", wait=13)
+
+    [record] = errors(logger)
+    assert record[3] == "BŁĄD w monitorowaniu kanału kanal: timeout"
+    assert logger._format(record).endswith("kanal: timeout | Czekam 7s")
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Testy wyłącznika i silnika ponowień
+
+Autor: deem
+"""
+
+import pytest
+
+from retry_policy import CircuitBreaker, CircuitOpenError, RetryEngine, RetryPolicy
+
+
+class Interrupted(Exception):
+    pass
+
+
+class Response:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.headers = {}
+
+
+def failing():
+    raise ConnectionError("brak połączenia")
+
+
+@pytest.fixture
+def engine():
+    now = [0.0]
+    engine = RetryEngine(
+        {"status": RetryPolicy(max_attempts=1)}, sleep=lambda delay: False,
+        breaker={"min_calls": 2, "window": 2, "reset_timeout": 10, "clock": lambda: now[0]},
+        passthrough=(Interrupted,)
+    )
+    engine.now = now
+    return engine
+
+
+def open_breaker(engine):
+    for _ in range(2):
+        with pytest.raises(Exception):
+            engine.call("status", failing)
+    assert engine.breakers["status"].state == CircuitBreaker.OPEN
+    engine.now[0] += 10
+
+
+def test_interrupted_probe_is_released(engine):
+    open_breaker(engine)
+
+    def interrupted():
+        raise Interrupted()
+
+    with pytest.raises(Interrupted):
+        engine.call("status", interrupted)
+
+    assert engine.call("status", lambda: Response(200)).status_code == 200
+    assert engine.breakers["status"].is_closed
+
+
+def test_second_probe_is_rejected_while_first_is_running(engine):
+    open_breaker(engine)
+
+    def probe():
+        with pytest.raises(CircuitOpenError):
+            engine.call("status", lambda: Response(200))
+        return Response(200)
+
+    engine.call("status", probe)
+    assert engine.breakers["status"].is_closed
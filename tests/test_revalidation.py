@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+Testy zapytań warunkowych na lokalnej atrapie API obsługującej ETag / 304
+
+Autor: deem
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+CHANNEL_PATH = "/api/v2/channels/kanal"
+CHANNEL_BODY = json.dumps({"id": 7, "chatroom": {"id": 42}, "livestream": {"id": 1}}).encode()
+ETAG = '"v1"'
+FORBIDDEN_PATH = "/api/v2/channels/zablokowany"
+
+
+class KickStandIn:
+    """
+    Serwer HTTP z dokumentem jednego kanału; odpowiada 304 na pasujący
+    If-None-Match, a na żądanie jednorazowo także bez niego
+    """
+
+    def __init__(self):
+        self.requests = []
+        self.force_304 = False
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stand_in.requests.append((self.path, self.headers.get("If-None-Match")))
+                if self.path == FORBIDDEN_PATH:
+                    self._reply(403, b'{"message": "Forbidden"}')
+                elif self.path != CHANNEL_PATH:
+                    self._reply(404, b'{"message": "Not found"}')
+                elif stand_in.force_304 or self.headers.get("If-None-Match") == ETAG:
+                    stand_in.force_304 = False
+                    self._reply(304, b"")
+                else:
+                    self._reply(200, CHANNEL_BODY)
+
+            def _reply(self, status, body):
+                self.send_response(status)
+                self.send_header("ETag", ETAG)
+                if status != 304:
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def stand_in():
+    server = KickStandIn()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def collector(make_collector, stand_in):
+    return make_collector(api_base=stand_in.url, chatroom_cache={"enabled": False}, live_events={"enabled": False})
+
+
+def test_second_poll_is_revalidated(collector, stand_in):
+    assert collector.fetch_channel_info("kanal") == (True, 42, 7)
+    assert collector.fetch_channel_info("kanal") == (True, 42, 7)
+
+    assert stand_in.requests == [(CHANNEL_PATH, None), (CHANNEL_PATH, ETAG)]
+    assert collector.revalidation.stats()["hits"] == 1
+
+
+def test_304_without_stored_entry_is_refetched(collector, stand_in):
+    stand_in.force_304 = True
+
+    assert collector.fetch_channel_info("kanal") == (True, 42, 7)
+    assert stand_in.requests == [(CHANNEL_PATH, None), (CHANNEL_PATH, None)]
+
+
+def test_missing_channel_is_reported_not_found(collector, stand_in):
+    collector.config["channels"].append("brak")
+    collector.channels.get("brak")
+
+    assert collector.fetch_channel_info("brak") == (False, None, None)
+
+
+def test_stop_channel_forgets_validators(collector, stand_in):
+    collector.fetch_channel_info("kanal")
+    collector.stop_channel("kanal")
+
+    assert collector.revalidation.headers_for(f"{stand_in.url}{CHANNEL_PATH}") == {}
+
+
+def test_error_status_is_an_error_not_offline(collector, stand_in):
+    collector.config["channels"].append("zablokowany")
+
+    collector.poll_channel("zablokowany")
+
+    state = collector.channels.get("zablokowany")
+    assert state.live is None
+    assert state.errors == 1
+    assert "403" in state.last_error
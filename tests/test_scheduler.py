@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Testy harmonogramu z zawieszonymi sprawdzeniami
+
+Autor: deem
+"""
+
+import threading
+
+import pytest
+
+from poll_watchdog import Watchdog, WorkerPoolExhausted
+from scheduler import PollScheduler
+
+
+class HangingPolls:
+    """
+    Sprawdzenia, w których kanał "zawieszony" blokuje wątek aż do release
+    """
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.hanging = threading.Event()
+        self.polled = threading.Event()
+
+    def poll(self, channel_name):
+        if channel_name == "zawieszony":
+            self.hanging.set()
+            self.release.wait(10)
+        else:
+            self.polled.set()
+        return 60.0
+
+
+@pytest.fixture
+def polls():
+    polls = HangingPolls()
+    yield polls
+    polls.release.set()
+
+
+def test_restart_replaces_the_hung_worker(polls):
+    scheduler = PollScheduler(polls.poll, max_workers=1)
+    scheduler.add("zawieszony")
+    scheduler.start()
+    assert polls.hanging.wait(5)
+
+    scheduler.add("kanal")
+    assert not polls.polled.wait(0.3)
+
+    assert scheduler.restart("zawieszony") == 1
+    assert polls.polled.wait(5)
+    assert scheduler.pool.hung == 1
+
+    polls.release.set()
+    assert scheduler.stop(5)
+    assert scheduler.pool.hung == 0
+
+
+def test_restart_is_refused_when_hung_workers_are_exhausted(polls):
+    scheduler = PollScheduler(polls.poll, max_workers=1, max_hung=0)
+    scheduler.add("zawieszony")
+    scheduler.start()
+    assert polls.hanging.wait(5)
+    scheduler.add("kanal")
+
+    with pytest.raises(WorkerPoolExhausted):
+        scheduler.restart("zawieszony")
+    assert not polls.polled.wait(0.3)
+
+    polls.release.set()
+    assert polls.polled.wait(5)
+    assert scheduler.stop(5)
+
+
+def test_watchdog_counts_only_successful_restarts():
+    now = [0.0]
+    outcomes = {"ok": True, "zajety": False}
+    watchdog = Watchdog(lambda channel_name, silent: outcomes[channel_name], factor=1, grace=0,
+                        clock=lambda: now[0])
+    watchdog.beat("ok", 10)
+    watchdog.beat("zajety", 10)
+    now[0] = 30
+
+    assert watchdog.check() == 2
+    assert (watchdog.restarts, watchdog.failed_restarts) == (1, 1)
+
+
+def test_watchdog_does_not_count_forgotten_channels():
+    now = [0.0]
+    watchdog = Watchdog(lambda channel_name, silent: watchdog.remove(channel_name) or False, factor=1, grace=0,
+                        clock=lambda: now[0])
+    watchdog.beat("usuniety", 10)
+    now[0] = 30
+
+    assert watchdog.check() == 1
+    assert (watchdog.restarts, watchdog.failed_restarts) == (0, 0)
+    assert watchdog.overdue() == []
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+Testy zgłaszania nieudanych wysłań wiadomości
+
+Autor: deem
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class RejectingStandIn:
+    """
+    Serwer HTTP odrzucający każdą wiadomość kodem 403
+    """
+
+    def __init__(self):
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                body = b'{"message": "Forbidden"}'
+                self.send_response(403)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def stand_in():
+    server = RejectingStandIn()
+    yield server
+    server.close()
+
+
+def test_send_failures_are_rate_limited_per_channel(make_collector, stand_in):
+    collector = make_collector(channels=["kanal", "inny"], api_base=stand_in.url)
+
+    assert collector.send_message("42", "kanal") == (False, None)
+    assert collector.send_message("43", "inny") == (False, None)
+    assert collector.send_message("42", "kanal") == (False, None)
+
+    repeats = {channel: last[1] for (channel, _), last in collector.log._last_errors.items()}
+    assert repeats == {"kanal": 1, "inny": 0}
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""
+Testy przerwania sprawdzeń przy zatrzymaniu bota
+
+Autor: deem
+"""
+
+import sqlite3
+
+
+def test_polls_cancelled_by_stop_are_not_errors(make_collector, tmp_path):
+    history_path = str(tmp_path / "history.db")
+    collector = make_collector(api_base="http://127.0.0.1:9", chatroom_cache={"enabled": False},
+                               live_events={"enabled": False}, history={"enabled": True, "path": history_path})
+    collector.request_stop()
+
+    collector.poll_channel("kanal")
+    collector.history.close()
+
+    state = collector.channels.get("kanal")
+    assert state.errors == 0
+    assert state.last_error is None
+    assert not [record for record in collector.log._queue if record[1] == "ERROR"]
+    with sqlite3.connect(history_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM errors").fetchone()[0] == 0
+
+
+def test_shutdown_closes_metrics_server(make_collector):
+    collector = make_collector(api_base="http://127.0.0.1:9", chatroom_cache={"enabled": False},
+                               live_events={"enabled": False}, metrics={"enabled": True, "port": 0})
+    collector._start_metrics_server()
+    server = collector.metrics_server
+
+    collector.shutdown()
+
+    assert collector.metrics_server is None
+    assert server.socket.fileno() == -1
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+Testy lokalnego API statusu
+
+Autor: deem
+"""
+
+from channel_state import ChannelTable
+from status_api import StatusAPI
+
+
+def test_recent_errors_are_served_and_bounded():
+    now = [1000.0]
+    channels = ChannelTable(lambda: now[0], error_history=3)
+    api = StatusAPI(channels, clock=lambda: 0.0, wall_clock=lambda: now[0])
+    state = channels.get("kanal")
+
+    for index in range(5):
+        now[0] += 1
+        channels.record_error(state, f"błąd {index}")
+
+    status, body = api.handle("/channels/kanal")
+    assert status == 200
+    assert body["recent_errors"] == [
+        {"at": 1003.0, "error": "błąd 2"},
+        {"at": 1004.0, "error": "błąd 3"},
+        {"at": 1005.0, "error": "błąd 4"}
+    ]
+    assert (body["last_error"], body["last_error_at"]) == ("błąd 4", 1005.0)
+
+    _, changed = api.handle("/channels?since=1005")
+    assert [channel["name"] for channel in changed["channels"]] == ["kanal"]
+
+
+def test_channel_without_errors_has_empty_history():
+    channels = ChannelTable(lambda: 1000.0)
+    api = StatusAPI(channels, clock=lambda: 0.0, wall_clock=lambda: 1000.0)
+    channels.get("kanal")
+
+    _, body = api.handle("/channels/kanal")
+    assert body["recent_errors"] == []
+    assert channels.peek("kanal").recent_errors is None
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Śledzenie czasu (spany) w pętli monitorowania i eksport do Chrome trace
+
+Domyślnie śledzenie jest wyłączone i span() zwraca wspólny, pusty kontekst,
+więc koszt w gorącej ścieżce to jedno wywołanie metody. Po włączeniu każdy
+zakończony span trafia do eksporterów - wbudowany ChromeTraceExporter
+zapisuje je w formacie Trace Event (chrome://tracing, Perfetto).
+
+Autor: deem
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+
+DEFAULT_TRACE_PATH = 'trace.json'
+DEFAULT_MAX_EVENTS = 1_000_000
+
+
+class _NoopSpan:
+    """
+    Pusty kontekst używany przy wyłączonym śledzeniu
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _Span:
+    """
+    Aktywny span mierzący czas bloku with
+    """
+
+    __slots__ = ('tracer', 'name', 'args', 'start_ns')
+
+    def __init__(self, tracer: 'Tracer', name: str, args: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+        self.start_ns = 0
+
+    def __enter__(self):
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        end_ns = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.tracer.finish(self.name, self.start_ns, end_ns, self.args)
+        return False
+
+
+class Tracer:
+    """
+    Punkt wejścia API śledzenia - tworzy spany i przekazuje je do eksporterów
+    """
+
+    def __init__(self):
+        """
+        Inicjalizacja wyłączonego śledzenia (bez eksporterów)
+        """
+        self.exporters: List[Any] = []
+        self.enabled = False
+
+    def add_exporter(self, exporter: Any) -> None:
+        """
+        Dodaje eksporter i włącza śledzenie
+
+        Args:
+            exporter (Any): Obiekt z metodami export(event: Dict) i flush()
+        """
+        self.exporters.append(exporter)
+        self.enabled = True
+
+    def span(self, name: str, **args):
+        """
+        Tworzy span dla bloku with
+
+        Args:
+            name (str): Nazwa spanu
+            **args: Dodatkowe atrybuty zapisywane w spanie
+
+        Returns:
+            Kontekst mierzący czas bloku (pusty przy wyłączonym śledzeniu)
+        """
+        if not self.enabled:
+            return _NOOP_SPAN
+        return _Span(self, name, args)
+
+    def finish(self, name: str, start_ns: int, end_ns: int, args: Dict[str, Any]) -> None:
+        """
+        Przekazuje zakończony span do eksporterów
+
+        Args:
+            name (str): Nazwa spanu
+            start_ns (int): Początek (perf_counter_ns)
+            end_ns (int): Koniec (perf_counter_ns)
+            args (Dict[str, Any]): Atrybuty spanu
+        """
+        thread = threading.current_thread()
+        event = {
+            "name": name,
+            "start_ns": start_ns,
+            "end_ns": end_ns,
+            "thread_id": thread.native_id,
+            "thread_name": thread.name,
+            "args": args
+        }
+        for exporter in self.exporters:
+            exporter.export(event)
+
+    def flush(self) -> None:
+        """
+        Zapisuje dane wszystkich eksporterów
+        """
+        for exporter in self.exporters:
+            exporter.flush()
+
+
+class ChromeTraceExporter:
+    """
+    Zbiera spany w pamięci i zapisuje je jako plik JSON w formacie Trace Event
+    """
+
+    def __init__(self, path: str = DEFAULT_TRACE_PATH, max_events: int = DEFAULT_MAX_EVENTS):
+        """
+        Inicjalizacja eksportera
+
+        Args:
+            path (str): Ścieżka pliku wynikowego
+            max_events (int): Maksymalna liczba zapamiętanych spanów (kolejne są pomijane)
+        """
+        self.path = path
+        self.max_events = max_events
+        self.dropped = 0
+        self._events: List[Dict[str, Any]] = []
+        self._thread_names: Dict[int, str] = {}
+        self._origin_ns = time.perf_counter_ns()
+        self._lock = threading.Lock()
+
+    def export(self, event: Dict[str, Any]) -> None:
+        """
+        Dodaje span jako zdarzenie typu "X" (complete event)
+
+        Args:
+            event (Dict[str, Any]): Zakończony span z Tracer.finish
+        """
+        trace_event = {
+            "name": event["name"],
+            "cat": "kick",
+            "ph": "X",
+            "ts": (event["start_ns"] - self._origin_ns) / 1000,
+            "dur": (event["end_ns"] - event["start_ns"]) / 1000,
+            "pid": os.getpid(),
+            "tid": event["thread_id"],
+            "args": event["args"]
+        }
+        with self._lock:
+            if len(self._events) >= self.max_events:
+                self.dropped += 1
+                return
+            self._events.append(trace_event)
+            self._thread_names.setdefault(event["thread_id"], event["thread_name"])
+
+    def flush(self) -> None:
+        """
+        Zapisuje wszystkie zebrane spany do pliku
+        """
+        with self._lock:
+            events = list(self._events)
+            thread_names = dict(self._thread_names)
+
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": thread_id, "args": {"name": name}}
+            for thread_id, name in thread_names.items()
+        ]
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms"}, f)
+        os.replace(tmp_path, self.path)
+
+
+def instrument_connections(tracer: Tracer) -> None:
+    """
+    Dodaje spany nawiązywania połączeń urllib3 (DNS + TCP oraz TLS)
+
+    Wywoływane tylko przy włączonym śledzeniu, aby rozróżnić czas
+    zestawiania połączeń od czasu samego zapytania.
+
+    Args:
+        tracer (Tracer): Obiekt śledzenia
+    """
+    from urllib3.connection import HTTPConnection, HTTPSConnection
+
+    new_conn = HTTPConnection._new_conn
+    https_connect = HTTPSConnection.connect
+
+    def traced_new_conn(self, *args, **kwargs):
+        with tracer.span("dns_tcp_connect", host=self.host):
+            return new_conn(self, *args, **kwargs)
+
+    def traced_https_connect(self, *args, **kwargs):
+        with tracer.span("tls_connect", host=self.host):
+            return https_connect(self, *args, **kwargs)
+
+    HTTPConnection._new_conn = traced_new_conn
+    HTTPSConnection.connect = traced_https_connect
+
+
+def create_tracer(config: Optional[Dict[str, Any]]) -> Tracer:
+    """
+    Tworzy obiekt śledzenia na podstawie sekcji "tracing" konfiguracji
+
+    Args:
+        config (Optional[Dict[str, Any]]): Sekcja "tracing" lub None
+
+    Returns:
+        Tracer: Obiekt śledzenia (wyłączony, jeśli nie ustawiono "enabled")
+    """
+    tracer = Tracer()
+    if config and config.get("enabled"):
+        tracer.add_exporter(ChromeTraceExporter(
+            config.get("path", DEFAULT_TRACE_PATH),
+            config.get("max_events", DEFAULT_MAX_EVENTS)
+        ))
+        instrument_connections(tracer)
+    return tracer
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Wymienna warstwa transportu HTTP
+
+Bot wysyła zapytania wyłącznie przez obiekt z metodami get, post, stats
+i close - domyślnie jest to pula sesji cloudscraper (HTTP/1.1, jedno
+połączenie na każde równoległe zapytanie). Alternatywny transport httpx
+działa na własnej pętli asyncio w osobnym wątku i przy HTTP/2 przesyła
+wiele jednoczesnych sprawdzeń statusu jako strumienie jednego połączenia.
+Wątki robocze bota czekają na wynik tak samo jak przy cloudscraper, więc
+transport można zmienić bez zmian w silnikach.
+
+Autor: deem
+"""
+
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+
+TRANSPORTS = ('cloudscraper', 'httpx')
+DEFAULT_TRANSPORT = 'cloudscraper'
+DEFAULT_HTTPX_CONNECTIONS = 4
+
+
+class Transport(ABC):
+    """
+    Interfejs transportu HTTP używanego przez bota
+
+    Odpowiedź musi mieć atrybuty status_code, headers (bez rozróżniania
+    wielkości liter) i content (treść po rozpakowaniu).
+    """
+
+    @abstractmethod
+    def get(self, url: str, **kwargs) -> Any:
+        """
+        Wykonuje zapytanie GET
+
+        Args:
+            url (str): Adres URL
+            **kwargs: headers, timeout (krotka: limit połączenia, limit odczytu)
+
+        Returns:
+            Any: Odpowiedź HTTP
+        """
+
+    @abstractmethod
+    def post(self, url: str, **kwargs) -> Any:
+        """
+        Wykonuje zapytanie POST
+
+        Args:
+            url (str): Adres URL
+            **kwargs: data (treść w bajtach), headers, timeout
+
+        Returns:
+            Any: Odpowiedź HTTP
+        """
+
+    @abstractmethod
+    def stats(self) -> Dict[str, float]:
+        """
+        Zwraca metryki transportu
+
+        Returns:
+            Dict[str, float]: Klucze sessions, requests, connections_opened, waits, reuse_ratio
+        """
+
+    def close(self) -> None:
+        """
+        Zamyka połączenia transportu
+        """
+
+
+class HttpxTransport(Transport):
+    """
+    Transport httpx z obsługą HTTP/2 i jednym klientem asynchronicznym
+    współdzielonym przez wszystkie wątki bota
+    """
+
+    def __init__(self, http2: bool = True, http1: bool = True,
+                 max_connections: int = DEFAULT_HTTPX_CONNECTIONS, headers: Optional[Dict[str, str]] = None):
+        """
+        Inicjalizacja transportu i uruchomienie pętli zdarzeń w tle
+
+        Args:
+            http2 (bool): Czy używać HTTP/2 (wymaga pakietu h2)
+            http1 (bool): Czy dopuszczać HTTP/1.1; False przy adresie http://
+                oznacza HTTP/2 bez negocjacji (np. lokalny serwer testowy)
+            max_connections (int): Maksymalna liczba połączeń klienta
+            headers (Optional[Dict[str, str]]): Nagłówki dodawane do każdego zapytania
+
+        Raises:
+            ImportError: Gdy brakuje pakietu httpx (lub h2 przy http2)
+        """
+        # asyncio jest importowane dopiero przy wyborze tego transportu
+        import asyncio
+        import httpx
+        if http2:
+            import h2  # noqa: F401 - httpx zgłasza brak dopiero przy pierwszym zapytaniu
+
+        self._asyncio = asyncio
+        self._httpx = httpx
+        self.requests = 0
+        self.connections_opened = 0
+        self._lock = threading.Lock()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="httpx-transport", daemon=True)
+        self._thread.start()
+
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        self._client = self._run(self._create_client(http1, http2, limits, headers or {}))
+
+    async def _create_client(self, http1: bool, http2: bool, limits: Any, headers: Dict[str, str]) -> Any:
+        return self._httpx.AsyncClient(http1=http1, http2=http2, limits=limits, headers=headers)
+
+    def _run(self, coroutine) -> Any:
+        return self._asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    async def _trace(self, event: str, info: Dict[str, Any]) -> None:
+        if event == "connection.connect_tcp.complete":
+            with self._lock:
+                self.connections_opened += 1
+
+    def _timeout(self, timeout: Any) -> Any:
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return self._httpx.Timeout(read, connect=connect, pool=connect)
+        return self._httpx.Timeout(timeout)
+
+    async def _request(self, method: str, url: str, headers: Optional[Dict[str, str]],
+                       data: Optional[bytes], timeout: Any) -> Any:
+        return await self._client.request(
+            method, url, headers=headers, content=data, timeout=self._timeout(timeout),
+            extensions={"trace": self._trace}
+        )
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                data: Optional[bytes] = None, timeout: Any = None) -> Any:
+        """
+        Wykonuje zapytanie na pętli transportu i czeka na odpowiedź
+
+        Args:
+            method (str): Metoda HTTP
+            url (str): Adres URL
+            headers (Optional[Dict[str, str]]): Nagłówki zapytania
+            data (Optional[bytes]): Treść zapytania
+            timeout (Any): Krotka (limit połączenia, limit odczytu) lub liczba sekund
+
+        Returns:
+            Any: Odpowiedź httpx (z wczytaną treścią)
+        """
+        with self._lock:
+            self.requests += 1
+        return self._run(self._request(method, url, headers, data, timeout))
+
+    def get(self, url: str, **kwargs) -> Any:
+        """
+        Wykonuje zapytanie GET (patrz request)
+        """
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> Any:
+        """
+        Wykonuje zapytanie POST (patrz request)
+        """
+        return self.request("POST", url, **kwargs)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Zwraca metryki w formacie SessionPool.stats
+
+        Returns:
+            Dict[str, float]: Liczba klientów, zapytań, otwartych połączeń,
+            oczekiwań oraz odsetek zapytań obsłużonych istniejącym połączeniem
+        """
+        with self._lock:
+            requests_count = self.requests
+            connections = self.connections_opened
+        return {
+            "sessions": 1,
+            "requests": requests_count,
+            "connections_opened": connections,
+            "waits": 0,
+            "reuse_ratio": 1 - connections / requests_count if requests_count else 0.0
+        }
+
+    def close(self) -> None:
+        """
+        Zamyka klienta i zatrzymuje pętlę zdarzeń
+        """
+        if not self._loop.is_running():
+            return
+        self._run(self._client.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()